@@ -0,0 +1,56 @@
+"""Versioned report cache.
+
+Reports live in the default cache, which every process shares (see
+``real_estate_management/caches.py``), so a change handled by one worker
+invalidates the reports the others serve.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+ALL_OWNERS = 'all'
+# Bumped when data shared by every owner's reports (the CPI table) changes.
+REFERENCE = 'reference'
+TIMEOUT = 24 * 60 * 60
+
+
+def version_key(scope):
+    return f'analytics:version:{scope}'
+
+
+def new_version():
+    # Never reused: a version key the cache evicted must not come back as a
+    # value that some still-cached report was stored under.
+    return time.time_ns()
+
+
+def scope_version(scope):
+    return cache.get_or_set(version_key(scope), new_version, timeout=None)
+
+
+def bump(*scopes):
+    """Invalidate every cached report for the given owner scopes.
+
+    The versions move again once the transaction commits, so a report another
+    process computes from the old rows in between is not cached under the
+    final version.
+    """
+    keys = [version_key(scope) for scope in {ALL_OWNERS, *scopes}]
+
+    def write():
+        cache.set_many(dict.fromkeys(keys, new_version()), timeout=None)
+
+    write()
+    transaction.on_commit(write)
+
+
+def cached_report(name, scope, params, compute):
+    suffix = ':'.join(f'{key}={value}' for key, value in sorted(params.items()))
+    versions = f'{scope_version(scope)}.{scope_version(REFERENCE)}'
+    key = f'analytics:{name}:{scope}:{versions}:{suffix}'
+    data = cache.get(key)
+    if data is None:
+        data = compute()
+        cache.set(key, data, timeout=TIMEOUT)
+    return data
@@ -0,0 +1,45 @@
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncMonth
+
+from contracts.models import LeasContract
+from properties.models import Property
+
+
+def current_contracts(today):
+    return LeasContract.objects.filter(is_active=True, start_date__lte=today, end_date__gte=today)
+
+
+def occupancy(today, owner_id=None):
+    properties = Property.objects.all()
+    if owner_id is not None:
+        properties = properties.filter(owner_id=owner_id)
+    occupied = Q(
+        leascontract__is_active=True, leascontract__start_date__lte=today, leascontract__end_date__gte=today)
+    rows = (
+        properties.values('propert_type')
+        .annotate(total=Count('id', distinct=True), occupied=Count('id', filter=occupied, distinct=True))
+        .order_by('propert_type')
+    )
+    return [{**row, 'occupancy_rate': row['occupied'] / row['total']} for row in rows]
+
+
+def rent_roll(today, owner_id=None):
+    contracts = current_contracts(today)
+    if owner_id is not None:
+        contracts = contracts.filter(property__owner_id=owner_id)
+    return list(
+        contracts.values(owner=F('property__owner'), username=F('property__owner__username'))
+        .annotate(contracts=Count('id'), monthly_rent=Sum('monthly_rent'))
+        .order_by('owner')
+    )
+
+
+def expiring(today, until, owner_id=None):
+    contracts = LeasContract.objects.filter(is_active=True, end_date__gte=today, end_date__lte=until)
+    if owner_id is not None:
+        contracts = contracts.filter(property__owner_id=owner_id)
+    return list(
+        contracts.annotate(month=TruncMonth('end_date')).values('month')
+        .annotate(contracts=Count('id'), monthly_rent=Sum('monthly_rent'))
+        .order_by('month')
+    )
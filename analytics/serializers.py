@@ -0,0 +1,36 @@
+from rest_framework import serializers
+
+class ReportParamsSerializer(serializers.Serializer):
+    owner = serializers.IntegerField(required=False)
+    months = serializers.IntegerField(min_value=1, max_value=60, default=12)
+
+
+class ProjectionParamsSerializer(ReportParamsSerializer):
+    months = serializers.IntegerField(min_value=1, max_value=120, default=36)
+    start = serializers.DateField(required=False)
+
+
+class OccupancySerializer(serializers.Serializer):
+    propert_type = serializers.CharField()
+    total = serializers.IntegerField()
+    occupied = serializers.IntegerField()
+    occupancy_rate = serializers.FloatField()
+
+
+class RentRollSerializer(serializers.Serializer):
+    owner = serializers.IntegerField()
+    username = serializers.CharField()
+    contracts = serializers.IntegerField()
+    monthly_rent = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class ExpiringSerializer(serializers.Serializer):
+    month = serializers.DateField(format='%Y-%m')
+    contracts = serializers.IntegerField()
+    monthly_rent = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class ProjectionSerializer(serializers.Serializer):
+    month = serializers.DateField(format='%Y-%m')
+    contracts = serializers.IntegerField()
+    income = serializers.DecimalField(max_digits=14, decimal_places=2)
\ No newline at end of file
@@ -0,0 +1,54 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from contracts.models import CpiIndex, LeasContract, RentStep
+from properties.models import Property
+from real_estate_management.signals import bulk_saved
+from .cache import REFERENCE, bump
+
+
+@receiver(pre_save, sender=Property)
+def remember_previous_owner(sender, instance, **kwargs):
+    instance._analytics_previous_owner_id = (
+        sender.objects.filter(pk=instance.pk).values_list('owner_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def property_changed(sender, instance, **kwargs):
+    previous = getattr(instance, '_analytics_previous_owner_id', None)
+    bump(*{instance.owner_id, previous} - {None})
+
+
+@receiver(post_save, sender=LeasContract)
+@receiver(post_delete, sender=LeasContract)
+def contract_changed(sender, instance, **kwargs):
+    owner_id = Property.objects.filter(pk=instance.property_id).values_list('owner_id', flat=True).first()
+    bump(*{owner_id} - {None})
+
+
+@receiver(bulk_saved, sender=Property)
+def properties_bulk_saved(sender, instances, **kwargs):
+    bump(*{obj.owner_id for obj in instances})
+
+
+@receiver(bulk_saved, sender=LeasContract)
+def contracts_bulk_saved(sender, instances, **kwargs):
+    property_ids = {obj.property_id for obj in instances}
+    bump(*Property.objects.filter(pk__in=property_ids).values_list('owner_id', flat=True).distinct())
+
+
+@receiver(post_save, sender=RentStep)
+@receiver(post_delete, sender=RentStep)
+def rent_step_changed(sender, instance, **kwargs):
+    owner_id = (
+        LeasContract.objects.filter(pk=instance.contract_id).values_list('property__owner_id', flat=True).first())
+    bump(*{owner_id} - {None})
+
+
+@receiver(post_save, sender=CpiIndex)
+@receiver(post_delete, sender=CpiIndex)
+def cpi_changed(sender, instance, **kwargs):
+    bump(REFERENCE)
@@ -0,0 +1,33 @@
+from django.utils import timezone
+from rest_framework import serializers
+
+from jobs.registry import task
+from users.scopes import sees_everything
+from .views import ExpiringView, OccupancyView, ProjectionView, RentRollView
+
+REPORTS = {view.name: view for view in (OccupancyView, RentRollView, ExpiringView, ProjectionView)}
+
+
+class ReportJobSerializer(serializers.Serializer):
+    """``report`` plus that report's own parameters; non-staff users always get their own figures."""
+
+    report = serializers.ChoiceField(choices=sorted(REPORTS))
+
+    def validate(self, attrs):
+        data = {key: value for key, value in self.initial_data.items() if key != 'report'}
+        params = REPORTS[attrs['report']].params_class(data=data)
+        params.is_valid(raise_exception=True)
+        attrs.update(params.validated_data)
+        request = self.context.get('request')
+        if request is not None and not sees_everything(request.user):
+            attrs['owner'] = request.user.id
+        return attrs
+
+
+@task('analytics.report', params=ReportJobSerializer, public=True, max_attempts=2)
+def build_report(report, **params):
+    """Compute a report off the request path; the rows also land in the report cache."""
+    view = REPORTS[report]
+    parsed = view.params_class(data=params)
+    parsed.is_valid(raise_exception=True)
+    return list(view().report(timezone.localdate(), parsed.validated_data.get('owner'), parsed.validated_data))
@@ -0,0 +1,165 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from contracts.models import CpiIndex, LeasContract, RentStep
+from properties.models import Property
+from real_estate_management.caches import cache_config
+from tenants.models import Tenant
+from users.models import CustomUser
+from . import projection
+from .cache import version_key
+
+# Query counts below are about the tables; keep the cache out of them.
+LOCAL_CACHES = cache_config(Path('.'), {'CACHE_URL': 'locmem://'})
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class AnalyticsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(CustomUser.objects.create_user(username='staff', password='x', is_staff=True))
+        self.today = timezone.localdate()
+        self.owners = [CustomUser.objects.create_user(username=f'owner{i}', password='x') for i in range(2)]
+        self.properties = [
+            Property.objects.create(
+                name=f'عقار {i}', propert_type=kind, description='-', address='-', owner=self.owners[i % 2])
+            for i, kind in enumerate(['apartment', 'apartment', 'shop', 'office'])
+        ]
+        self.tenant = Tenant.objects.create(name='سارة', phone='0500000000', email='s@example.com', address='-')
+        self.lease(self.properties[0], rent='3000.00')
+        self.lease(self.properties[1], rent='1500.00')
+        self.lease(self.properties[2], rent='900.00', is_active=False)
+
+    def lease(self, prop, rent, is_active=True):
+        return LeasContract.objects.create(
+            tenant=self.tenant, property=prop, start_date=self.today - timedelta(days=30),
+            end_date=self.today + timedelta(days=40), monthly_rent=Decimal(rent), is_active=is_active)
+
+    def results(self, name, **params):
+        response = self.client.get(reverse(name), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_occupancy_by_type(self):
+        rows = {row['propert_type']: row for row in self.results('analytics_occupancy')}
+        self.assertEqual((rows['apartment']['total'], rows['apartment']['occupied']), (2, 2))
+        self.assertEqual(rows['shop']['occupancy_rate'], 0.0)
+
+    def test_rent_roll_per_owner(self):
+        rows = self.results('analytics_rent_roll')
+        self.assertEqual(
+            [(row['username'], row['contracts'], row['monthly_rent']) for row in rows],
+            [('owner0', 1, '3000.00'), ('owner1', 1, '1500.00')])
+
+    def test_expiring_by_month(self):
+        rows = self.results('analytics_expiring', months=3)
+        self.assertEqual(sum(row['contracts'] for row in rows), 2)
+
+    def test_repeated_loads_hit_the_cache(self):
+        self.results('analytics_rent_roll', owner=self.owners[0].pk)
+        with self.assertNumQueries(0):
+            self.results('analytics_rent_roll', owner=self.owners[0].pk)
+
+    def test_changes_only_invalidate_the_affected_owner(self):
+        self.results('analytics_occupancy', owner=self.owners[0].pk)
+        self.results('analytics_occupancy', owner=self.owners[1].pk)
+        self.lease(self.properties[3], rent='700.00')
+        with self.assertNumQueries(0):
+            self.results('analytics_occupancy', owner=self.owners[0].pk)
+        rows = {row['propert_type']: row for row in self.results('analytics_occupancy', owner=self.owners[1].pk)}
+        self.assertEqual(rows['office']['occupied'], 1)
+
+    def test_evicted_versions_do_not_revive_old_reports(self):
+        owner = self.owners[1].pk
+        cache.clear()
+        self.results('analytics_occupancy', owner=owner)
+        self.lease(self.properties[3], rent='700.00')
+        self.results('analytics_occupancy', owner=owner)
+        cache.delete(version_key(owner))
+        rows = {row['propert_type']: row for row in self.results('analytics_occupancy', owner=owner)}
+        self.assertEqual(rows['office']['occupied'], 1)
+
+    def test_moving_a_property_invalidates_both_owners(self):
+        self.results('analytics_rent_roll', owner=self.owners[0].pk)
+        self.properties[0].owner = self.owners[1]
+        self.properties[0].save()
+        self.assertEqual(self.results('analytics_rent_roll', owner=self.owners[0].pk), [])
+
+    def test_owners_only_see_their_own_figures(self):
+        self.client.force_authenticate(self.owners[1])
+        rows = self.results('analytics_rent_roll', owner=self.owners[0].pk)
+        self.assertEqual([row['username'] for row in rows], ['owner1'])
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class ProjectionTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(CustomUser.objects.create_user(username='staff', password='x', is_staff=True))
+        self.owner = CustomUser.objects.create_user(username='owner', password='x')
+        self.tenant = Tenant.objects.create(name='سالم', phone='0500000000', email='s@example.com', address='-')
+
+    def lease(self, start, end, rent='1000.00', **terms):
+        prop = Property.objects.create(
+            name=f'عقار {start}', propert_type='apartment', description='-', address='-', owner=self.owner)
+        return LeasContract.objects.create(
+            tenant=self.tenant, property=prop, start_date=start, end_date=end, monthly_rent=Decimal(rent), **terms)
+
+    def incomes(self, **params):
+        response = self.client.get(reverse('analytics_projection'), {'start': '2024-12-01', 'months': 3, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(row['month'], row['contracts'], row['income']) for row in response.json()['results']]
+
+    def test_fixed_escalation_and_proration(self):
+        self.lease(date(2024, 1, 1), date(2026, 12, 31), escalation='fixed', escalation_rate=Decimal('10.00'))
+        self.lease(date(2025, 1, 16), date(2025, 12, 31))
+        self.assertEqual(self.incomes(), [
+            ('2024-12', 1, '1000.00'), ('2025-01', 2, '1616.13'), ('2025-02', 2, '2100.00')])
+
+    def test_stepped_and_cpi_escalation(self):
+        contract = self.lease(date(2024, 1, 1), date(2025, 12, 31), escalation='stepped')
+        RentStep.objects.create(contract=contract, effective_from=date(2025, 2, 1), monthly_rent=Decimal('1500.00'))
+        self.lease(date(2024, 1, 1), date(2025, 12, 31), rent='500.00', escalation='cpi')
+        CpiIndex.objects.create(month=date(2024, 1, 15), value=Decimal('100.000'))
+        CpiIndex.objects.create(month=date(2024, 12, 1), value=Decimal('104.000'))
+        self.assertEqual(self.incomes(), [
+            ('2024-12', 2, '1500.00'), ('2025-01', 2, '1520.00'), ('2025-02', 2, '2020.00')])
+
+    def test_cached_per_owner_until_terms_change(self):
+        contract = self.lease(date(2024, 1, 1), date(2025, 12, 31), escalation='cpi')
+        CpiIndex.objects.create(month=date(2024, 1, 1), value=Decimal('100.000'))
+        self.incomes(owner=self.owner.pk)
+        with self.assertNumQueries(0):
+            self.incomes(owner=self.owner.pk)
+        CpiIndex.objects.create(month=date(2025, 1, 1), value=Decimal('110.000'))
+        self.assertEqual(self.incomes(owner=self.owner.pk)[1][2], '1100.00')
+        contract.escalation = 'none'
+        contract.save()
+        self.assertEqual(self.incomes(owner=self.owner.pk)[1][2], '1000.00')
+
+    def test_contract_rules_are_validated(self):
+        prop = Property.objects.create(
+            name='عقار', propert_type='apartment', description='-', address='-', owner=self.owner)
+        response = self.client.post(reverse('leascontract-list'), {
+            'tenant': self.tenant.pk, 'property': prop.pk, 'start_date': '2025-01-01', 'end_date': '2025-12-31',
+            'monthly_rent': '1000.00', 'escalation': 'fixed'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('escalation_rate', response.json())
+
+    def test_numpy_matches_reference(self):
+        for i in range(20):
+            self.lease(date(2023, 1 + i % 12, 1 + i), date(2027, 6, 30), rent=f'{700 + 37 * i}.50',
+                       escalation=('none', 'fixed', 'cpi')[i % 3], escalation_rate=Decimal('3.75'),
+                       escalation_every_months=6 + i % 7)
+        CpiIndex.objects.create(month=date(2023, 1, 1), value=Decimal('100.000'))
+        CpiIndex.objects.create(month=date(2024, 7, 1), value=Decimal('103.250'))
+        start = date(2023, 6, 1)
+        self.assertEqual(
+            projection.project(start, 48), projection.project(start, 48, projector=projection.project_reference))
\ No newline at end of file
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import ExpiringView, OccupancyView, ProjectionView, RentRollView
+
+urlpatterns = [
+    path('analytics/occupancy/', OccupancyView.as_view(), name='analytics_occupancy'),
+    path('analytics/rent-roll/', RentRollView.as_view(), name='analytics_rent_roll'),
+    path('analytics/expiring/', ExpiringView.as_view(), name='analytics_expiring'),
+    path('analytics/projection/', ProjectionView.as_view(), name='analytics_projection'),
+]
\ No newline at end of file
@@ -0,0 +1,82 @@
+from calendar import monthrange
+
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from users.scopes import sees_everything
+from . import projection, reports
+from .cache import ALL_OWNERS, cached_report
+from .serializers import (
+    ExpiringSerializer, OccupancySerializer, ProjectionParamsSerializer, ProjectionSerializer, ReportParamsSerializer,
+    RentRollSerializer,
+)
+
+
+def add_months(day, months):
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return day.replace(year=year, month=month, day=min(day.day, monthrange(year, month)[1]))
+
+
+class CachedReportView(APIView):
+    """Serve a report from the cache, keyed on owner scope and data version.
+
+    Staff may pick any owner with ``?owner=``; other users always get their own.
+    """
+
+    name = None
+    serializer_class = None
+    params_class = ReportParamsSerializer
+
+    def get(self, request):
+        params = self.params_class(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        owner_id = params.validated_data.get('owner')
+        if not sees_everything(request.user):
+            owner_id = request.user.id
+        return Response({'results': self.report(timezone.localdate(), owner_id, params.validated_data)})
+
+    def report(self, today, owner_id, params):
+        """Serialized rows for ``owner_id`` (``None`` for every owner), from the cache when possible."""
+        key_params = {'today': today.isoformat(), **params}
+        return cached_report(
+            self.name, ALL_OWNERS if owner_id is None else owner_id, key_params,
+            lambda: self.serializer_class(self.compute(today, owner_id, params), many=True).data)
+
+    def compute(self, today, owner_id, params):
+        raise NotImplementedError
+
+
+class OccupancyView(CachedReportView):
+    name = 'occupancy'
+    serializer_class = OccupancySerializer
+
+    def compute(self, today, owner_id, params):
+        return reports.occupancy(today, owner_id)
+
+
+class RentRollView(CachedReportView):
+    name = 'rent-roll'
+    serializer_class = RentRollSerializer
+
+    def compute(self, today, owner_id, params):
+        return reports.rent_roll(today, owner_id)
+
+
+class ExpiringView(CachedReportView):
+    name = 'expiring'
+    serializer_class = ExpiringSerializer
+
+    def compute(self, today, owner_id, params):
+        return reports.expiring(today, add_months(today, params['months']), owner_id)
+
+
+class ProjectionView(CachedReportView):
+    """Projected monthly rent income, escalation included, over ``?months=`` from ``?start=``."""
+
+    name = 'projection'
+    serializer_class = ProjectionSerializer
+    params_class = ProjectionParamsSerializer
+
+    def compute(self, today, owner_id, params):
+        return projection.project(params.get('start', today), params['months'], owner_id)
\ No newline at end of file
@@ -0,0 +1,20 @@
+from django.contrib import admin
+from .models import Attachment, Blob, Upload
+
+@admin.register(Attachment)
+class AttachmentAdmin(admin.ModelAdmin):
+    list_display = ['filename', 'contract', 'tenant', 'uploaded_by', 'created_at']
+    search_fields = ['filename', 'blob__sha256']
+    raw_id_fields = ['blob', 'contract', 'tenant', 'uploaded_by']
+
+@admin.register(Blob)
+class BlobAdmin(admin.ModelAdmin):
+    list_display = ['sha256', 'content_type', 'size', 'pages', 'has_thumbnail', 'processed_at']
+    list_filter = ['content_type', 'has_thumbnail']
+    search_fields = ['sha256']
+    readonly_fields = ['sha256', 'size', 'content_type', 'pages', 'has_thumbnail', 'processed_at']
+
+@admin.register(Upload)
+class UploadAdmin(admin.ModelAdmin):
+    list_display = ['filename', 'size', 'received', 'created_by', 'created_at']
+    raw_id_fields = ['contract', 'tenant', 'created_by']
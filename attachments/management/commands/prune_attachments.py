@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import ProtectedError
+from django.utils import timezone
+
+from attachments.models import Blob, Upload
+from attachments.storage import blob_path, discard, thumbnail_path, upload_path
+
+DEFAULT_UPLOAD_TTL = 24 * 3600
+
+
+class Command(BaseCommand):
+    help = "Delete abandoned uploads and stored files no attachment refers to any more."
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(seconds=getattr(settings, 'ATTACHMENTS_UPLOAD_TTL', DEFAULT_UPLOAD_TTL))
+        uploads = 0
+        for upload in Upload.objects.filter(created_at__lt=cutoff).iterator():
+            discard(upload_path(upload.pk))
+            upload.delete()
+            uploads += 1
+        blobs = 0
+        # Recent blobs are left alone: their attachment may still be on its way in.
+        for blob in Blob.objects.filter(attachments__isnull=True, created_at__lt=cutoff).iterator():
+            try:
+                blob.delete()
+            except ProtectedError:
+                continue
+            discard(blob_path(blob.sha256))
+            discard(thumbnail_path(blob.sha256))
+            blobs += 1
+        self.stdout.write(self.style.SUCCESS(f"Removed {uploads} abandoned uploads and {blobs} unused files."))
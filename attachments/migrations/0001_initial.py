@@ -0,0 +1,73 @@
+# Generated by Django 5.1.4 on 2026-10-18 18:16
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contracts', '0006_rent_escalation'),
+        ('tenants', '0002_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='البصمة')),
+                ('size', models.PositiveBigIntegerField(verbose_name='الحجم')),
+                ('content_type', models.CharField(max_length=100, verbose_name='نوع المحتوى')),
+                ('pages', models.PositiveIntegerField(blank=True, null=True, verbose_name='عدد الصفحات')),
+                ('has_thumbnail', models.BooleanField(default=False, verbose_name='له صورة مصغرة')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='تمت المعالجة في')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاريخ الإنشاء')),
+            ],
+            options={
+                'verbose_name': 'محتوى ملف',
+                'verbose_name_plural': 'محتويات الملفات',
+            },
+        ),
+        migrations.CreateModel(
+            name='Upload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255, verbose_name='اسم الملف')),
+                ('content_type', models.CharField(blank=True, max_length=100, verbose_name='نوع المحتوى')),
+                ('size', models.PositiveBigIntegerField(verbose_name='الحجم')),
+                ('received', models.PositiveBigIntegerField(default=0, verbose_name='المستلم')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاريخ الإنشاء')),
+                ('contract', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contracts.leascontract', verbose_name='العقد')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='أنشأه')),
+                ('tenant', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tenants.tenant', verbose_name='المستأجر')),
+            ],
+            options={
+                'verbose_name': 'رفع جارٍ',
+                'verbose_name_plural': 'عمليات الرفع الجارية',
+            },
+        ),
+        migrations.CreateModel(
+            name='Attachment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('filename', models.CharField(max_length=255, verbose_name='اسم الملف')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاريخ الرفع')),
+                ('contract', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='attachments', to='contracts.leascontract', verbose_name='العقد')),
+                ('tenant', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='attachments', to='tenants.tenant', verbose_name='المستأجر')),
+                ('uploaded_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='رفعه')),
+                ('blob', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='attachments', to='attachments.blob', verbose_name='المحتوى')),
+            ],
+            options={
+                'verbose_name': 'مرفق',
+                'verbose_name_plural': 'المرفقات',
+                'indexes': [models.Index(fields=['contract', 'id'], name='attachment_contract'), models.Index(fields=['tenant', 'id'], name='attachment_tenant')],
+                'constraints': [models.CheckConstraint(condition=models.Q(models.Q(('contract__isnull', False), ('tenant__isnull', True)), models.Q(('contract__isnull', True), ('tenant__isnull', False)), _connector='OR'), name='attachment_single_owner')],
+            },
+        ),
+    ]
@@ -0,0 +1,89 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+from contracts.models import LeasContract
+from tenants.models import Tenant
+from users.scopes import sees_everything
+
+class Blob(models.Model):
+  """File content stored once per SHA-256, however many attachments refer to it."""
+  sha256 = models.CharField(max_length=64, unique=True, verbose_name="البصمة")
+  size = models.PositiveBigIntegerField(verbose_name="الحجم")
+  content_type = models.CharField(max_length=100, verbose_name="نوع المحتوى")
+  pages = models.PositiveIntegerField(null=True, blank=True, verbose_name="عدد الصفحات")
+  has_thumbnail = models.BooleanField(default=False, verbose_name="له صورة مصغرة")
+  processed_at = models.DateTimeField(null=True, blank=True, verbose_name="تمت المعالجة في")
+  created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء")
+
+  def __str__(self):
+    return self.sha256
+
+  class Meta:
+    verbose_name = "محتوى ملف"
+    verbose_name_plural = "محتويات الملفات"
+
+class AttachmentQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(
+      models.Q(contract__property__owner_id=user.id)
+      | models.Q(tenant__in=Tenant.objects.visible_to(user).values('pk')))
+
+class Attachment(models.Model):
+  blob = models.ForeignKey(Blob, on_delete=models.PROTECT, related_name='attachments', verbose_name="المحتوى")
+  contract = models.ForeignKey(LeasContract, null=True, blank=True, on_delete=models.CASCADE, related_name='attachments', verbose_name="العقد")
+  tenant = models.ForeignKey(Tenant, null=True, blank=True, on_delete=models.CASCADE, related_name='attachments', verbose_name="المستأجر")
+  filename = models.CharField(max_length=255, verbose_name="اسم الملف")
+  uploaded_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name='+', verbose_name="رفعه")
+  created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الرفع")
+
+  objects = AttachmentQuerySet.as_manager()
+
+  def __str__(self):
+    return self.filename
+
+  class Meta:
+    verbose_name = "مرفق"
+    verbose_name_plural = "المرفقات"
+    indexes = [
+      models.Index(fields=['contract', 'id'], name='attachment_contract'),
+      models.Index(fields=['tenant', 'id'], name='attachment_tenant'),
+    ]
+    constraints = [
+      models.CheckConstraint(
+        condition=models.Q(contract__isnull=False, tenant__isnull=True) | models.Q(contract__isnull=True, tenant__isnull=False),
+        name='attachment_single_owner'),
+    ]
+
+class UploadQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(created_by_id=user.id)
+
+class Upload(models.Model):
+  """A resumable upload in progress; its bytes accumulate in a file named after ``id``."""
+  id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+  contract = models.ForeignKey(LeasContract, null=True, blank=True, on_delete=models.CASCADE, related_name='+', verbose_name="العقد")
+  tenant = models.ForeignKey(Tenant, null=True, blank=True, on_delete=models.CASCADE, related_name='+', verbose_name="المستأجر")
+  filename = models.CharField(max_length=255, verbose_name="اسم الملف")
+  content_type = models.CharField(max_length=100, blank=True, verbose_name="نوع المحتوى")
+  size = models.PositiveBigIntegerField(verbose_name="الحجم")
+  received = models.PositiveBigIntegerField(default=0, verbose_name="المستلم")
+  created_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.CASCADE, related_name='+', verbose_name="أنشأه")
+  created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء")
+
+  objects = UploadQuerySet.as_manager()
+
+  def __str__(self):
+    return f"{self.filename} ({self.received}/{self.size})"
+
+  class Meta:
+    verbose_name = "رفع جارٍ"
+    verbose_name_plural = "عمليات الرفع الجارية"
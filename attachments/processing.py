@@ -0,0 +1,102 @@
+"""Thumbnails and page counts for stored blobs, run by the job worker.
+
+Pillow (images), pypdf (page counts) and poppler's ``pdftoppm`` (PDF
+thumbnails) are optional; without them the work they would do is skipped,
+except that PDF pages are then counted by scanning the file for page objects.
+"""
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+from django.utils import timezone
+
+from .models import Blob
+from .storage import blob_path, thumbnail_path
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - optional dependency
+    Image = None
+
+try:
+    import pypdf
+except ImportError:  # pragma: no cover - optional dependency
+    pypdf = None
+
+THUMBNAIL_SIZE = 256
+SCAN_BLOCK = 1024 * 1024
+PAGE_OBJECT = re.compile(rb'/Type\s*/Page(?![A-Za-z])')
+PDFTOPPM_TIMEOUT = 60
+
+
+def count_pages(path):
+    if pypdf is not None:
+        try:
+            return len(pypdf.PdfReader(path).pages)
+        except Exception:
+            pass
+    # Page objects inside compressed object streams are invisible to the scan.
+    count, tail = 0, b''
+    with open(path, 'rb') as handle:
+        while True:
+            block = handle.read(SCAN_BLOCK)
+            data = tail + block
+            # Before the end of the file a marker needs the byte after it to tell /Page from /Pages.
+            limit = len(data) - 1 if block else len(data)
+            counted = 0
+            for match in PAGE_OBJECT.finditer(data):
+                if match.end() <= limit:
+                    count += 1
+                    counted = match.end()
+            if not block:
+                break
+            tail = data[max(len(data) - 32, counted):]
+    return count or None
+
+
+def image_thumbnail(source, target):
+    if Image is None:
+        return False
+    with Image.open(source) as image:
+        # JPEGs are decoded at a reduced scale straight away, so large scans stay small in memory.
+        image.draft('RGB', (THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        image.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGBA')
+        image.save(target, 'PNG')
+    return True
+
+
+def pdf_thumbnail(source, target):
+    pdftoppm = shutil.which('pdftoppm')
+    if pdftoppm is None:
+        return False
+    prefix = target.with_suffix('')
+    subprocess.run(
+        [pdftoppm, '-png', '-singlefile', '-f', '1', '-l', '1', '-scale-to', str(THUMBNAIL_SIZE), source, prefix],
+        check=True, capture_output=True, timeout=PDFTOPPM_TIMEOUT)
+    return True
+
+
+def process(blob):
+    """Record ``blob``'s page count and write its thumbnail, if its type has them."""
+    source = blob_path(blob.sha256)
+    target = thumbnail_path(blob.sha256)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    pages, thumbnailer = None, None
+    if blob.content_type == 'application/pdf':
+        pages, thumbnailer = count_pages(source), pdf_thumbnail
+    elif blob.content_type.startswith('image/'):
+        thumbnailer = image_thumbnail
+    has_thumbnail = False
+    if thumbnailer is not None:
+        # Written beside the final name and renamed, so a half-written thumbnail is never served.
+        with tempfile.TemporaryDirectory(dir=target.parent) as scratch:
+            partial = target.parent / scratch / target.name
+            has_thumbnail = thumbnailer(source, partial)
+            if has_thumbnail:
+                os.replace(partial, target)
+    Blob.objects.filter(pk=blob.pk).update(pages=pages, has_thumbnail=has_thumbnail, processed_at=timezone.now())
+    return {'pages': pages, 'thumbnail': has_thumbnail}
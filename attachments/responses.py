@@ -0,0 +1,102 @@
+"""File downloads with single byte-range support.
+
+Whole files go out as a ``FileResponse`` over the open file, which WSGI
+servers with ``wsgi.file_wrapper`` (gunicorn, uWSGI) send with
+``sendfile(2)``. With ``ATTACHMENTS_SENDFILE_HEADER`` set (e.g.
+``X-Accel-Redirect``) the response is left to the front-end server instead,
+which then also handles ranges.
+"""
+import re
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header
+
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class RangeFile:
+    """``length`` bytes of ``handle`` from ``start``.
+
+    It has no ``fileno``, so servers stream it through ``read`` rather than
+    sending the whole file.
+    """
+
+    def __init__(self, handle, start, length):
+        handle.seek(start)
+        self.handle = handle
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.handle.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.handle.close()
+
+
+def parse_range(header, size):
+    """``(start, end)`` of a single ``bytes=`` range, ``None`` to send everything, or ``ValueError`` if unsatisfiable.
+
+    Multi-range requests are answered with the whole file.
+    """
+    match = RANGE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start > end or start >= size:
+        raise ValueError(header)
+    return start, end
+
+
+def serve(request, path, *, size, etag, content_type, filename=None, relative=None):
+    """Send the file at ``path``, honouring ``If-None-Match``, ``Range`` and ``If-Range``."""
+    etag = f'"{etag}"'
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+    disposition = content_disposition_header(True, filename) if filename else None
+    header = getattr(settings, 'ATTACHMENTS_SENDFILE_HEADER', None)
+    if header and relative is not None:
+        response = HttpResponse(content_type=content_type)
+        response[header] = getattr(settings, 'ATTACHMENTS_SENDFILE_PREFIX', '/protected/') + relative
+    else:
+        requested = request.META.get('HTTP_RANGE')
+        if_range = request.META.get('HTTP_IF_RANGE')
+        if if_range and if_range != etag:
+            requested = None
+        try:
+            span = parse_range(requested, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        with ExitStack() as stack:
+            handle = stack.enter_context(open(path, 'rb'))
+            if span is None:
+                response = FileResponse(handle, content_type=content_type)
+            else:
+                start, end = span
+                response = FileResponse(
+                    RangeFile(handle, start, end - start + 1), status=206, content_type=content_type)
+                response['Content-Length'] = end - start + 1
+                response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            # The response closes the file once it has been sent.
+            stack.pop_all()
+        response['Accept-Ranges'] = 'bytes'
+    if disposition:
+        response['Content-Disposition'] = disposition
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, max-age=3600'
+    return response
@@ -0,0 +1,54 @@
+from rest_framework import serializers
+from real_estate_management.permissions import scope_related_field
+from .models import Attachment, Upload
+from .storage import max_size
+
+
+class TargetMixin:
+    """Attachments belong to exactly one contract or tenant the user can see."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        scope_related_field(fields, 'contract', self.context)
+        scope_related_field(fields, 'tenant', self.context)
+        return fields
+
+    def validate(self, attrs):
+        if (attrs.get('contract') is None) == (attrs.get('tenant') is None):
+            raise serializers.ValidationError("يجب تحديد عقد أو مستأجر واحد فقط")
+        return attrs
+
+
+class AttachmentSerializer(TargetMixin, serializers.ModelSerializer):
+    file = serializers.FileField(write_only=True)
+    filename = serializers.CharField(max_length=255, required=False)
+    size = serializers.IntegerField(source='blob.size', read_only=True)
+    content_type = serializers.CharField(source='blob.content_type', read_only=True)
+    sha256 = serializers.CharField(source='blob.sha256', read_only=True)
+    pages = serializers.IntegerField(source='blob.pages', read_only=True)
+    has_thumbnail = serializers.BooleanField(source='blob.has_thumbnail', read_only=True)
+
+    class Meta:
+        model = Attachment
+        fields = [
+            'id', 'contract', 'tenant', 'filename', 'file', 'size', 'content_type', 'sha256', 'pages',
+            'has_thumbnail', 'uploaded_by', 'created_at',
+        ]
+        read_only_fields = ['uploaded_by', 'created_at']
+
+    def validate_file(self, value):
+        if value.size > max_size():
+            raise serializers.ValidationError(f"حجم الملف يتجاوز الحد المسموح ({max_size()} بايت)")
+        return value
+
+
+class UploadSerializer(TargetMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Upload
+        fields = ['id', 'contract', 'tenant', 'filename', 'content_type', 'size', 'received', 'created_at']
+        read_only_fields = ['received', 'created_at']
+
+    def validate_size(self, value):
+        if not 0 < value <= max_size():
+            raise serializers.ValidationError(f"يجب أن يكون الحجم بين 1 و {max_size()} بايت")
+        return value
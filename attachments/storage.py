@@ -0,0 +1,136 @@
+"""Content-addressed file storage under ``ATTACHMENTS_ROOT``.
+
+Uploads are streamed to disk in ``CHUNK_SIZE`` blocks, never held in memory
+whole. A finished file is hashed, moved to ``blobs/<sha256>`` and recorded
+as a ``Blob``; uploading the same bytes again reuses the stored copy. Each
+new blob queues the ``attachments.process_blob`` job for its thumbnail and
+page count.
+"""
+import hashlib
+import mimetypes
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from jobs.queue import enqueue
+from .models import Attachment, Blob
+
+CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_SIZE = 100 * 1024 * 1024
+SIGNATURES = [
+    (b'%PDF-', 'application/pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF8', 'image/gif'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+]
+
+
+def root():
+    return Path(settings.ATTACHMENTS_ROOT)
+
+
+def max_size():
+    return getattr(settings, 'ATTACHMENTS_MAX_SIZE', DEFAULT_MAX_SIZE)
+
+
+def blob_path(sha256):
+    return root() / 'blobs' / sha256[:2] / sha256
+
+
+def thumbnail_path(sha256):
+    return root() / 'thumbnails' / sha256[:2] / f'{sha256}.png'
+
+
+def upload_path(upload_id):
+    return root() / 'uploads' / str(upload_id)
+
+
+def write_chunk(path, offset, stream, length):
+    """Copy ``length`` bytes from ``stream`` into ``path`` at ``offset``; returns the bytes written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    # Opened without O_TRUNC so earlier chunks survive.
+    with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT, 0o600), 'wb') as out:
+        out.seek(offset)
+        while written < length:
+            block = stream.read(min(CHUNK_SIZE, length - written))
+            if not block:
+                break
+            out.write(block)
+            written += len(block)
+    return written
+
+
+def spool(uploaded):
+    """A path on disk holding ``uploaded``; files Django already spooled are used where they are."""
+    if hasattr(uploaded, 'temporary_file_path'):
+        return Path(uploaded.temporary_file_path())
+    directory = root() / 'uploads'
+    directory.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as out:
+        for block in uploaded.chunks(CHUNK_SIZE):
+            out.write(block)
+    return Path(out.name)
+
+
+def sniff(path, filename, declared=''):
+    """The content type from the file's leading bytes, else the declared one, else the filename."""
+    with open(path, 'rb') as handle:
+        head = handle.read(16)
+    for signature, content_type in SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    return declared or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+
+def digest(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        while block := handle.read(CHUNK_SIZE * 16):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def store(source, content_type):
+    """Move ``source`` into the blob store; returns ``(blob, created)``.
+
+    When the content is already stored ``source`` is deleted instead.
+    """
+    sha256 = digest(source)
+    target = blob_path(sha256)
+    if target.exists():
+        source.unlink()
+    else:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # A rename within ATTACHMENTS_ROOT; files spooled elsewhere are copied.
+        shutil.move(source, target)
+    try:
+        with transaction.atomic():
+            return Blob.objects.get_or_create(
+                sha256=sha256, defaults={'size': target.stat().st_size, 'content_type': content_type})
+    except IntegrityError:
+        return Blob.objects.get(sha256=sha256), False
+
+
+def attach(source, filename, *, declared_type='', contract_id=None, tenant_id=None, user=None):
+    """Store the file at ``source`` and attach it to ``contract`` or ``tenant``."""
+    blob, created = store(source, sniff(source, filename, declared_type))
+    attachment = Attachment.objects.create(
+        blob=blob, contract_id=contract_id, tenant_id=tenant_id, filename=filename,
+        uploaded_by_id=user.id if user is not None and user.is_authenticated else None)
+    if created:
+        transaction.on_commit(lambda: enqueue('attachments.process_blob', {'blob': blob.pk}))
+    return attachment
+
+
+def discard(path):
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
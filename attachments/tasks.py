@@ -0,0 +1,10 @@
+from jobs.registry import task
+from .models import Blob
+from .processing import process
+
+
+@task('attachments.process_blob', max_attempts=3)
+def process_blob(blob):
+    stored = Blob.objects.filter(pk=blob).first()
+    # Pruned before the job ran.
+    return process(stored) if stored is not None else None
@@ -0,0 +1,167 @@
+import hashlib
+import shutil
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from jobs.worker import Worker
+from properties.models import Property
+from tenants.models import Tenant
+from users.models import CustomUser
+from . import processing
+from .models import Attachment, Blob, Upload
+from .responses import parse_range
+from .storage import blob_path, upload_path
+
+PDF = (
+    b'%PDF-1.4\n1 0 obj << /Type /Catalog /Pages 2 0 R >> endobj\n'
+    b'2 0 obj << /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >> endobj\n'
+    b'3 0 obj << /Type /Page /Parent 2 0 R >> endobj\n'
+    b'4 0 obj << /Type/Page /Parent 2 0 R >> endobj\n%%EOF\n'
+)
+
+
+class TempRootMixin:
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        settings = override_settings(ATTACHMENTS_ROOT=self.root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+
+class AttachmentApiTests(TempRootMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.owner = CustomUser.objects.create_user(username='owner', password='x')
+        self.tenant = Tenant.objects.create(name='مستأجر', phone='0500000000', email='t@example.com', address='مسقط')
+        prop = Property.objects.create(
+            name='عقار', propert_type='apartment', description='-', address='مسقط', owner=self.owner)
+        self.contract = LeasContract.objects.create(
+            tenant=self.tenant, property=prop, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31),
+            monthly_rent=Decimal('2500.00'))
+        self.client.force_authenticate(self.owner)
+
+    def put_chunk(self, upload_id, data, first, size):
+        return self.client.put(
+            reverse('attachment-upload-detail', args=[upload_id]), data, content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {first}-{first + len(data) - 1}/{size}')
+
+    def test_chunked_upload_resumes_and_deduplicates(self):
+        body = PDF * 50
+        upload = self.client.post(reverse('attachment-upload-list'), {
+            'contract': self.contract.pk, 'filename': 'lease.pdf', 'size': len(body)}, format='json').json()
+        self.assertEqual(self.put_chunk(upload['id'], body[:1000], 0, len(body)).json()['received'], 1000)
+        conflict = self.put_chunk(upload['id'], body[2000:], 2000, len(body))
+        self.assertEqual((conflict.status_code, conflict.json()['received']), (409, 1000))
+        polled = self.client.get(reverse('attachment-upload-detail', args=[upload['id']])).json()
+        with self.captureOnCommitCallbacks(execute=True):
+            done = self.put_chunk(upload['id'], body[polled['received']:], polled['received'], len(body))
+        self.assertEqual(done.status_code, 201)
+        attachment = done.json()
+        self.assertEqual(attachment['sha256'], hashlib.sha256(body).hexdigest())
+        self.assertEqual((attachment['content_type'], attachment['size']), ('application/pdf', len(body)))
+        self.assertEqual(blob_path(attachment['sha256']).read_bytes(), body)
+        self.assertFalse(Upload.objects.exists())
+        self.assertFalse(upload_path(upload['id']).exists())
+
+        again = self.client.post(reverse('attachment-list'), {
+            'tenant': self.tenant.pk, 'file': SimpleUploadedFile('copy.bin', body)}, format='multipart')
+        self.assertEqual(again.status_code, 201)
+        self.assertEqual((again.json()['sha256'], again.json()['filename']), (attachment['sha256'], 'copy.bin'))
+        self.assertEqual(Blob.objects.count(), 1)
+
+        with mock.patch.object(processing, 'pypdf', None):
+            Worker(0).run(once=True)
+        listed = self.client.get(reverse('attachment-list'), {'contract': self.contract.pk}).json()['results']
+        self.assertEqual([(row['id'], row['pages']) for row in listed], [(attachment['id'], 100)])
+
+    def test_download_ranges(self):
+        body = bytes(range(256)) * 4
+        created = self.client.post(reverse('attachment-list'), {
+            'contract': self.contract.pk, 'file': SimpleUploadedFile('scan.bin', body)}, format='multipart').json()
+        url = reverse('attachment-download', args=[created['id']])
+
+        def fetch(**headers):
+            response = self.client.get(url, **headers)
+            content = b''.join(response.streaming_content) if response.streaming else response.content
+            response.close()
+            return response, content
+
+        full, content = fetch()
+        self.assertEqual((full.status_code, content), (200, body))
+        self.assertIn('attachment; filename="scan.bin"', full['Content-Disposition'])
+        part, content = fetch(HTTP_RANGE='bytes=10-19')
+        self.assertEqual((part.status_code, part['Content-Range'], part['Content-Length']), (206, 'bytes 10-19/1024', '10'))
+        self.assertEqual(content, body[10:20])
+        self.assertEqual(fetch(HTTP_RANGE='bytes=-4')[1], body[-4:])
+        self.assertEqual(fetch(HTTP_RANGE='bytes=2000-')[0].status_code, 416)
+        self.assertEqual(fetch(HTTP_RANGE='bytes=0-1', HTTP_IF_RANGE='"stale"')[0].status_code, 200)
+        self.assertEqual(fetch(HTTP_IF_NONE_MATCH=full['ETag'])[0].status_code, 304)
+        with override_settings(ATTACHMENTS_SENDFILE_HEADER='X-Accel-Redirect'):
+            redirected = self.client.get(url)
+        self.assertEqual(
+            redirected['X-Accel-Redirect'],
+            f"/protected/attachments/blobs/{created['sha256'][:2]}/{created['sha256']}")
+
+    def test_other_owners_are_shut_out(self):
+        created = self.client.post(reverse('attachment-list'), {
+            'contract': self.contract.pk, 'file': SimpleUploadedFile('id.txt', b'secret')}, format='multipart').json()
+        both = self.client.post(reverse('attachment-upload-list'), {
+            'contract': self.contract.pk, 'tenant': self.tenant.pk, 'filename': 'x', 'size': 1}, format='json')
+        self.assertEqual(both.status_code, 400)
+
+        self.client.force_authenticate(CustomUser.objects.create_user(username='other', password='x'))
+        self.assertEqual(self.client.get(reverse('attachment-download', args=[created['id']])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('attachment-list')).json()['results'], [])
+        response = self.client.post(reverse('attachment-list'), {
+            'contract': self.contract.pk, 'file': SimpleUploadedFile('x.txt', b'x')}, format='multipart')
+        self.assertIn('contract', response.json())
+
+
+class ProcessingTests(TempRootMixin, TestCase):
+    def test_page_scan_across_blocks(self):
+        path = self.root / 'doc.pdf'
+        path.write_bytes(PDF * 3)
+        with mock.patch.object(processing, 'pypdf', None), mock.patch.object(processing, 'SCAN_BLOCK', 7):
+            self.assertEqual(processing.count_pages(path), 6)
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range('bytes=5-', 10), (5, 9))
+        self.assertEqual(parse_range('bytes=-20', 10), (0, 9))
+        self.assertIsNone(parse_range('bytes=0-1,4-5', 10))
+        with self.assertRaises(ValueError):
+            parse_range('bytes=10-12', 10)
+
+    def test_prune_removes_stale_uploads_and_unused_blobs(self):
+        owner = CustomUser.objects.create_user(username='owner', password='x')
+        tenant = Tenant.objects.create(name='مستأجر', phone='0500000000', email='t@example.com', address='مسقط')
+        upload = Upload.objects.create(tenant=tenant, filename='a', size=10, created_by=owner)
+        upload_path(upload.pk).parent.mkdir(parents=True)
+        upload_path(upload.pk).write_bytes(b'12345')
+        blob = Blob.objects.create(sha256='0' * 64, size=1, content_type='text/plain')
+        blob_path(blob.sha256).parent.mkdir(parents=True)
+        blob_path(blob.sha256).write_bytes(b'x')
+        kept = Blob.objects.create(sha256='1' * 64, size=1, content_type='text/plain')
+        Attachment.objects.create(blob=kept, tenant=tenant, filename='kept')
+        Blob.objects.update(created_at=timezone.now() - timedelta(days=2))
+        Upload.objects.update(created_at=timezone.now() - timedelta(days=2))
+        out = StringIO()
+        call_command('prune_attachments', stdout=out)
+        self.assertIn('Removed 1 abandoned uploads and 1 unused files', out.getvalue())
+        self.assertEqual(list(Blob.objects.values_list('pk', flat=True)), [kept.pk])
+        self.assertFalse(blob_path(blob.sha256).exists() or upload_path(upload.pk).exists())
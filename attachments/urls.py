@@ -0,0 +1,9 @@
+from rest_framework.routers import DefaultRouter
+from .views import AttachmentViewSet, UploadViewSet
+
+router = DefaultRouter()
+# Registered first so ``uploads`` is not taken for an attachment id.
+router.register(r'attachments/uploads', UploadViewSet, basename='attachment-upload')
+router.register(r'attachments', AttachmentViewSet)
+
+urlpatterns = router.urls
@@ -0,0 +1,121 @@
+import io
+import re
+
+from django.db import transaction
+from django.http import Http404
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from real_estate_management.permissions import OwnerScopedMixin
+from .models import Attachment, Upload
+from .responses import serve
+from .serializers import AttachmentSerializer, UploadSerializer
+from .storage import attach, blob_path, discard, root, spool, thumbnail_path, upload_path, write_chunk
+
+CONTENT_RANGE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+class AttachmentViewSet(OwnerScopedMixin, mixins.CreateModelMixin, mixins.RetrieveModelMixin, mixins.ListModelMixin,
+                        mixins.DestroyModelMixin, viewsets.GenericViewSet):
+    """Files attached to contracts and tenants.
+
+    ``POST`` takes a multipart ``file`` spooled to disk by Django; large files
+    should go through ``attachments/uploads/`` in chunks instead. Filter the
+    list with ``?contract=`` or ``?tenant=``.
+    """
+
+    queryset = Attachment.objects.select_related('blob')
+    serializer_class = AttachmentSerializer
+    lookup_value_regex = r'\d+'
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        for field in ('contract', 'tenant'):
+            value = self.request.query_params.get(field)
+            if value is not None:
+                if not value.isdigit():
+                    raise ValidationError({field: "قيمة غير صالحة"})
+                queryset = queryset.filter(**{f'{field}_id': int(value)})
+        return queryset
+
+    def perform_create(self, serializer):
+        data = serializer.validated_data
+        uploaded = data['file']
+        with transaction.atomic():
+            serializer.instance = attach(
+                spool(uploaded), data.get('filename') or uploaded.name, declared_type=uploaded.content_type,
+                contract_id=getattr(data.get('contract'), 'pk', None), tenant_id=getattr(data.get('tenant'), 'pk', None),
+                user=self.request.user)
+
+    @action(detail=True)
+    def download(self, request, pk=None):
+        attachment = self.get_object()
+        blob = attachment.blob
+        path = blob_path(blob.sha256)
+        return serve(
+            request, path, size=blob.size, etag=blob.sha256, content_type=blob.content_type,
+            filename=attachment.filename, relative=path.relative_to(root()).as_posix())
+
+    @action(detail=True)
+    def thumbnail(self, request, pk=None):
+        blob = self.get_object().blob
+        if not blob.has_thumbnail:
+            raise Http404
+        path = thumbnail_path(blob.sha256)
+        return serve(
+            request, path, size=path.stat().st_size, etag=f'{blob.sha256}-thumbnail', content_type='image/png',
+            relative=path.relative_to(root()).as_posix())
+
+
+class UploadViewSet(OwnerScopedMixin, mixins.CreateModelMixin, mixins.RetrieveModelMixin, mixins.DestroyModelMixin,
+                    viewsets.GenericViewSet):
+    """Resumable uploads.
+
+    ``POST`` declares the file and its target, then each ``PUT`` sends the
+    next chunk as the raw body with ``Content-Range: bytes first-last/size``.
+    A chunk that does not start at ``received`` is refused with ``409`` and
+    the offset to resume from; the last one answers ``201`` with the attachment.
+    """
+
+    queryset = Upload.objects.all()
+    serializer_class = UploadSerializer
+
+    def perform_create(self, serializer):
+        serializer.save(created_by_id=self.request.user.id)
+
+    def perform_destroy(self, instance):
+        discard(upload_path(instance.pk))
+        instance.delete()
+
+    def update(self, request, *args, **kwargs):
+        upload = self.get_object()
+        match = CONTENT_RANGE.match(request.META.get('HTTP_CONTENT_RANGE', ''))
+        if match is None:
+            raise ValidationError({'Content-Range': "مطلوب بالصيغة bytes first-last/size"})
+        start, end, size = map(int, match.groups())
+        if size != upload.size or not start <= end < size:
+            raise ValidationError({'Content-Range': "لا يطابق حجم الملف المعلن"})
+        if start != upload.received:
+            return self.conflict(upload.received)
+        length = end - start + 1
+        # Read straight from the request stream; the body is never loaded whole.
+        if write_chunk(upload_path(upload.pk), start, request.stream or io.BytesIO(), length) != length:
+            raise ValidationError({'Content-Range': "الجزء أقصر من المعلن"})
+        with transaction.atomic():
+            # Another request may have written this chunk in the meantime.
+            if not Upload.objects.filter(pk=upload.pk, received=start).update(received=end + 1):
+                return self.conflict(Upload.objects.get(pk=upload.pk).received)
+            upload.received = end + 1
+            if upload.received < upload.size:
+                return Response(self.get_serializer(upload).data)
+            attachment = attach(
+                upload_path(upload.pk), upload.filename, declared_type=upload.content_type,
+                contract_id=upload.contract_id, tenant_id=upload.tenant_id, user=request.user)
+            upload.delete()
+        return Response(
+            AttachmentSerializer(attachment, context=self.get_serializer_context()).data, status=status.HTTP_201_CREATED)
+
+    def conflict(self, received):
+        return Response(
+            {'detail': "الجزء لا يبدأ من موضع الاستئناف", 'received': received}, status=status.HTTP_409_CONFLICT)
@@ -0,0 +1,26 @@
+from django.contrib import admin
+from .models import ChangeEvent, Snapshot
+
+@admin.register(ChangeEvent)
+class ChangeEventAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'object_id', 'action', 'actor', 'occurred_at']
+    list_filter = ['kind', 'action']
+    search_fields = ['=object_id']
+    raw_id_fields = ['actor']
+    list_select_related = ['actor']
+
+    # The log is append-only.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+@admin.register(Snapshot)
+class SnapshotAdmin(admin.ModelAdmin):
+    list_display = ['kind', 'object_id', 'taken_at']
+    list_filter = ['kind']
+    raw_id_fields = ['event']
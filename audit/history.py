@@ -0,0 +1,63 @@
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from .models import ChangeEvent, Snapshot
+
+SNAPSHOT_EVERY = 50
+
+
+def apply(state, event):
+    if event.action == 'delete':
+        return None
+    if event.action == 'create':
+        state = {}
+    else:
+        state = dict(state or {})
+    for name, (_, value) in event.changes.items():
+        state[name] = value
+    return state
+
+
+def replay(kind, object_id, at=None):
+    """``(state, last_event)`` of an object at ``at`` (default: now).
+
+    Starts from the newest snapshot not after ``at`` and applies only the
+    events recorded after it.
+    """
+    snapshots = Snapshot.objects.filter(kind=kind, object_id=object_id)
+    events = ChangeEvent.objects.filter(kind=kind, object_id=object_id)
+    if at is not None:
+        snapshots = snapshots.filter(taken_at__lte=at)
+        events = events.filter(occurred_at__lte=at)
+    snapshot = snapshots.select_related('event').order_by('-event_id').first()
+    state, last_event = None, None
+    if snapshot is not None:
+        state = snapshot.state
+        events = events.filter(id__gt=snapshot.event_id)
+    for event in events.order_by('id'):
+        state, last_event = apply(state, event), event
+    if last_event is None and snapshot is not None:
+        last_event = snapshot.event
+    return state, last_event
+
+
+def state_as_of(kind, object_id, at):
+    return replay(kind, object_id, at)[0]
+
+
+def take_snapshots(min_events=SNAPSHOT_EVERY):
+    """Snapshot every object with at least ``min_events`` events since its last snapshot."""
+    last_snapshot = (
+        Snapshot.objects.filter(kind=OuterRef('kind'), object_id=OuterRef('object_id'))
+        .order_by('-event_id').values('event_id')[:1])
+    due = (
+        ChangeEvent.objects.annotate(since=Coalesce(Subquery(last_snapshot), Value(0)))
+        .filter(id__gt=F('since')).values('kind', 'object_id').annotate(pending=Count('id'))
+        .filter(pending__gte=min_events).values_list('kind', 'object_id'))
+    snapshots = []
+    for kind, object_id in due:
+        state, event = replay(kind, object_id)
+        snapshots.append(Snapshot(
+            kind=kind, object_id=object_id, event=event, taken_at=event.occurred_at, state=state))
+    Snapshot.objects.bulk_create(snapshots)
+    return len(snapshots)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from audit.history import SNAPSHOT_EVERY, take_snapshots
+from contracts.scheduler import PeriodicJob
+
+
+class Command(BaseCommand):
+    help = "Snapshot objects whose change log has grown, so history lookups replay fewer events."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--min-events', type=int, default=SNAPSHOT_EVERY)
+        parser.add_argument(
+            '--every', type=int, metavar='SECONDS',
+            help="Keep running in the foreground and snapshot on this interval instead of exiting.")
+
+    def handle(self, *args, **options):
+        if not options['every']:
+            self.snapshot(options['min_events'])
+            return
+        job = PeriodicJob(lambda: self.snapshot(options['min_events']), options['every'], name='snapshot_history')
+        job.start()
+        try:
+            job.join()
+        except KeyboardInterrupt:
+            job.stop()
+
+    def snapshot(self, min_events):
+        self.stdout.write(self.style.SUCCESS(f"Took {take_snapshots(min_events)} snapshots."))
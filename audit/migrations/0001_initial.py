@@ -0,0 +1,61 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:52
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=10, verbose_name='النوع')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='المعرف')),
+                ('action', models.CharField(choices=[('create', 'إنشاء'), ('update', 'تعديل'), ('delete', 'حذف')], max_length=6, verbose_name='الإجراء')),
+                ('changes', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='التغييرات')),
+                ('occurred_at', models.DateTimeField(verbose_name='وقت التغيير')),
+                ('actor', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='المستخدم')),
+            ],
+            options={
+                'verbose_name': 'حدث تغيير',
+                'verbose_name_plural': 'سجل التغييرات',
+            },
+        ),
+        migrations.CreateModel(
+            name='Snapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=10, verbose_name='النوع')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='المعرف')),
+                ('taken_at', models.DateTimeField(verbose_name='حالة حتى')),
+                ('state', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='الحالة')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='audit.changeevent', verbose_name='آخر حدث')),
+            ],
+            options={
+                'verbose_name': 'لقطة',
+                'verbose_name_plural': 'اللقطات',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='changeevent',
+            index=models.Index(fields=['kind', 'object_id', 'id'], name='change_event_object'),
+        ),
+        migrations.AddIndex(
+            model_name='changeevent',
+            index=models.Index(fields=['occurred_at'], name='change_event_time'),
+        ),
+        migrations.AddIndex(
+            model_name='snapshot',
+            index=models.Index(fields=['kind', 'object_id', 'taken_at'], name='snapshot_object_time'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+class ChangeEvent(models.Model):
+  ACTION_CHOICES = [
+    ('create', 'إنشاء'),
+    ('update', 'تعديل'),
+    ('delete', 'حذف'),
+  ]
+  kind = models.CharField(max_length=10, verbose_name="النوع")
+  object_id = models.PositiveBigIntegerField(verbose_name="المعرف")
+  action = models.CharField(max_length=6, choices=ACTION_CHOICES, verbose_name="الإجراء")
+  changes = models.JSONField(encoder=DjangoJSONEncoder, verbose_name="التغييرات")
+  actor = models.ForeignKey(
+    settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, db_constraint=False,
+    related_name='+', verbose_name="المستخدم")
+  occurred_at = models.DateTimeField(verbose_name="وقت التغيير")
+
+  def __str__(self):
+    return f"{self.kind}:{self.object_id} {self.action}"
+
+  class Meta:
+    verbose_name = "حدث تغيير"
+    verbose_name_plural = "سجل التغييرات"
+    indexes = [
+      models.Index(fields=['kind', 'object_id', 'id'], name='change_event_object'),
+      models.Index(fields=['occurred_at'], name='change_event_time'),
+    ]
+
+class Snapshot(models.Model):
+  kind = models.CharField(max_length=10, verbose_name="النوع")
+  object_id = models.PositiveBigIntegerField(verbose_name="المعرف")
+  event = models.ForeignKey(ChangeEvent, on_delete=models.CASCADE, related_name='+', verbose_name="آخر حدث")
+  taken_at = models.DateTimeField(verbose_name="حالة حتى")
+  state = models.JSONField(encoder=DjangoJSONEncoder, null=True, verbose_name="الحالة")
+
+  def __str__(self):
+    return f"{self.kind}:{self.object_id} @ {self.taken_at}"
+
+  class Meta:
+    verbose_name = "لقطة"
+    verbose_name_plural = "اللقطات"
+    indexes = [
+      models.Index(fields=['kind', 'object_id', 'taken_at'], name='snapshot_object_time'),
+    ]
\ No newline at end of file
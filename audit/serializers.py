@@ -0,0 +1,24 @@
+from datetime import datetime, time
+
+from django.utils import timezone
+from rest_framework import serializers
+from .models import ChangeEvent
+
+
+class ChangeEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ChangeEvent
+        fields = ['id', 'action', 'changes', 'actor', 'occurred_at']
+
+
+class AsOfSerializer(serializers.Serializer):
+    """``at`` as a datetime, or a date meaning the end of that day."""
+
+    at = serializers.CharField()
+
+    def validate_at(self, value):
+        try:
+            return serializers.DateTimeField().to_internal_value(value)
+        except serializers.ValidationError:
+            day = serializers.DateField().to_internal_value(value)
+            return timezone.make_aware(datetime.combine(day, time.max))
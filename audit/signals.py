@@ -0,0 +1,29 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from real_estate_management.signals import bulk_saved
+from .tracking import KIND_BY_MODEL, deleted_event, record, remember, saved_event
+
+
+@receiver(post_init)
+def remember_loaded_values(sender, instance, **kwargs):
+    if sender in KIND_BY_MODEL:
+        remember(instance)
+
+
+@receiver(post_save)
+def log_save(sender, instance, raw=False, **kwargs):
+    if sender in KIND_BY_MODEL and not raw:
+        record([saved_event(instance)])
+
+
+@receiver(post_delete)
+def log_delete(sender, instance, **kwargs):
+    if sender in KIND_BY_MODEL:
+        record([deleted_event(instance)])
+
+
+@receiver(bulk_saved)
+def log_bulk_save(sender, instances, **kwargs):
+    if sender in KIND_BY_MODEL:
+        record([saved_event(instance) for instance in instances])
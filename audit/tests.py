@@ -0,0 +1,133 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from contracts.lifecycle import expire_leases
+from contracts.models import LeasContract
+from properties.models import Property
+from tenants.models import Tenant
+from users.models import CustomUser
+from .history import state_as_of, take_snapshots
+from .models import ChangeEvent, Snapshot
+from .tracking import PendingEvents
+
+
+class AuditFixturesMixin:
+    def create_contract(self, owner, rent='1000.00', start=date(2025, 1, 1)):
+        prop = Property.objects.create(name='عقار', propert_type='shop', description='-', address='-', owner=owner)
+        tenant = Tenant.objects.create(name='مستأجر', phone='9', email=f'{prop.pk}@example.com', address='-')
+        return LeasContract.objects.create(
+            tenant=tenant, property=prop, start_date=start, end_date=start + timedelta(days=364),
+            monthly_rent=Decimal(rent))
+
+
+class ChangeLogTests(AuditFixturesMixin, TestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.owner = CustomUser.objects.create_user(username='owner', password='x')
+
+    def test_one_insert_per_transaction(self):
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            contract = self.create_contract(self.owner)
+            contract.monthly_rent = Decimal('1200.00')
+            contract.save()
+        inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "audit_changeevent"')]
+        self.assertEqual(len(inserts), 1)
+        update = ChangeEvent.objects.get(kind='contract', action='update')
+        self.assertEqual(update.changes, {'monthly_rent': ['1000.00', '1200.00']})
+        created = ChangeEvent.objects.filter(action='create').values_list('kind', flat=True)
+        self.assertCountEqual(created, ['user', 'property', 'tenant', 'contract'])
+
+    def test_rolled_back_savepoint_is_not_logged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            prop = Property.objects.create(
+                name='قبل', propert_type='shop', description='-', address='-', owner=self.owner)
+            try:
+                with transaction.atomic():
+                    prop.name = 'ملغى'
+                    prop.save()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        self.assertEqual(list(ChangeEvent.objects.filter(kind='property').values_list('action', flat=True)),
+                         ['create'])
+
+    def test_batch_is_registered_once_and_survives_inner_rollbacks(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for i in range(20):
+                Property.objects.create(
+                    name=f'عقار {i}', propert_type='shop', description='-', address='-', owner=self.owner)
+                with self.assertRaises(RuntimeError), transaction.atomic():
+                    Tenant.objects.create(name='ملغى', phone='9', email=f'{i}@example.com', address='-')
+                    raise RuntimeError
+        batches = [callback.batch for callback in callbacks if isinstance(getattr(callback, 'batch', None), PendingEvents)]
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(ChangeEvent.objects.filter(kind='property', action='create').count(), 20)
+        self.assertFalse(ChangeEvent.objects.filter(kind='tenant').exists())
+
+    def test_passwords_are_masked_and_expiry_is_logged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.owner.set_password('new')
+            self.owner.save()
+            contract = self.create_contract(self.owner, start=date(2020, 1, 1))
+            expire_leases(None, date(2022, 1, 1))
+        self.assertEqual(ChangeEvent.objects.get(kind='user', action='update').changes, {'password': ['***', '***']})
+        expired = ChangeEvent.objects.get(kind='contract', object_id=contract.pk, action='update')
+        self.assertEqual(expired.changes, {'is_active': [True, False]})
+
+
+class TimeTravelTests(AuditFixturesMixin, TestCase):
+    def test_state_as_of_uses_snapshots(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            owner = CustomUser.objects.create_user(username='owner', password='x')
+            contract = self.create_contract(owner, rent='100.00')
+        for rent in range(101, 111):
+            with self.captureOnCommitCallbacks(execute=True):
+                contract.monthly_rent = Decimal(f'{rent}.00')
+                contract.save()
+        base = timezone.make_aware(datetime(2025, 1, 1))
+        events = ChangeEvent.objects.filter(kind='contract', object_id=contract.pk).order_by('id')
+        for day, event in enumerate(events):
+            ChangeEvent.objects.filter(pk=event.pk).update(occurred_at=base + timedelta(days=day))
+        self.assertEqual(take_snapshots(min_events=5), 1)
+        self.assertEqual(Snapshot.objects.get().state['monthly_rent'], '110.00')
+
+        self.assertIsNone(state_as_of('contract', contract.pk, base - timedelta(days=1)))
+        self.assertEqual(state_as_of('contract', contract.pk, base + timedelta(days=3))['monthly_rent'], '103.00')
+        with self.assertNumQueries(2):
+            latest = state_as_of('contract', contract.pk, base + timedelta(days=30))
+        self.assertEqual(latest['monthly_rent'], '110.00')
+
+
+class HistoryApiTests(AuditFixturesMixin, APITestCase):
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.staff = CustomUser.objects.create_user(username='staff', password='x', is_staff=True)
+            self.owner = CustomUser.objects.create_user(username='owner', password='x')
+            self.contract = self.create_contract(self.owner)
+
+    def test_history_records_the_acting_user(self):
+        self.client.force_authenticate(self.staff)
+        url = reverse('leascontract-detail', args=[self.contract.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(url, {'end_date': '2026-06-30'}, format='json')
+        rows = self.client.get(reverse('object_history', args=['contract', self.contract.pk])).json()['results']
+        self.assertEqual(rows[0]['actor'], self.staff.pk)
+        self.assertEqual(rows[0]['changes'], {'end_date': ['2025-12-31', '2026-06-30']})
+        response = self.client.get(
+            reverse('object_as_of', args=['contract', self.contract.pk]), {'at': '2000-01-01'})
+        self.assertIsNone(response.json()['state'])
+
+    def test_owners_only_see_history_of_their_objects(self):
+        other = CustomUser.objects.create_user(username='other', password='x')
+        self.client.force_authenticate(other)
+        response = self.client.get(reverse('object_history', args=['contract', self.contract.pk]))
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(reverse('object_history', args=['user', self.owner.pk]))
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,101 @@
+"""Capture field-level diffs and write them in one batch per transaction.
+
+Each tracked instance remembers the values it was loaded with (``post_init``),
+so a save is diffed without re-reading the row. Events raised inside a
+transaction are collected and written with a single ``bulk_create`` from
+``transaction.on_commit``; a rollback discards them together with the rows
+they describe.
+"""
+from contextvars import ContextVar
+
+from django.db import router, transaction
+from django.utils import timezone
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.commit_batches import batch_for
+from tenants.models import Tenant
+from users.models import CustomUser
+from .models import ChangeEvent
+
+# kind -> (model, fields left out of the log, fields whose values are masked)
+TRACKED = {
+    'property': (Property, (), ()),
+    'tenant': (Tenant, (), ()),
+    'contract': (LeasContract, (), ()),
+    'user': (CustomUser, ('last_login',), ('password',)),
+}
+KIND_BY_MODEL = {model: kind for kind, (model, _, _) in TRACKED.items()}
+MASK = '***'
+
+current_request = ContextVar('audit_request', default=None)
+
+
+def tracked_fields(model):
+    _, skipped, _ = TRACKED[KIND_BY_MODEL[model]]
+    return [field.attname for field in model._meta.concrete_fields if field.attname not in skipped]
+
+
+def field_state(instance):
+    return {name: getattr(instance, name) for name in tracked_fields(type(instance))}
+
+
+def remember(instance):
+    instance._audit_original = field_state(instance)
+
+
+def diff(instance):
+    """``(action, changes)`` since the instance was loaded or last recorded."""
+    original = getattr(instance, '_audit_original', None) or {}
+    current = field_state(instance)
+    _, _, masked = TRACKED[KIND_BY_MODEL[type(instance)]]
+    created = original.get('id') is None
+    changes = {}
+    for name, value in current.items():
+        before = None if created else original.get(name)
+        if created or before != value:
+            changes[name] = [MASK, MASK] if name in masked else [before, value]
+    return ('create' if created else 'update'), changes
+
+
+def current_actor_id():
+    request = current_request.get()
+    user = getattr(request, 'user', None)
+    return user.id if user is not None and user.is_authenticated else None
+
+
+def build_event(instance, action, changes):
+    return ChangeEvent(
+        kind=KIND_BY_MODEL[type(instance)], object_id=instance.pk, action=action, changes=changes,
+        actor_id=current_actor_id(), occurred_at=timezone.now())
+
+
+class PendingEvents:
+    def __init__(self):
+        self.events = []
+
+    def flush(self):
+        if self.events:
+            ChangeEvent.objects.bulk_create(self.events)
+
+
+def record(events):
+    events = [event for event in events if event is not None]
+    if not events:
+        return
+    connection = transaction.get_connection(router.db_for_write(ChangeEvent))
+    if connection.in_atomic_block:
+        # One batch per savepoint, so rolling a savepoint back drops just its events.
+        batch_for(connection, PendingEvents, per_savepoint=True).events.extend(events)
+    else:
+        ChangeEvent.objects.bulk_create(events)
+
+
+def saved_event(instance):
+    action, changes = diff(instance)
+    remember(instance)
+    return build_event(instance, action, changes) if changes else None
+
+
+def deleted_event(instance):
+    return build_event(instance, 'delete', {})
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import ObjectAsOfView, ObjectHistoryView
+
+urlpatterns = [
+    path('history/<str:kind>/<int:pk>/', ObjectHistoryView.as_view(), name='object_history'),
+    path('history/<str:kind>/<int:pk>/as-of/', ObjectAsOfView.as_view(), name='object_as_of'),
+]
@@ -0,0 +1,45 @@
+from django.http import Http404
+from rest_framework import generics
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from users.scopes import sees_everything
+from .history import state_as_of
+from .models import ChangeEvent
+from .serializers import AsOfSerializer, ChangeEventSerializer
+from .tracking import TRACKED
+
+
+class ObjectHistoryMixin:
+    """Resolve ``kind``/``pk`` and apply the same visibility as the object's own endpoint.
+
+    Staff can read any history, including deleted objects and users; owners
+    only that of objects they can currently see.
+    """
+
+    def check_object_access(self):
+        kind, pk = self.kwargs['kind'], self.kwargs['pk']
+        if kind not in TRACKED:
+            raise Http404
+        if sees_everything(self.request.user):
+            return kind, pk
+        manager = TRACKED[kind][0].objects
+        if not hasattr(manager, 'visible_to') or not manager.visible_to(self.request.user).filter(pk=pk).exists():
+            raise Http404
+        return kind, pk
+
+
+class ObjectHistoryView(ObjectHistoryMixin, generics.ListAPIView):
+    serializer_class = ChangeEventSerializer
+
+    def get_queryset(self):
+        kind, pk = self.check_object_access()
+        return ChangeEvent.objects.filter(kind=kind, object_id=pk)
+
+
+class ObjectAsOfView(ObjectHistoryMixin, APIView):
+    def get(self, request, kind, pk):
+        self.check_object_access()
+        params = AsOfSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        at = params.validated_data['at']
+        return Response({'kind': kind, 'id': pk, 'at': at, 'state': state_as_of(kind, pk, at)})
@@ -0,0 +1,171 @@
+"""Measure list/detail/create throughput and query counts for each viewset and admin changelist.
+
+    python benchmarks/api_throughput.py --contracts 20000 --output results.json
+    python benchmarks/api_throughput.py --compare results.json
+
+Data comes from ``bulk_io.synthetic`` in a throwaway database. Results are
+written as JSON; ``--compare`` prints the change against an earlier run and
+exits non-zero when latency grew beyond ``--tolerance`` or a scenario issues
+more queries than before.
+"""
+import argparse
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date
+from decimal import Decimal
+from itertools import count
+
+from common import throwaway_database
+import django
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from bulk_io.synthetic import Volumes, generate
+from contracts.models import LeasContract
+from properties.models import Property
+from tenants.models import Tenant
+from users.models import CustomUser
+
+ADMIN_CHANGELISTS = [
+    'admin:properties_property_changelist',
+    'admin:tenants_tenant_changelist',
+    'admin:contracts_leascontract_changelist',
+    'admin:users_customuser_changelist',
+]
+
+
+def measure(send, iterations):
+    timings = []
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response = send()
+            timings.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{response.status_code}: {response.content[:300]!r}")
+    timings.sort()
+    return {
+        'requests_per_second': round(iterations / sum(timings), 1),
+        'mean_ms': round(statistics.fmean(timings) * 1000, 3),
+        'p95_ms': round(timings[max(math.ceil(len(timings) * 0.95) - 1, 0)] * 1000, 3),
+        'queries': round(len(queries) / iterations, 2),
+    }
+
+
+def api_scenarios(client, iterations):
+    owner = CustomUser.objects.filter(is_staff=False).first()
+    tenant = Tenant.objects.first()
+    # Each created lease gets its own property so the overlap check always passes.
+    spare = iter(Property.objects.bulk_create(
+        Property(name=f'عقار قياس {i}', propert_type='apartment', description='-', address='-', owner=owner)
+        for i in range(iterations)))
+    serial = count()
+    payloads = {
+        'property': lambda: {
+            'name': f'عقار جديد {next(serial)}', 'propert_type': 'office', 'description': '-', 'address': '-',
+            'owner': owner.id},
+        'tenant': lambda: {
+            'name': 'مستأجر جديد', 'phone': '90000000', 'email': f'bench{next(serial)}@example.com', 'address': '-'},
+        'leascontract': lambda: {
+            'tenant': tenant.id, 'property': next(spare).id, 'start_date': date(2030, 1, 1),
+            'end_date': date(2030, 12, 31), 'monthly_rent': Decimal('500.00'), 'is_active': True},
+    }
+    models = {'property': Property, 'tenant': Tenant, 'leascontract': LeasContract}
+    for basename, model in models.items():
+        ids = list(model.objects.values_list('id', flat=True)[:iterations])
+        pick = iter(ids * (iterations // len(ids) + 1))
+        list_url = reverse(f'{basename}-list')
+        yield f'{basename}.list', lambda url=list_url: client.get(url)
+        yield f'{basename}.detail', lambda name=f'{basename}-detail', ids=pick: client.get(
+            reverse(name, args=[next(ids)]))
+        yield f'{basename}.create', lambda url=list_url, payload=payloads[basename]: client.post(
+            url, payload(), format='json')
+
+
+def run(volumes, iterations):
+    generate(volumes, seed=0)
+    admin = CustomUser.objects.create_superuser(username='bench-admin', password='x')
+    api = APIClient()
+    api.force_authenticate(admin)
+    browser = Client()
+    browser.force_login(admin)
+    results = {}
+    for name, send in api_scenarios(api, iterations):
+        results[name] = measure(send, iterations)
+    for url_name in ADMIN_CHANGELISTS:
+        url = reverse(url_name)
+        results[url_name.split(':')[1]] = measure(lambda url=url: browser.get(url), max(iterations // 5, 1))
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(previous, current, tolerance):
+    regressions = []
+    print(f"{'scenario':<44}{'mean ms':>10}{'before':>10}{'change':>9}{'queries':>9}{'before':>8}")
+    for name, now in current.items():
+        then = previous.get(name)
+        if then is None:
+            continue
+        change = now['mean_ms'] / then['mean_ms'] - 1 if then['mean_ms'] else 0
+        print(f"{name:<44}{now['mean_ms']:>10.2f}{then['mean_ms']:>10.2f}{change:>+9.0%}"
+              f"{now['queries']:>9.2f}{then['queries']:>8.2f}")
+        if change > tolerance or now['queries'] > then['queries']:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    defaults = Volumes()
+    parser.add_argument('--owners', type=int, default=defaults.owners)
+    parser.add_argument('--properties', type=int, default=defaults.properties)
+    parser.add_argument('--tenants', type=int, default=defaults.tenants)
+    parser.add_argument('--contracts', type=int, default=defaults.contracts)
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--output', help="Write results to this JSON file.")
+    parser.add_argument('--compare', metavar='PATH', help="Earlier results file to compare against.")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative slowdown (default 0.2).")
+    args = parser.parse_args()
+
+    volumes = Volumes(args.owners, args.properties, args.tenants, args.contracts)
+    with throwaway_database():
+        results = run(volumes, args.iterations)
+    report = {
+        'meta': {
+            'revision': git_revision(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(), 'django': django.get_version(), 'database': connection.vendor,
+            'volumes': vars(volumes), 'iterations': args.iterations,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=2)
+    if args.compare:
+        with open(args.compare) as fp:
+            previous = json.load(fp)
+        regressions = compare(previous['results'], results, args.tolerance)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            sys.exit(1)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
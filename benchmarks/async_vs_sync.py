@@ -0,0 +1,63 @@
+"""Compare the sync DRF viewsets with the async read views under concurrency.
+
+Requests go through Django's ASGI handler in-process, so this compares
+views, not web servers. Every client sends a bearer token for the seeded
+owner, so both sides pay for authentication and owner scoping.
+
+    python benchmarks/async_vs_sync.py --clients 50 --requests 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from common import seed, throwaway_database
+from django.test import AsyncClient
+
+from contracts.models import LeasContract
+from users.serializers import ClaimsTokenObtainPairSerializer
+
+ENDPOINTS = {
+    'properties list': ('/api/properties/?page_size=50', '/api/async/properties/?page_size=50'),
+    'tenants list': ('/api/tenants/?page_size=50', '/api/async/tenants/?page_size=50'),
+    'contract detail': ('/api/contracts/{contract}/', '/api/async/contracts/{contract}/'),
+}
+
+
+async def client_loop(url, header, requests, latencies):
+    client = AsyncClient()
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(url, headers={'Authorization': header})
+        latencies.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.status_code
+
+
+async def run(url, header, clients, requests):
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop(url, header, requests, latencies) for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) > 1 else latencies[0]
+    return len(latencies) / elapsed, p99 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=5000)
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=20, help="Requests per client.")
+    args = parser.parse_args()
+    with throwaway_database():
+        owner, _, _ = seed(args.contracts)
+        header = f'Bearer {ClaimsTokenObtainPairSerializer.get_token(owner).access_token}'
+        contract = LeasContract.objects.filter(property__owner=owner).values_list('pk', flat=True).first()
+        print(f"{'endpoint':<18}{'mode':<7}{'req/s':>10}{'p99 ms':>10}")
+        for name, urls in ENDPOINTS.items():
+            for mode, url in zip(('sync', 'async'), urls):
+                rps, p99 = asyncio.run(run(url.format(contract=contract), header, args.clients, args.requests))
+                print(f"{name:<18}{mode:<7}{rps:>10.1f}{p99:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Measure per-request authentication cost for each supported mode.
+
+    python benchmarks/auth_overhead.py --iterations 2000
+"""
+import argparse
+import time
+
+from common import throwaway_database
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+
+from users.models import CustomUser
+from users.serializers import ClaimsTokenObtainPairSerializer
+
+
+def measure(authenticator, header, iterations):
+    factory = APIRequestFactory()
+    requests = [Request(factory.get('/', HTTP_AUTHORIZATION=header)) for _ in range(iterations)]
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for request in requests:
+            user, _ = authenticator.authenticate(request)
+            user.is_staff  # noqa: B018 -- what the permission classes read
+        elapsed = time.perf_counter() - started
+    return elapsed / iterations * 1e6, len(queries) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+    with throwaway_database():
+        user = CustomUser.objects.create_user(username='bench', password='x', is_staff=True)
+        header = f'Bearer {ClaimsTokenObtainPairSerializer.get_token(user).access_token}'
+        print(f"{'mode':<28}{'us/request':>12}{'queries/request':>17}")
+        for name, authenticator in [
+            ('JWT + user lookup', JWTAuthentication()),
+            ('JWT stateless (claims)', JWTStatelessUserAuthentication()),
+        ]:
+            micros, queries = measure(authenticator, header, args.iterations)
+            print(f"{name:<28}{micros:>12.1f}{queries:>17.2f}")
+
+
+if __name__ == '__main__':
+    main()
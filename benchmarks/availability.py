@@ -0,0 +1,59 @@
+"""Time the vacancy anti-join against filtering contracts in Python.
+
+    python benchmarks/availability.py --contracts 100000
+"""
+import argparse
+import time
+from datetime import date, timedelta
+
+from common import seed, throwaway_database
+
+from contracts.models import LeasContract
+from properties.availability import next_free_date, vacant_between
+from properties.models import Property
+
+RANGES = [(date(2021, 1, 1) + timedelta(days=30 * i), date(2021, 1, 31) + timedelta(days=30 * i)) for i in range(20)]
+
+
+def timed(run, repeat=5):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = run()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def vacant_in_python(start, end, property_type):
+    """What clients do today: pull every active lease and check overlap themselves."""
+    leased = {
+        property_id for property_id, lease_start, lease_end
+        in LeasContract.objects.filter(is_active=True).values_list('property_id', 'start_date', 'end_date')
+        if lease_start <= end and lease_end >= start}
+    return {pk for pk in Property.objects.filter(propert_type=property_type).values_list('pk', flat=True)
+            if pk not in leased}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=100000)
+    args = parser.parse_args()
+    with throwaway_database():
+        seed(args.contracts)
+        start, end = RANGES[5]
+        query = vacant_between(Property.objects.all(), start, end, 'apartment').values_list('pk', flat=True)
+        anti_join_ms, vacant = timed(lambda: set(query.all()))
+        python_ms, expected = timed(lambda: vacant_in_python(start, end, 'apartment'))
+        assert vacant == expected
+        print(f"{'vacant apartments, one range':<40}{anti_join_ms:>9.1f} ms  (python filter {python_ms:.1f} ms)")
+        print(query.explain())
+
+        bulk_ms, _ = timed(lambda: [
+            list(vacant_between(Property.objects.all(), s, e).values_list('pk', flat=True)) for s, e in RANGES])
+        print(f"{f'{len(RANGES)} ranges, all types':<40}{bulk_ms:>9.1f} ms")
+
+        pks = list(Property.objects.order_by('?').values_list('pk', flat=True)[:1000])
+        free_ms, _ = timed(lambda: [next_free_date(pk, date(2021, 3, 1)) for pk in pks], repeat=1)
+        print(f"{'next free date, per property':<40}{free_ms / len(pks):>9.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
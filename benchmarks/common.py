@@ -0,0 +1,59 @@
+"""Shared setup for the scripts in this directory.
+
+Each script runs against a throwaway test database, so it never touches
+``db.sqlite3``.
+"""
+import os
+import random
+import sys
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'real_estate_management.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+
+class throwaway_database:
+    def __enter__(self):
+        self.old_name = connection.creation.create_test_db(verbosity=0)
+
+    def __exit__(self, *exc_info):
+        connection.creation.destroy_test_db(self.old_name, verbosity=0)
+
+
+def seed(contracts):
+    """Insert ``contracts`` leases over ``contracts / 4`` properties, one active per property.
+
+    Returns a sample ``(owner, property, tenant)`` for targeted lookups.
+    """
+    from contracts.models import LeasContract
+    from properties.models import Property
+    from tenants.models import Tenant
+    from users.models import CustomUser
+
+    random.seed(0)
+    owners = CustomUser.objects.bulk_create(
+        CustomUser(username=f'owner{i}') for i in range(max(contracts // 200, 1)))
+    properties = Property.objects.bulk_create(
+        Property(name=f'عقار {i}', propert_type=random.choice(['apartment', 'office', 'shop']),
+                 description='-', address='-', owner=random.choice(owners))
+        for i in range(contracts // 4 or 1))
+    tenants = Tenant.objects.bulk_create(
+        Tenant(name=f'مستأجر {i}', phone='0500000000', email=f't{i}@example.com', address='-')
+        for i in range(contracts))
+    rows = []
+    for i, tenant in enumerate(tenants):
+        start = date(2018, 1, 1) + timedelta(days=365 * (i % 4))
+        rows.append(LeasContract(
+            tenant=tenant, property=properties[i // 4 % len(properties)], start_date=start,
+            end_date=start + timedelta(days=364), monthly_rent=Decimal('2000.00'),
+            is_active=i % 4 == 3))
+    LeasContract.objects.bulk_create(rows, batch_size=2000)
+    return owners[0], properties[0], tenants[-1]
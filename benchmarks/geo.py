@@ -0,0 +1,64 @@
+"""Time geohash-indexed spatial queries against scanning every property.
+
+    python benchmarks/geo.py --contracts 400000
+"""
+import argparse
+import random
+import time
+
+from common import seed, throwaway_database
+
+from properties import geo
+from properties.models import Property
+
+CENTRE = (23.6, 58.4)
+
+
+def timed(run, repeat=5):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = run()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def scatter():
+    """Spread the seeded properties over northern Oman."""
+    rng = random.Random(0)
+    batch = []
+    for prop in Property.objects.iterator(chunk_size=5000):
+        prop.latitude, prop.longitude = rng.uniform(22.5, 24.8), rng.uniform(56.0, 59.8)
+        geo.locate(prop)
+        batch.append(prop)
+    Property.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'], batch_size=2000)
+    return len(batch)
+
+
+def scan_radius(km):
+    """What the map UI does today: fetch every property and filter the coordinates."""
+    rows = Property.objects.values_list('pk', 'latitude', 'longitude')
+    return sorted(pk for pk, lat, lon in rows if geo.haversine_km(*CENTRE, lat, lon) <= km)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=400000)
+    args = parser.parse_args()
+    with throwaway_database():
+        seed(args.contracts)
+        print(f"{scatter()} properties")
+        for km in (1, 5, 25):
+            indexed_ms, found = timed(lambda km=km: sorted(
+                geo.within_radius(Property.objects.all(), *CENTRE, km).values_list('pk', flat=True)))
+            scan_ms, expected = timed(lambda km=km: scan_radius(km))
+            assert found == expected
+            print(f"{f'radius {km} km ({len(found)} found)':<32}{indexed_ms:>9.1f} ms  (full scan {scan_ms:.1f} ms)")
+        box = (23.5, 58.3, 23.7, 58.5)
+        box_ms, _ = timed(lambda: list(geo.within_box(Property.objects.all(), *box).values_list('pk', flat=True)))
+        print(f"{'bounding box 0.2 x 0.2 deg':<32}{box_ms:>9.1f} ms")
+        nearest_ms, _ = timed(lambda: geo.nearest(Property.objects.all(), *CENTRE, 10))
+        print(f"{'10 nearest':<32}{nearest_ms:>9.1f} ms")
+        print(geo.within_radius(Property.objects.all(), *CENTRE, 5).explain())
+
+
+if __name__ == '__main__':
+    main()
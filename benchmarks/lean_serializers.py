@@ -0,0 +1,48 @@
+"""Compare ModelSerializer list rendering with the lean ``.values()`` encoder.
+
+    python benchmarks/lean_serializers.py --contracts 20000 --rows 1000
+"""
+import argparse
+import time
+
+from common import seed, throwaway_database
+from rest_framework.renderers import JSONRenderer
+
+from contracts.serializers import LeasContractSerialiser
+from properties.serialisers import PropertySerialiser
+from real_estate_management.lean import encoder_for
+from tenants.serialisers import TenantSerializer
+
+
+def best_of(repeat, render):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = render()
+        timings.append(time.perf_counter() - started)
+    return min(timings), body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=20000)
+    parser.add_argument('--rows', type=int, default=1000, help="Rows per rendered page.")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    renderer = JSONRenderer()
+    with throwaway_database():
+        seed(args.contracts)
+        print(f"{'serializer':<26}{'ModelSerializer ms':>20}{'lean ms':>10}{'speedup':>9}")
+        for serializer_class in (PropertySerialiser, TenantSerializer, LeasContractSerialiser):
+            queryset = serializer_class.Meta.model.objects.order_by('-id')[:args.rows]
+            encoder = encoder_for(serializer_class)
+            slow, expected = best_of(args.repeat, lambda serializer_class=serializer_class, queryset=queryset: (
+                renderer.render(serializer_class(queryset.all(), many=True).data)))
+            fast, body = best_of(args.repeat, lambda encoder=encoder, queryset=queryset: (
+                renderer.render(encoder.encode_many(queryset.values(*encoder.columns)))))
+            assert body == expected, f"{serializer_class.__name__} output differs"
+            print(f"{serializer_class.__name__:<26}{slow * 1000:>20.1f}{fast * 1000:>10.1f}{slow / fast:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
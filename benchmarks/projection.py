@@ -0,0 +1,59 @@
+"""Time the NumPy rent projection against the plain-Python reference.
+
+    python benchmarks/projection.py --contracts 40000 --months 60
+"""
+import argparse
+import random
+import time
+from datetime import date
+from decimal import Decimal
+
+from common import seed, throwaway_database
+
+from analytics import projection
+from contracts.models import CpiIndex, LeasContract
+
+
+def timed(run, repeat=3):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = run()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def add_terms():
+    random.seed(1)
+    contracts = list(LeasContract.objects.filter(is_active=True))
+    for contract in contracts:
+        contract.escalation = random.choice(['none', 'fixed', 'cpi'])
+        contract.escalation_rate = Decimal('5.00')
+        contract.escalation_every_months = random.choice([6, 12])
+        contract.end_date = contract.end_date.replace(year=contract.end_date.year + 4)
+    LeasContract.objects.bulk_update(
+        contracts, ['escalation', 'escalation_rate', 'escalation_every_months', 'end_date'], batch_size=2000)
+    CpiIndex.objects.bulk_create(
+        CpiIndex(month=date(2021 + i // 12, i % 12 + 1, 1), value=Decimal(100 + i * 0.3).quantize(Decimal('0.001')))
+        for i in range(60))
+    return len(contracts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=40000)
+    parser.add_argument('--months', type=int, default=60)
+    args = parser.parse_args()
+    with throwaway_database():
+        seed(args.contracts)
+        active = add_terms()
+        start = date(2021, 1, 1)
+        print(f"{active} active contracts, {args.months} months")
+        python_ms, expected = timed(
+            lambda: projection.project(start, args.months, projector=projection.project_reference))
+        print(f"{'pure python':<20}{python_ms:>9.1f} ms")
+        numpy_ms, result = timed(lambda: projection.project(start, args.months))
+        assert result == expected
+        print(f"{'numpy':<20}{numpy_ms:>9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Print query plans for the hot contract/property/tenant lookups before and
+after the ``query_indexes`` migrations, on a throwaway seeded database.
+
+    python benchmarks/query_plans.py --contracts 20000
+"""
+import argparse
+import time
+from datetime import date
+
+from common import seed, throwaway_database
+from django.core.management import call_command
+
+from contracts.models import LeasContract
+from properties.models import Property
+from tenants.models import Tenant
+
+BEFORE = [('contracts', '0002'), ('properties', '0002'), ('tenants', '0001')]
+# Columns that exist at the BEFORE migrations; later ones (escalation terms,
+# coordinates) would not be there to select.
+CONTRACT_COLUMNS = ('id', 'tenant_id', 'property_id', 'start_date', 'end_date', 'monthly_rent', 'is_active')
+PROPERTY_COLUMNS = ('id', 'name', 'propert_type', 'description', 'address', 'owner_id')
+TENANT_COLUMNS = ('id', 'name', 'phone', 'email', 'address')
+
+
+def workload(owner, prop, tenant):
+    today = date(2021, 6, 1)
+    contracts = LeasContract.objects.values(*CONTRACT_COLUMNS)
+    return {
+        'active contracts for property on date': contracts.filter(
+            is_active=True, property=prop, start_date__lte=today, end_date__gte=today),
+        'admin changelist: active, by start_date': contracts.filter(
+            is_active=True, start_date__gte=today).order_by('-start_date'),
+        'cursor page by start_date': contracts.order_by('-start_date', '-id')[:100],
+        "owner's shops": Property.objects.filter(owner=owner, propert_type='shop').values(*PROPERTY_COLUMNS),
+        'tenant by name': Tenant.objects.filter(name=tenant.name).values(*TENANT_COLUMNS),
+    }
+
+
+def report(label, queries):
+    print(f'\n=== {label}')
+    for name, queryset in queries.items():
+        started = time.perf_counter()
+        for _ in range(20):
+            list(queryset.all())
+        elapsed = (time.perf_counter() - started) / 20 * 1000
+        print(f'\n-- {name} ({elapsed:.2f} ms)')
+        print(queryset.explain())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=20000)
+    args = parser.parse_args()
+    with throwaway_database():
+        queries = workload(*seed(args.contracts))
+        report('after', queries)
+        for app, migration in BEFORE:
+            call_command('migrate', app, migration, verbosity=0)
+        report('before', queries)
+        call_command('migrate', verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
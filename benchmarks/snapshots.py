@@ -0,0 +1,74 @@
+"""Time the property snapshot table against joining the current lease on every read.
+
+    python benchmarks/snapshots.py --contracts 400000
+"""
+import argparse
+import time
+from datetime import date
+
+from common import seed, throwaway_database
+
+from django.db.models import OuterRef, Subquery
+
+from contracts.models import LeasContract
+from properties.models import Property
+from snapshots import maintenance
+from snapshots.models import PropertySnapshot
+
+# The seeded leases run 2018-2021.
+TODAY = date(2021, 6, 1)
+
+
+def timed(run, repeat=5):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = run()
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+
+def joined(owner_id, limit):
+    """What the screens do without snapshots: pick the current lease for each property."""
+    current = LeasContract.objects.filter(
+        property=OuterRef('pk'), is_active=True, start_date__lte=TODAY, end_date__gte=TODAY).order_by('start_date')
+    rows = (
+        Property.objects.filter(owner_id=owner_id)
+        .annotate(
+            contract_id=Subquery(current.values('pk')[:1]),
+            tenant_name=Subquery(current.values('tenant__name')[:1]),
+            monthly_rent=Subquery(current.values('monthly_rent')[:1]),
+            lease_end=Subquery(current.values('end_date')[:1]))
+        .order_by('-pk')
+        .values_list('pk', 'contract_id', 'tenant_name', 'monthly_rent', 'lease_end')[:limit])
+    return list(rows)
+
+
+def snapshot(owner_id, limit):
+    rows = (
+        PropertySnapshot.objects.filter(owner_id=owner_id).order_by('-property_id')
+        .values_list('property_id', 'contract_id', 'tenant_name', 'monthly_rent', 'lease_end')[:limit])
+    return list(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--contracts', type=int, default=400000)
+    parser.add_argument('--limit', type=int, default=100)
+    args = parser.parse_args()
+    with throwaway_database():
+        owner, _, _ = seed(args.contracts)
+        started = time.perf_counter()
+        built = maintenance.rebuild(today=TODAY)
+        print(f"rebuilt {built} snapshots in {(time.perf_counter() - started) * 1000:.0f} ms")
+        joined_ms, expected = timed(lambda: joined(owner.pk, args.limit))
+        snapshot_ms, found = timed(lambda: snapshot(owner.pk, args.limit))
+        assert found == expected
+        print(f"{'joined (one owner)':<24}{joined_ms:>9.1f} ms")
+        print(f"{'snapshot (one owner)':<24}{snapshot_ms:>9.1f} ms")
+        started = time.perf_counter()
+        missing, wrong = maintenance.check(today=TODAY)
+        print(f"consistency check in {(time.perf_counter() - started) * 1000:.0f} ms: {len(missing) + len(wrong)} drifted")
+        print(PropertySnapshot.objects.filter(owner_id=owner.pk).order_by('-property_id')[:args.limit].explain())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+
+from rest_framework.utils.encoders import JSONEncoder
+
+FORMATS = ('csv', 'ndjson')
+CONTENT_TYPES = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+
+
+class RowError(ValueError):
+    pass
+
+
+def guess_format(filename, default='csv'):
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    return {'csv': 'csv', 'ndjson': 'ndjson', 'jsonl': 'ndjson'}.get(extension, default)
+
+
+def read_rows(stream, fmt):
+    """Yield one dict per record, or a ``RowError`` for unparseable lines.
+
+    ``stream`` is a binary file object and is consumed lazily.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    if fmt == 'csv':
+        yield from csv.DictReader(text)
+        return
+    for line in text:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield RowError(f"Invalid JSON: {exc.msg}")
+            continue
+        yield record if isinstance(record, dict) else RowError("Expected a JSON object.")
+
+
+class Echo:
+    def write(self, value):
+        return value
+
+
+def write_rows(rows, columns, fmt):
+    """Yield encoded lines for ``rows`` (an iterable of dicts)."""
+    if fmt == 'csv':
+        writer = csv.writer(Echo())
+        yield writer.writerow(columns)
+        for row in rows:
+            yield writer.writerow([row[column] for column in columns])
+        return
+    encoder = JSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(row) + '\n'
@@ -0,0 +1,102 @@
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+from rest_framework.exceptions import ValidationError
+
+from real_estate_management.signals import bulk_saved
+from .formats import RowError
+
+DEFAULT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, row, detail):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': row, 'errors': detail})
+
+    def as_dict(self):
+        return {'created': self.created, 'updated': self.updated, 'failed': self.failed, 'errors': self.errors}
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def import_records(resource, records, batch_size=DEFAULT_BATCH_SIZE):
+    """Validate and upsert ``records`` (dicts or ``RowError``) batch by batch.
+
+    Rows are numbered from 1. Failing rows are reported and skipped; the rest
+    of their batch is still written.
+    """
+    report = ImportReport()
+    serializer = resource.serializer_class(context={'lookups': {}})
+    for batch in batched(enumerate(records, start=1), batch_size):
+        import_batch(resource, serializer, batch, report)
+    return report
+
+
+def import_batch(resource, serializer, batch, report):
+    rows = []
+    for number, record in batch:
+        if isinstance(record, RowError):
+            report.add_error(number, {'non_field_errors': [str(record)]})
+        else:
+            rows.append((number, resource.prepare(record)))
+    serializer.context['lookups'] = resource.lookups([row for _, row in rows])
+
+    valid, seen = [], set()
+    for number, row in rows:
+        try:
+            data = serializer.run_validation(row)
+        except ValidationError as exc:
+            report.add_error(number, exc.detail)
+            continue
+        key = resource.natural_key(data)
+        if key in seen:
+            report.add_error(number, {'non_field_errors': ["Duplicate of an earlier row in the same batch."]})
+            continue
+        seen.add(key)
+        valid.append((number, key, data))
+
+    existing = resource.existing({key for _, key, _ in valid}) if valid else {}
+    items = [(number, data, existing.get(key)) for number, key, data in valid]
+    conflicts = resource.check_batch(items) if items else {}
+
+    created, updated, numbers = [], [], []
+    for number, data, obj in items:
+        if number in conflicts:
+            report.add_error(number, {'non_field_errors': [conflicts[number]]})
+            continue
+        if obj is None:
+            created.append(resource.model(**data))
+        else:
+            for name, value in data.items():
+                setattr(obj, name, value)
+            updated.append(obj)
+        numbers.append(number)
+
+    manager = resource.model.objects
+    writable = [name for name, field in serializer.fields.items() if not field.read_only]
+    try:
+        with transaction.atomic():
+            manager.bulk_create(created)
+            if updated:
+                manager.bulk_update(updated, fields=writable)
+            # Receivers keep derived data (audit, search, snapshots) in the same transaction.
+            bulk_saved.send(sender=resource.model, instances=created + updated)
+    except IntegrityError as exc:
+        for number in numbers:
+            report.add_error(number, {'non_field_errors': [str(exc)]})
+        return
+    report.created += len(created)
+    report.updated += len(updated)
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from bulk_io.formats import FORMATS, write_rows
+from bulk_io.resources import RESOURCES
+
+
+class Command(BaseCommand):
+    help = "Stream tenants, properties or contracts as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument('resource', choices=sorted(RESOURCES))
+        parser.add_argument('--type', choices=FORMATS, default='csv')
+        parser.add_argument('--output', help="Destination file (defaults to stdout).")
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        resource = RESOURCES[options['resource']]
+        lines = write_rows(resource.export_rows(options['chunk_size']), resource.columns, options['type'])
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                output.writelines(lines)
+        else:
+            for line in lines:
+                self.stdout.write(line, ending='')
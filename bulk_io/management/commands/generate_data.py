@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from bulk_io.synthetic import DEFAULT_BATCH_SIZE, Volumes, generate
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic owners, properties, tenants and leases with Arabic names for load testing."
+
+    def add_arguments(self, parser):
+        defaults = Volumes()
+        parser.add_argument('--owners', type=int, default=defaults.owners)
+        parser.add_argument('--properties', type=int, default=defaults.properties)
+        parser.add_argument('--tenants', type=int, default=defaults.tenants)
+        parser.add_argument('--contracts', type=int, default=defaults.contracts)
+        parser.add_argument('--seed', type=int, default=0, help="Random seed; the same seed reproduces the same data.")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        volumes = Volumes(options['owners'], options['properties'], options['tenants'], options['contracts'])
+        if min(vars(volumes).values()) < 0:
+            raise CommandError("Volumes must not be negative.")
+        if volumes.properties and not volumes.owners:
+            raise CommandError("Properties need at least one owner.")
+        created = generate(volumes, seed=options['seed'], batch_size=options['batch_size'])
+        summary = ', '.join(f"{len(rows)} {model._meta.verbose_name_plural}" for model, rows in created.items())
+        self.stdout.write(self.style.SUCCESS(f"Created {summary}."))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from bulk_io.formats import FORMATS, guess_format, read_rows
+from bulk_io.importer import DEFAULT_BATCH_SIZE, import_records
+from bulk_io.resources import RESOURCES
+
+
+class Command(BaseCommand):
+    help = "Import tenants, properties or contracts from a CSV or NDJSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('resource', choices=sorted(RESOURCES))
+        parser.add_argument('path')
+        parser.add_argument('--type', choices=FORMATS, help="Input format (defaults to the file extension).")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        fmt = options['type'] or guess_format(options['path'])
+        try:
+            with open(options['path'], 'rb') as stream:
+                report = import_records(
+                    RESOURCES[options['resource']], read_rows(stream, fmt), batch_size=options['batch_size'])
+        except OSError as exc:
+            raise CommandError(exc) from exc
+        for error in report.errors:
+            self.stderr.write(f"row {error['row']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {report.created}, updated {report.updated}, failed {report.failed}."))
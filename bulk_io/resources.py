@@ -0,0 +1,139 @@
+from django.db.models import F
+
+from contracts.models import LeasContract
+from properties.models import Property
+from tenants.models import Tenant
+from users.models import CustomUser
+from .serializers import LeasContractImportSerializer, PropertyImportSerializer, TenantImportSerializer
+
+
+class Resource:
+    """How one model is imported and exported by natural key.
+
+    Every hook that touches the database runs once per batch, never per row.
+    """
+
+    model = None
+    serializer_class = None
+    columns = ()
+
+    def prepare(self, row):
+        return row
+
+    def lookups(self, rows):
+        return {}
+
+    def natural_key(self, data):
+        raise NotImplementedError
+
+    def existing(self, keys):
+        raise NotImplementedError
+
+    def check_batch(self, items):
+        """Return ``{index: message}`` for items that conflict with each other or stored rows."""
+        return {}
+
+    def export_rows(self, chunk_size):
+        raise NotImplementedError
+
+
+class TenantResource(Resource):
+    model = Tenant
+    serializer_class = TenantImportSerializer
+    columns = ('name', 'phone', 'email', 'address')
+
+    def natural_key(self, data):
+        return data['email']
+
+    def existing(self, keys):
+        return {obj.email: obj for obj in Tenant.objects.filter(email__in=keys)}
+
+    def export_rows(self, chunk_size):
+        rows = Tenant.objects.order_by('pk').values(*self.columns)
+        return rows.iterator(chunk_size=chunk_size)
+
+
+class PropertyResource(Resource):
+    model = Property
+    serializer_class = PropertyImportSerializer
+    columns = ('name', 'propert_type', 'description', 'address', 'owner')
+
+    def lookups(self, rows):
+        usernames = {row.get('owner') for row in rows}
+        return {'owner': {user.username: user for user in CustomUser.objects.filter(username__in=usernames)}}
+
+    def natural_key(self, data):
+        return data['name'], data['owner'].pk
+
+    def existing(self, keys):
+        names, owners = {name for name, _ in keys}, {owner for _, owner in keys}
+        found = Property.objects.filter(name__in=names, owner_id__in=owners)
+        return {(obj.name, obj.owner_id): obj for obj in found}
+
+    def export_rows(self, chunk_size):
+        rows = Property.objects.order_by('pk').values(
+            'name', 'propert_type', 'description', 'address', owner_username=F('owner__username'))
+        for row in rows.iterator(chunk_size=chunk_size):
+            row['owner'] = row.pop('owner_username')
+            yield row
+
+
+class LeasContractResource(Resource):
+    model = LeasContract
+    serializer_class = LeasContractImportSerializer
+    columns = (
+        'tenant', 'property', 'owner', 'start_date', 'end_date', 'monthly_rent', 'is_active',
+        'escalation', 'escalation_rate', 'escalation_every_months',
+    )
+
+    def prepare(self, row):
+        # A property is identified by its name together with its owner's username.
+        row = {**row, 'property': (row.get('property'), row.get('owner'))}
+        if row.get('escalation_rate') == '':
+            # CSV writes a missing rate as an empty cell.
+            row['escalation_rate'] = None
+        return row
+
+    def lookups(self, rows):
+        emails = {row.get('tenant') for row in rows}
+        names = {row['property'][0] for row in rows}
+        usernames = {row['property'][1] for row in rows}
+        properties = Property.objects.filter(name__in=names, owner__username__in=usernames).select_related('owner')
+        return {
+            'tenant': {obj.email: obj for obj in Tenant.objects.filter(email__in=emails)},
+            'property': {(obj.name, obj.owner.username): obj for obj in properties},
+        }
+
+    def natural_key(self, data):
+        return data['tenant'].pk, data['property'].pk, data['start_date']
+
+    def existing(self, keys):
+        tenants, properties = {key[0] for key in keys}, {key[1] for key in keys}
+        found = LeasContract.objects.filter(tenant_id__in=tenants, property_id__in=properties)
+        return {(obj.tenant_id, obj.property_id, obj.start_date): obj for obj in found}
+
+    def check_batch(self, items):
+        """Reject active leases that overlap a stored lease or an earlier row of the batch."""
+        clashes = LeasContract.objects.batch_overlaps(
+            [(index, data['property'].pk, data['start_date'], data['end_date'])
+             for index, data, _ in items if data.get('is_active', True)],
+            rewritten={obj.pk for _, _, obj in items if obj is not None})
+        return {index: "يوجد عقد نشط آخر لهذا العقار في نفس الفترة" for index in clashes}
+
+    def export_rows(self, chunk_size):
+        rows = LeasContract.objects.order_by('pk').values(
+            'start_date', 'end_date', 'monthly_rent', 'is_active', 'escalation', 'escalation_rate',
+            'escalation_every_months', tenant_email=F('tenant__email'),
+            property_name=F('property__name'), owner_username=F('property__owner__username'))
+        for row in rows.iterator(chunk_size=chunk_size):
+            row['tenant'] = row.pop('tenant_email')
+            row['property'] = row.pop('property_name')
+            row['owner'] = row.pop('owner_username')
+            yield row
+
+
+RESOURCES = {
+    'tenants': TenantResource(),
+    'properties': PropertyResource(),
+    'contracts': LeasContractResource(),
+}
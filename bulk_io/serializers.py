@@ -0,0 +1,52 @@
+from rest_framework import serializers
+from contracts.models import LeasContract
+from contracts.serializers import LeasContractBulkSerializer
+from properties.models import Property
+from properties.serialisers import PropertySerialiser
+from tenants.models import Tenant
+from tenants.serialisers import TenantSerializer
+from users.models import CustomUser
+
+class NaturalKeyField(serializers.RelatedField):
+    """Resolve a natural key through a lookup table prepared once per batch."""
+
+    default_error_messages = {
+        'does_not_exist': 'No match for "{value}".',
+        'incomplete': 'Every part of the key is required ({value}).',
+    }
+
+    def __init__(self, lookup, **kwargs):
+        self.lookup = lookup
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        value = ' / '.join(map(str, data)) if isinstance(data, tuple) else data
+        if isinstance(data, tuple) and any(part in (None, '') for part in data):
+            self.fail('incomplete', value=value)
+        try:
+            return self.context['lookups'][self.lookup][data]
+        except (KeyError, TypeError):
+            self.fail('does_not_exist', value=value)
+
+    def to_representation(self, value):
+        return str(value)
+
+
+class TenantImportSerializer(TenantSerializer):
+    class Meta(TenantSerializer.Meta):
+        # Email is the upsert key, so uniqueness is handled by the importer.
+        extra_kwargs = {'email': {'validators': []}}
+
+
+class PropertyImportSerializer(PropertySerialiser):
+    owner = NaturalKeyField('owner', queryset=CustomUser.objects.all())
+
+
+class LeasContractImportSerializer(LeasContractBulkSerializer):
+    """Checks each row's terms; overlaps are checked for the whole batch by the importer."""
+
+    tenant = NaturalKeyField('tenant', queryset=Tenant.objects.all())
+    property = NaturalKeyField('property', queryset=Property.objects.all())
+
+    class Meta(LeasContractBulkSerializer.Meta):
+        model = LeasContract
\ No newline at end of file
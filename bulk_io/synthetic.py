@@ -0,0 +1,139 @@
+"""Synthetic owners, properties, tenants and leases for load testing and benchmarks.
+
+Everything is written with ``bulk_create`` and a seeded ``random.Random`` so
+the same arguments always produce the same data set. Leases on a property are
+chained back to back, so at most one of them is active at any date and the
+overlap constraint holds.
+"""
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Max
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.signals import bulk_saved
+from tenants.models import Tenant
+from users.models import CustomUser
+
+DEFAULT_BATCH_SIZE = 1000
+
+FIRST_NAMES = [
+    'محمد', 'أحمد', 'علي', 'عبدالله', 'خالد', 'سعيد', 'يوسف', 'حمد', 'سالم', 'راشد',
+    'فاطمة', 'مريم', 'عائشة', 'نورة', 'سارة', 'ليلى', 'هدى', 'زينب', 'خديجة', 'أمل',
+]
+FAMILY_NAMES = [
+    'البلوشي', 'الحارثي', 'الهنائي', 'الكندي', 'الريامي', 'العبري', 'السيابي', 'المعمري',
+    'الشامسي', 'الزعابي', 'القاسمي', 'العلوي', 'الراشدي', 'الغافري', 'البوسعيدي',
+]
+CITIES = {
+    'مسقط': ['الخوير', 'القرم', 'بوشر', 'العذيبة', 'الموالح', 'روي'],
+    'صحار': ['الطريف', 'الملتقى', 'فلج القبائل'],
+    'نزوى': ['فرق', 'تنوف', 'كرشا'],
+    'صلالة': ['الحافة', 'الدهاريز', 'عوقد'],
+}
+BUILDING_WORDS = ['برج', 'عمارة', 'مجمع', 'فيلا', 'سكن', 'مركز']
+DESCRIPTIONS = {
+    'apartment': ['شقة بغرفتين وصالة', 'شقة ثلاث غرف مع موقف', 'شقة مفروشة قريبة من الخدمات'],
+    'office': ['مكتب إداري بمساحة مفتوحة', 'مكتب مع قاعة اجتماعات', 'مكتب في الطابق الأرضي'],
+    'shop': ['محل تجاري على الشارع الرئيسي', 'محل داخل مجمع تجاري', 'محل بواجهة زجاجية'],
+}
+# Weighted lease lengths in months: yearly leases dominate, with some short and long terms.
+LEASE_MONTHS = [12] * 6 + [6] * 2 + [24, 36]
+PROPERTY_TYPES = ['apartment'] * 6 + ['office'] * 2 + ['shop'] * 2
+MONTHLY_RENT = {'apartment': (250, 900), 'office': (400, 2500), 'shop': (300, 1800)}
+
+
+@dataclass
+class Volumes:
+    owners: int = 10
+    properties: int = 200
+    tenants: int = 500
+    contracts: int = 800
+
+
+def add_months(day, months):
+    month = day.month - 1 + months
+    year, month = day.year + month // 12, month % 12 + 1
+    return date(year, month, min(day.day, 28))
+
+
+def person_name(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(FIRST_NAMES)} {rng.choice(FAMILY_NAMES)}"
+
+
+def address(rng):
+    city = rng.choice(list(CITIES))
+    return f"{city}، {rng.choice(CITIES[city])}، شارع {rng.randint(1, 120)}، مبنى {rng.randint(1, 400)}"
+
+
+def phone(rng):
+    return f"9{rng.randint(1000000, 9999999)}"
+
+
+def next_suffix(model):
+    """Continue numbering after the highest id so repeated runs never collide on unique fields."""
+    return (model.objects.aggregate(last=Max('id'))['last'] or 0) + 1
+
+
+def lease_chain(rng, count, today):
+    """``count`` consecutive ``(start, end)`` spans ending around ``today``."""
+    spans = []
+    end = today + timedelta(days=rng.randint(-30, 330))
+    for _ in range(count):
+        start = add_months(end, -rng.choice(LEASE_MONTHS)) + timedelta(days=1)
+        spans.append((start, end))
+        end = start - timedelta(days=rng.randint(1, 45))
+    return spans[::-1]
+
+
+def generate(volumes, seed=0, today=None, batch_size=DEFAULT_BATCH_SIZE):
+    """Insert ``volumes`` of synthetic rows and return the created objects per model."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    password = make_password(None)
+    with transaction.atomic():
+        first = next_suffix(CustomUser)
+        owners = CustomUser.objects.bulk_create([
+            CustomUser(
+                username=f'owner{first + i}', first_name=rng.choice(FIRST_NAMES), last_name=rng.choice(FAMILY_NAMES),
+                phone=phone(rng), password=password)
+            for i in range(volumes.owners)], batch_size=batch_size)
+
+        properties = []
+        for i in range(volumes.properties):
+            kind = rng.choice(PROPERTY_TYPES)
+            properties.append(Property(
+                name=f"{rng.choice(BUILDING_WORDS)} {rng.choice(FAMILY_NAMES)} {i + 1}", propert_type=kind,
+                description=rng.choice(DESCRIPTIONS[kind]), address=address(rng), owner=rng.choice(owners)))
+        properties = Property.objects.bulk_create(properties, batch_size=batch_size)
+
+        first = next_suffix(Tenant)
+        tenants = Tenant.objects.bulk_create([
+            Tenant(name=person_name(rng), phone=phone(rng), email=f'tenant{first + i}@example.com', address=address(rng))
+            for i in range(volumes.tenants)], batch_size=batch_size)
+
+        contracts = []
+        if properties and tenants:
+            per_property = [0] * len(properties)
+            for _ in range(volumes.contracts):
+                per_property[rng.randrange(len(properties))] += 1
+            for prop, count in zip(properties, per_property):
+                low, high = MONTHLY_RENT[prop.propert_type]
+                rent = rng.randint(low, high)
+                for start, end in lease_chain(rng, count, today):
+                    contracts.append(LeasContract(
+                        tenant=rng.choice(tenants), property=prop, start_date=start, end_date=end,
+                        monthly_rent=Decimal(rent), is_active=start <= today <= end))
+                    rent = round(rent * 1.05)
+            contracts = LeasContract.objects.bulk_create(contracts, batch_size=batch_size)
+
+        created = {CustomUser: owners, Property: properties, Tenant: tenants, LeasContract: contracts}
+        for model in (Property, Tenant, LeasContract):
+            if created[model]:
+                bulk_saved.send(sender=model, instances=created[model])
+    return created
@@ -0,0 +1,170 @@
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.signals import bulk_saved
+from search.backends import get_backend
+from tenants.models import Tenant
+from users.models import CustomUser
+from .formats import read_rows
+from .importer import import_records
+from .resources import RESOURCES
+from .synthetic import Volumes, generate
+
+
+def csv_stream(text):
+    return io.BytesIO(text.encode('utf-8'))
+
+
+class ImportTests(TestCase):
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(username='nasser', password='x')
+
+    def test_tenant_upsert_by_email_with_row_errors(self):
+        Tenant.objects.create(name='قديم', phone='1', email='old@example.com', address='-')
+        report = import_records(RESOURCES['tenants'], read_rows(csv_stream(
+            "name,phone,email,address\n"
+            "محدث,0500,old@example.com,جدة\n"
+            "جديد,0501,new@example.com,مكة\n"
+            "بدون بريد,0502,not-an-email,مكة\n"
+        ), 'csv'), batch_size=2)
+        self.assertEqual((report.created, report.updated, report.failed), (1, 1, 1))
+        self.assertEqual(report.errors[0]['row'], 3)
+        self.assertIn('email', report.errors[0]['errors'])
+        self.assertEqual(Tenant.objects.get(email='old@example.com').name, 'محدث')
+
+    def import_contract_batch(self, start, count):
+        Tenant.objects.bulk_create(
+            Tenant(name=f'م{i}', phone='1', email=f't{i}@example.com', address='-') for i in range(start, start + count))
+        Property.objects.bulk_create(
+            Property(name=f'وحدة {i}', propert_type='apartment', description='-', address='-', owner=self.owner)
+            for i in range(start, start + count))
+        lines = [
+            json.dumps({'tenant': f't{i}@example.com', 'property': f'وحدة {i}', 'owner': 'nasser',
+                        'start_date': '2024-01-01', 'end_date': '2024-12-31', 'monthly_rent': '1000.00'})
+            for i in range(start, start + count)
+        ]
+        records = list(read_rows(csv_stream('\n'.join(lines)), 'ndjson'))
+        with CaptureQueriesContext(connection) as queries:
+            report = import_records(RESOURCES['contracts'], records, batch_size=count)
+        self.assertEqual(report.created, count)
+        return len(queries)
+
+    def test_foreign_keys_are_resolved_once_per_batch(self):
+        self.assertEqual(self.import_contract_batch(0, 2), self.import_contract_batch(2, 40))
+
+    def test_contract_overlaps_are_reported_per_row(self):
+        tenant = Tenant.objects.create(name='م', phone='1', email='t@example.com', address='-')
+        Property.objects.create(name='وحدة', propert_type='shop', description='-', address='-', owner=self.owner)
+        report = import_records(RESOURCES['contracts'], read_rows(csv_stream(
+            "tenant,property,owner,start_date,end_date,monthly_rent,is_active\n"
+            "t@example.com,وحدة,nasser,2024-01-01,2024-12-31,900.00,true\n"
+            "t@example.com,وحدة,nasser,2024-06-01,2025-05-31,900.00,true\n"
+            "t@example.com,وحدة,ghost,2024-06-01,2025-05-31,900.00,true\n"
+        ), 'csv'))
+        self.assertEqual((report.created, report.failed), (1, 2))
+        errors = {error['row']: error['errors'] for error in report.errors}
+        self.assertEqual(sorted(errors), [2, 3])
+        self.assertIn('property', errors[3])
+        self.assertEqual(LeasContract.objects.get().tenant, tenant)
+
+    def test_incomplete_natural_key_is_a_row_error(self):
+        Tenant.objects.create(name='م', phone='1', email='t@example.com', address='-')
+        report = import_records(RESOURCES['contracts'], [
+            {'tenant': 't@example.com', 'property': 'وحدة', 'start_date': '2024-01-01', 'end_date': '2024-12-31',
+             'monthly_rent': '900.00'}])
+        self.assertEqual(report.failed, 1)
+        self.assertEqual(report.errors[0]['errors']['property'], ['Every part of the key is required (وحدة / None).'])
+
+    def test_receiver_failure_rolls_back_the_batch(self):
+        def fail(**kwargs):
+            raise RuntimeError
+
+        bulk_saved.connect(fail, sender=Tenant)
+        self.addCleanup(bulk_saved.disconnect, fail, sender=Tenant)
+        with self.assertRaises(RuntimeError):
+            import_records(RESOURCES['tenants'], [
+                {'name': 'ريم', 'phone': '1', 'email': 'reem@example.com', 'address': '-'}])
+        self.assertFalse(Tenant.objects.exists())
+
+    def test_bulk_import_updates_search_index(self):
+        import_records(RESOURCES['tenants'], [
+            {'name': 'ريم', 'phone': '1', 'email': 'reem@example.com', 'address': '-'}])
+        self.assertEqual(len(get_backend().search('ريم', kinds=['tenant'])), 1)
+
+    def test_export_round_trips_through_import(self):
+        tenant = Tenant.objects.create(name='م', phone='1', email='t@example.com', address='-')
+        prop = Property.objects.create(
+            name='وحدة', propert_type='shop', description='-', address='-', owner=self.owner)
+        LeasContract.objects.create(
+            tenant=tenant, property=prop, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31),
+            monthly_rent=Decimal('750.50'), escalation='fixed', escalation_rate=Decimal('5.00'),
+            escalation_every_months=6)
+        LeasContract.objects.create(
+            tenant=tenant, property=prop, start_date=date(2025, 1, 1), end_date=date(2025, 12, 31),
+            monthly_rent=Decimal('800.00'))
+        out = io.StringIO()
+        call_command('export_data', 'contracts', stdout=out)
+        LeasContract.objects.all().delete()
+        report = import_records(RESOURCES['contracts'], read_rows(csv_stream(out.getvalue()), 'csv'))
+        self.assertEqual(report.created, 2)
+        self.assertEqual(
+            list(LeasContract.objects.order_by('start_date').values_list(
+                'monthly_rent', 'escalation', 'escalation_rate', 'escalation_every_months')),
+            [(Decimal('750.50'), 'fixed', Decimal('5.00'), 6), (Decimal('800.00'), 'none', None, 12)])
+
+    def test_contract_terms_are_validated(self):
+        Tenant.objects.create(name='م', phone='1', email='t@example.com', address='-')
+        Property.objects.create(name='وحدة', propert_type='shop', description='-', address='-', owner=self.owner)
+        report = import_records(RESOURCES['contracts'], [
+            {'tenant': 't@example.com', 'property': 'وحدة', 'owner': 'nasser', 'start_date': '2024-01-01',
+             'end_date': '2024-12-31', 'monthly_rent': '900.00', 'escalation': 'fixed'}])
+        self.assertEqual(report.failed, 1)
+        self.assertIn('escalation_rate', report.errors[0]['errors'])
+
+
+class SyntheticDataTests(TestCase):
+    def test_generates_requested_volumes_without_overlaps(self):
+        today = date(2025, 6, 1)
+        created = generate(Volumes(owners=3, properties=20, tenants=30, contracts=60), seed=7, today=today)
+        self.assertEqual([len(rows) for rows in created.values()], [3, 20, 30, 60])
+        for contract in LeasContract.objects.all():
+            clashes = LeasContract.objects.overlapping(contract.property_id, contract.start_date, contract.end_date)
+            self.assertFalse(clashes.exclude(pk=contract.pk).exists())
+            self.assertEqual(contract.is_active, contract.start_date <= today <= contract.end_date)
+        self.assertRegex(Tenant.objects.first().name, '[\u0600-\u06FF]')
+
+    def test_repeated_runs_do_not_collide(self):
+        out = io.StringIO()
+        call_command('generate_data', owners=2, properties=5, tenants=5, contracts=5, stdout=out)
+        call_command('generate_data', owners=2, properties=5, tenants=5, contracts=5, stdout=out)
+        self.assertEqual(Tenant.objects.count(), 10)
+        self.assertIn('Created 2', out.getvalue())
+
+
+class BulkApiTests(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(CustomUser.objects.create_superuser(username='admin', password='x'))
+
+    def test_import_and_export_endpoints(self):
+        upload = SimpleUploadedFile('tenants.csv', b"name,phone,email,address\nA,1,a@example.com,-\n")
+        response = self.client.post(reverse('bulk_import', args=['tenants']), {'file': upload})
+        self.assertEqual(response.json(), {'created': 1, 'updated': 0, 'failed': 0, 'errors': []})
+        response = self.client.get(reverse('bulk_export', args=['tenants']), {'type': 'ndjson'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(rows, [{'name': 'A', 'phone': '1', 'email': 'a@example.com', 'address': '-'}])
+
+    def test_requires_staff(self):
+        self.client.force_authenticate(CustomUser.objects.create_user(username='u', password='x'))
+        self.assertEqual(self.client.get(reverse('bulk_export', args=['tenants'])).status_code, 403)
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import ExportView, ImportView
+
+urlpatterns = [
+    path('import/<str:resource>/', ImportView.as_view(), name='bulk_import'),
+    path('export/<str:resource>/', ExportView.as_view(), name='bulk_export'),
+]
\ No newline at end of file
@@ -0,0 +1,49 @@
+from django.http import Http404, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .formats import CONTENT_TYPES, FORMATS, guess_format, read_rows, write_rows
+from .importer import import_records
+from .resources import RESOURCES
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def get_resource(name):
+    try:
+        return RESOURCES[name]
+    except KeyError:
+        raise Http404 from None
+
+
+class ImportView(APIView):
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, resource):
+        resource = get_resource(resource)
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'file': ["No file was submitted."]}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = request.query_params.get('type') or guess_format(upload.name)
+        if fmt not in FORMATS:
+            return Response({'type': [f"Expected one of {', '.join(FORMATS)}."]}, status=status.HTTP_400_BAD_REQUEST)
+        report = import_records(resource, read_rows(upload, fmt))
+        return Response(report.as_dict())
+
+
+class ExportView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, resource):
+        name = resource
+        resource = get_resource(name)
+        fmt = request.query_params.get('type', 'csv')
+        if fmt not in FORMATS:
+            return Response({'type': [f"Expected one of {', '.join(FORMATS)}."]}, status=status.HTTP_400_BAD_REQUEST)
+        rows = write_rows(resource.export_rows(EXPORT_CHUNK_SIZE), resource.columns, fmt)
+        response = StreamingHttpResponse(rows, content_type=CONTENT_TYPES[fmt])
+        response['Content-Disposition'] = f'attachment; filename="{name}.{fmt}"'
+        return response
\ No newline at end of file
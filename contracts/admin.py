@@ -1,8 +1,32 @@
 from django.contrib import admin
-from .models import LeasContract
+from search.admin import IndexedSearchAdminMixin
+from .models import CpiIndex, LeasContract, RenewalReminder, RentStep
+
+class RentStepInline(admin.TabularInline):
+    model = RentStep
+    extra = 0
 
 @admin.register(LeasContract)
-class LeasContractAdmin(admin.ModelAdmin):
-    list_display = ['tenant', 'property', 'start_date', 'end_date', 'monthly_rent', 'is_active']
-    list_filter = ['is_active', 'start_date']
-    search_fields = ['tenant__name', 'property__name']
\ No newline at end of file
+class LeasContractAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
+    search_kind = 'contract'
+    list_display = ['tenant', 'property', 'start_date', 'end_date', 'monthly_rent', 'escalation', 'is_active']
+    list_filter = ['is_active', 'escalation', 'start_date']
+    inlines = [RentStepInline]
+    search_fields = ['tenant__name', 'property__name']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_related()
+
+@admin.register(RenewalReminder)
+class RenewalReminderAdmin(admin.ModelAdmin):
+    list_display = ['contract', 'end_date', 'created_at']
+    list_filter = ['end_date']
+    raw_id_fields = ['contract']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('contract__tenant', 'contract__property')
+
+@admin.register(CpiIndex)
+class CpiIndexAdmin(admin.ModelAdmin):
+    list_display = ['month', 'value']
+    date_hierarchy = 'month'
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from contracts.lifecycle import run_expiry_sweep
+from contracts.scheduler import PeriodicJob
+
+
+class Command(BaseCommand):
+    help = "Deactivate expired leases and record renewal reminders since the last run."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help="Ignore the watermark and sweep every lease.")
+        parser.add_argument(
+            '--every', type=int, metavar='SECONDS',
+            help="Keep running in the foreground and sweep on this interval instead of exiting.")
+
+    def handle(self, *args, **options):
+        if not options['every']:
+            self.sweep(full=options['full'])
+            return
+        job = PeriodicJob(self.sweep, options['every'], name='expire_leases')
+        job.start()
+        try:
+            job.join()
+        except KeyboardInterrupt:
+            job.stop()
+
+    def sweep(self, full=False):
+        result = run_expiry_sweep(full=full)
+        since = result.since or 'the beginning'
+        self.stdout.write(self.style.SUCCESS(
+            f"{since} → {result.today}: {result.expired} expired, {result.reminders} due for renewal."))
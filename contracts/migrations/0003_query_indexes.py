@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0002_initial'),
+        ('properties', '0003_query_indexes'),
+        ('tenants', '0002_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='leascontract',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['property', 'start_date', 'end_date'], name='contract_active_property_dates'),
+        ),
+        migrations.AddIndex(
+            model_name='leascontract',
+            index=models.Index(fields=['is_active', 'start_date'], name='contract_active_start'),
+        ),
+        migrations.AddIndex(
+            model_name='leascontract',
+            index=models.Index(fields=['start_date', 'id'], name='contract_start_id'),
+        ),
+        migrations.AddConstraint(
+            model_name='leascontract',
+            constraint=models.CheckConstraint(condition=models.Q(('end_date__gte', models.F('start_date'))), name='contract_end_after_start'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from contracts.overlap_triggers import POSTGRES_BACKWARD, POSTGRES_FORWARD, SQLITE_BACKWARD, SQLITE_FORWARD
+from real_estate_management.migration_utils import run_for_vendor
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0003_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            run_for_vendor({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0004_no_overlapping_active_leases'),
+        ('properties', '0003_query_indexes'),
+        ('tenants', '0002_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RenewalReminder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('end_date', models.DateField(verbose_name='تاريخ النهاية')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاريخ الإنشاء')),
+            ],
+            options={
+                'verbose_name': 'تذكير تجديد',
+                'verbose_name_plural': 'تذكيرات التجديد',
+            },
+        ),
+        migrations.CreateModel(
+            name='SweepWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True, verbose_name='الاسم')),
+                ('processed_on', models.DateField(verbose_name='آخر تشغيل')),
+            ],
+            options={
+                'verbose_name': 'علامة معالجة',
+                'verbose_name_plural': 'علامات المعالجة',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='leascontract',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['end_date'], name='contract_active_end'),
+        ),
+        migrations.AddField(
+            model_name='renewalreminder',
+            name='contract',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='renewal_reminders', to='contracts.leascontract', verbose_name='العقد'),
+        ),
+        migrations.AddConstraint(
+            model_name='renewalreminder',
+            constraint=models.UniqueConstraint(fields=('contract', 'end_date'), name='unique_reminder_per_contract_end'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from contracts.overlap_triggers import SQLITE_BACKWARD, SQLITE_FORWARD
+from real_estate_management.migration_utils import run_for_vendor
+
+# SQLite rebuilds the table to add or remove these columns, which drops the
+# overlap triggers; put them back afterwards in either direction.
+restore_triggers = run_for_vendor({'sqlite': SQLITE_BACKWARD + SQLITE_FORWARD})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contracts', '0005_lease_expiry'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, restore_triggers),
+        migrations.CreateModel(
+            name='CpiIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(unique=True, verbose_name='الشهر')),
+                ('value', models.DecimalField(decimal_places=3, max_digits=10, verbose_name='قيمة المؤشر')),
+            ],
+            options={
+                'verbose_name': 'مؤشر أسعار المستهلك',
+                'verbose_name_plural': 'مؤشرات أسعار المستهلك',
+                'ordering': ['month'],
+            },
+        ),
+        migrations.AddField(
+            model_name='leascontract',
+            name='escalation',
+            field=models.CharField(choices=[('none', 'بدون زيادة'), ('fixed', 'نسبة ثابتة'), ('stepped', 'زيادات متدرجة'), ('cpi', 'مؤشر أسعار المستهلك')], default='none', max_length=10, verbose_name='نوع الزيادة'),
+        ),
+        migrations.AddField(
+            model_name='leascontract',
+            name='escalation_every_months',
+            field=models.PositiveSmallIntegerField(default=12, verbose_name='الزيادة كل (شهر)'),
+        ),
+        migrations.AddField(
+            model_name='leascontract',
+            name='escalation_rate',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True, verbose_name='نسبة الزيادة %'),
+        ),
+        migrations.RunPython(restore_triggers, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='RentStep',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('effective_from', models.DateField(verbose_name='يسري من')),
+                ('monthly_rent', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='الإيجار الشهري')),
+                ('contract', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rent_steps', to='contracts.leascontract', verbose_name='العقد')),
+            ],
+            options={
+                'verbose_name': 'زيادة متدرجة',
+                'verbose_name_plural': 'الزيادات المتدرجة',
+                'ordering': ['contract', 'effective_from'],
+                'constraints': [models.UniqueConstraint(fields=('contract', 'effective_from'), name='unique_rent_step_per_date')],
+            },
+        ),
+    ]
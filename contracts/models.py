@@ -1,18 +1,162 @@
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
 from django.db import models
 from tenants.models import Tenant
 from properties.models import Property
+from users.scopes import sees_everything
+
+class LeasContractQuerySet(models.QuerySet):
+  def with_related(self):
+    return self.select_related('tenant', 'property', 'property__owner')
+
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(property__owner_id=user.id)
+
+  def overlapping(self, property_id, start_date, end_date):
+    return self.filter(
+      property_id=property_id, is_active=True, start_date__lte=end_date, end_date__gte=start_date)
+
+  def batch_overlaps(self, candidates, rewritten=()):
+    """Keys of ``(key, property_id, start_date, end_date)`` active leases that overlap.
+
+    A candidate clashes with a stored active lease (other than the ``rewritten``
+    pks, which the batch replaces) or with an earlier candidate. One query.
+    """
+    rewritten = set(rewritten)
+    stored = self.filter(is_active=True, property_id__in={candidate[1] for candidate in candidates})
+    leases = defaultdict(list)
+    for pk, property_id, start, end in stored.values_list('pk', 'property_id', 'start_date', 'end_date'):
+      if pk not in rewritten:
+        leases[property_id].append((start, end))
+    clashes = set()
+    for key, property_id, start_date, end_date in candidates:
+      ranges = leases[property_id]
+      if any(start <= end_date and start_date <= end for start, end in ranges):
+        clashes.add(key)
+      else:
+        ranges.append((start_date, end_date))
+    return clashes
 
 class LeasContract(models.Model):
+  ESCALATION_CHOICES = [
+    ('none', "بدون زيادة"),
+    ('fixed', "نسبة ثابتة"),
+    ('stepped', "زيادات متدرجة"),
+    ('cpi', "مؤشر أسعار المستهلك"),
+  ]
+
   tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, verbose_name="المستأجر")
   property = models.ForeignKey(Property, on_delete=models.CASCADE, verbose_name="العقار")
   start_date = models.DateField(verbose_name="تاريخ البدء")
   end_date = models.DateField(verbose_name="تاريخ النهاية")
   monthly_rent = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="الإيجار الشهري")
   is_active = models.BooleanField(default=True, verbose_name="نشط")
+  escalation = models.CharField(max_length=10, choices=ESCALATION_CHOICES, default='none', verbose_name="نوع الزيادة")
+  escalation_rate = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True, verbose_name="نسبة الزيادة %")
+  escalation_every_months = models.PositiveSmallIntegerField(default=12, verbose_name="الزيادة كل (شهر)")
+
+  objects = LeasContractQuerySet.as_manager()
 
   def __str__(self):
     return f"{self.tenant.name} - {self.property.name}"
 
+  def clean_terms(self):
+    if self.start_date and self.end_date and self.end_date < self.start_date:
+      raise ValidationError({'end_date': "تاريخ النهاية يسبق تاريخ البدء"})
+    if self.escalation == 'fixed' and self.escalation_rate is None:
+      raise ValidationError({'escalation_rate': "يجب تحديد نسبة الزيادة"})
+    if self.escalation in ('fixed', 'cpi') and not self.escalation_every_months:
+      raise ValidationError({'escalation_every_months': "يجب تحديد فترة الزيادة"})
+
+  def clean(self):
+    self.clean_terms()
+    if self.is_active and self.property_id and self.start_date and self.end_date:
+      clashes = LeasContract.objects.overlapping(self.property_id, self.start_date, self.end_date)
+      if clashes.exclude(pk=self.pk).exists():
+        raise ValidationError("يوجد عقد نشط آخر لهذا العقار في نفس الفترة")
+
   class Meta:
     verbose_name = "عقد إيجار"
-    verbose_name_plural = "عقود الإيجار"
\ No newline at end of file
+    verbose_name_plural = "عقود الإيجار"
+    indexes = [
+      models.Index(fields=['property', 'start_date', 'end_date'], condition=models.Q(is_active=True), name='contract_active_property_dates'),
+      models.Index(fields=['is_active', 'start_date'], name='contract_active_start'),
+      models.Index(fields=['start_date', 'id'], name='contract_start_id'),
+      models.Index(fields=['end_date'], condition=models.Q(is_active=True), name='contract_active_end'),
+    ]
+    constraints = [
+      models.CheckConstraint(condition=models.Q(end_date__gte=models.F('start_date')), name='contract_end_after_start'),
+    ]
+
+class RentStep(models.Model):
+  contract = models.ForeignKey(LeasContract, on_delete=models.CASCADE, related_name='rent_steps', verbose_name="العقد")
+  effective_from = models.DateField(verbose_name="يسري من")
+  monthly_rent = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="الإيجار الشهري")
+
+  def __str__(self):
+    return f"{self.contract_id} @ {self.effective_from}: {self.monthly_rent}"
+
+  class Meta:
+    verbose_name = "زيادة متدرجة"
+    verbose_name_plural = "الزيادات المتدرجة"
+    ordering = ['contract', 'effective_from']
+    constraints = [
+      models.UniqueConstraint(fields=['contract', 'effective_from'], name='unique_rent_step_per_date'),
+    ]
+
+class CpiIndex(models.Model):
+  month = models.DateField(unique=True, verbose_name="الشهر")
+  value = models.DecimalField(max_digits=10, decimal_places=3, verbose_name="قيمة المؤشر")
+
+  def __str__(self):
+    return f"{self.month:%Y-%m}: {self.value}"
+
+  def save(self, *args, **kwargs):
+    self.month = self.month.replace(day=1)
+    super().save(*args, **kwargs)
+
+  class Meta:
+    verbose_name = "مؤشر أسعار المستهلك"
+    verbose_name_plural = "مؤشرات أسعار المستهلك"
+    ordering = ['month']
+
+class RenewalReminderQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(contract__property__owner_id=user.id)
+
+class RenewalReminder(models.Model):
+  contract = models.ForeignKey(LeasContract, on_delete=models.CASCADE, related_name='renewal_reminders', verbose_name="العقد")
+  end_date = models.DateField(verbose_name="تاريخ النهاية")
+  created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء")
+
+  objects = RenewalReminderQuerySet.as_manager()
+
+  def __str__(self):
+    return f"{self.contract_id} - {self.end_date}"
+
+  class Meta:
+    verbose_name = "تذكير تجديد"
+    verbose_name_plural = "تذكيرات التجديد"
+    constraints = [
+      models.UniqueConstraint(fields=['contract', 'end_date'], name='unique_reminder_per_contract_end'),
+    ]
+
+class SweepWatermark(models.Model):
+  name = models.CharField(max_length=50, unique=True, verbose_name="الاسم")
+  processed_on = models.DateField(verbose_name="آخر تشغيل")
+
+  def __str__(self):
+    return f"{self.name} @ {self.processed_on}"
+
+  class Meta:
+    verbose_name = "علامة معالجة"
+    verbose_name_plural = "علامات المعالجة"
\ No newline at end of file
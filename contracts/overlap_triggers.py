@@ -0,0 +1,36 @@
+"""SQL enforcing one active lease per property at a time.
+
+Used by migration 0004, which installs it, and 0006, which reinstalls the
+SQLite triggers after a table rebuild drops them. Both have been applied,
+so changes belong in a new migration, not here.
+"""
+
+# NEW.id is still NULL in a BEFORE INSERT trigger, so only updates exclude the row itself.
+OVERLAP = (
+    "SELECT 1 FROM contracts_leascontract c"
+    " WHERE c.property_id = NEW.property_id AND c.is_active"
+    " AND c.start_date <= NEW.end_date AND NEW.start_date <= c.end_date"
+)
+
+SQLITE_FORWARD = [
+    "CREATE TRIGGER contract_no_overlap_insert BEFORE INSERT ON contracts_leascontract"
+    f" WHEN NEW.is_active AND EXISTS ({OVERLAP})"
+    " BEGIN SELECT RAISE(ABORT, 'overlapping active lease for property'); END",
+    "CREATE TRIGGER contract_no_overlap_update"
+    " BEFORE UPDATE OF property_id, start_date, end_date, is_active ON contracts_leascontract"
+    f" WHEN NEW.is_active AND EXISTS ({OVERLAP} AND c.id != NEW.id)"
+    " BEGIN SELECT RAISE(ABORT, 'overlapping active lease for property'); END",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS contract_no_overlap_insert",
+    "DROP TRIGGER IF EXISTS contract_no_overlap_update",
+]
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    "ALTER TABLE contracts_leascontract ADD CONSTRAINT contract_no_overlap"
+    " EXCLUDE USING gist (property_id WITH =, daterange(start_date, end_date, '[]') WITH &&)"
+    " WHERE (is_active)",
+]
+POSTGRES_BACKWARD = [
+    "ALTER TABLE contracts_leascontract DROP CONSTRAINT IF EXISTS contract_no_overlap",
+]
@@ -0,0 +1,30 @@
+import logging
+import threading
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob(threading.Thread):
+    """Run ``func`` every ``interval`` seconds in a daemon thread until stopped."""
+
+    def __init__(self, func, interval, name=None):
+        super().__init__(name=name or func.__name__, daemon=True)
+        self.func = func
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            close_old_connections()
+            try:
+                self.func()
+            except Exception:
+                logger.exception("Scheduled job %s failed", self.name)
+            finally:
+                close_old_connections()
+            self.stopped.wait(self.interval)
+
+    def stop(self):
+        self.stopped.set()
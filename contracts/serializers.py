@@ -1,7 +1,69 @@
+from copy import copy
+
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
-from .models import LeasContract
+from properties.serialisers import PropertySerialiser
+from real_estate_management.permissions import scope_related_field
+from tenants.serialisers import TenantSerializer
+from users.models import CustomUser
+from .models import LeasContract, RenewalReminder
+
+EXPANDABLE_FIELDS = ('tenant', 'property')
+
+
+def parse_expand(value):
+    requested = {part.strip() for part in (value or '').split(',')}
+    return tuple(field for field in EXPANDABLE_FIELDS if field in requested)
+
+
+class OwnerSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CustomUser
+        fields = ['id', 'username', 'email', 'phone']
+
+
+class ExpandedPropertySerialiser(PropertySerialiser):
+    owner = OwnerSummarySerializer(read_only=True)
+
 
 class LeasContractSerialiser(serializers.ModelSerializer):
     class Meta:
         model = LeasContract
+        fields = '__all__'
+
+    def get_fields(self):
+        fields = super().get_fields()
+        scope_related_field(fields, 'property', self.context)
+        # A tenant the owner has just created has no lease yet, so is not visible to them.
+        scope_related_field(fields, 'tenant', self.context, scope='assignable_by')
+        expand = self.context.get('expand', ())
+        if 'tenant' in expand:
+            fields['tenant'] = TenantSerializer(read_only=True)
+        if 'property' in expand:
+            fields['property'] = ExpandedPropertySerialiser(read_only=True)
+        return fields
+
+    def validate(self, attrs):
+        candidate = copy(self.instance) if self.instance else LeasContract()
+        for name, value in attrs.items():
+            setattr(candidate, name, value)
+        try:
+            self.check(candidate)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError(serializers.as_serializer_error(exc)) from exc
+        return attrs
+
+    def check(self, candidate):
+        candidate.clean()
+
+
+class LeasContractBulkSerializer(LeasContractSerialiser):
+    def check(self, candidate):
+        # Overlaps are checked for the whole batch by the viewset.
+        candidate.clean_terms()
+
+
+class RenewalReminderSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RenewalReminder
         fields = '__all__'
\ No newline at end of file
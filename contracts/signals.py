@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from real_estate_management.http_cache import touch
+from real_estate_management.signals import bulk_saved
+from .models import LeasContract
+
+
+# Leases decide which tenants an owner can see, so any change moves the
+# collection stamp that tenant responses depend on.
+@receiver(post_save, sender=LeasContract)
+@receiver(post_delete, sender=LeasContract)
+def contract_changed(sender, instance, **kwargs):
+    touch('contract')
+
+
+@receiver(bulk_saved, sender=LeasContract)
+def contracts_bulk_saved(sender, instances, **kwargs):
+    touch('contract')
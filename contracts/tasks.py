@@ -0,0 +1,14 @@
+from rest_framework import serializers
+
+from jobs.registry import task
+from .lifecycle import run_expiry_sweep
+
+
+class ExpirySweepJobSerializer(serializers.Serializer):
+    full = serializers.BooleanField(default=False)
+
+
+@task('contracts.expire_leases', params=ExpirySweepJobSerializer, max_attempts=1)
+def expire_leases(full=False):
+    result = run_expiry_sweep(full=full)
+    return {'since': result.since, 'today': result.today, 'expired': result.expired, 'reminders': result.reminders}
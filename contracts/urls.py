@@ -1,7 +1,12 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import LeasContractViewSet
+from .views import LeasContractAsyncReadView, LeasContractViewSet, RenewalReminderViewSet
 
 router = DefaultRouter()
 router.register(r'contracts', LeasContractViewSet)
+router.register(r'renewal-reminders', RenewalReminderViewSet)
 
-urlpatterns = router.urls
\ No newline at end of file
+urlpatterns = router.urls + [
+    path('async/contracts/', LeasContractAsyncReadView.as_view(), name='leascontract-async-list'),
+    path('async/contracts/<int:pk>/', LeasContractAsyncReadView.as_view(), name='leascontract-async-detail'),
+]
\ No newline at end of file
@@ -1,7 +1,59 @@
 from rest_framework import viewsets
-from .models import LeasContract
-from .serialisers import LeasContractSerialiser
+from real_estate_management.async_views import AsyncReadView
+from real_estate_management.bulk_writes import BulkWriteMixin
+from real_estate_management.pagination import StartDateCursorPagination
+from real_estate_management.lean import LeanListMixin
+from real_estate_management.permissions import OwnerScopedMixin
+from real_estate_management.streaming import StreamingListMixin
+from .models import LeasContract, RenewalReminder
+from .serializers import LeasContractBulkSerializer, LeasContractSerialiser, RenewalReminderSerializer, parse_expand
 
-class LeasContractViewSet(viewsets.ModelViewSet):
+class LeasContractViewSet(BulkWriteMixin, OwnerScopedMixin, StreamingListMixin, LeanListMixin, viewsets.ModelViewSet):
+    queryset = LeasContract.objects.all()
+    serializer_class = LeasContractSerialiser
+    pagination_class = StartDateCursorPagination
+    bulk_serializer_class = LeasContractBulkSerializer
+
+    def get_expand(self):
+        if self.request is None or self.request.method != 'GET':
+            return ()
+        return parse_expand(self.request.query_params.get('expand'))
+
+    def use_lean_list(self):
+        return not self.get_expand()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.get_expand():
+            queryset = queryset.with_related()
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['expand'] = self.get_expand()
+        return context
+
+    def check_bulk_items(self, items):
+        def value(attrs, obj, name, default=None):
+            return attrs.get(name, getattr(obj, name, default))
+
+        candidates = []
+        for index, attrs, obj in items:
+            if value(attrs, obj, 'is_active', True):
+                prop = attrs.get('property')
+                candidates.append((
+                    index, prop.pk if prop else obj.property_id,
+                    value(attrs, obj, 'start_date'), value(attrs, obj, 'end_date')))
+        clashes = LeasContract.objects.batch_overlaps(
+            candidates, rewritten={obj.pk for _, _, obj in items if obj is not None})
+        return {index: {'non_field_errors': ["يوجد عقد نشط آخر لهذا العقار في نفس الفترة"]} for index in clashes}
+
+
+class RenewalReminderViewSet(OwnerScopedMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = RenewalReminder.objects.all()
+    serializer_class = RenewalReminderSerializer
+
+
+class LeasContractAsyncReadView(AsyncReadView):
     queryset = LeasContract.objects.all()
     serializer_class = LeasContractSerialiser
\ No newline at end of file
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Job
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'name', 'status', 'priority', 'attempts', 'run_after', 'created_at', 'finished_at']
+    list_filter = ['status', 'name']
+    raw_id_fields = ['created_by']
+    readonly_fields = ['result', 'error', 'worker', 'started_at', 'finished_at']
+    actions = ['retry_now']
+
+    @admin.action(description="إعادة المحاولة الآن")
+    def retry_now(self, request, queryset):
+        # The dedup key is dropped so a newer pending copy of the job cannot clash with it.
+        queryset.exclude(status__in=Job.PENDING).update(
+            status=Job.QUEUED, run_after=timezone.now(), attempts=0, error='', finished_at=None, dedup_key=None)
@@ -0,0 +1,27 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs on a pool of worker processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', type=int, default=os.cpu_count() or 1,
+            help="Size of the process pool; 0 runs jobs one at a time in this process.")
+        parser.add_argument('--poll', type=float, default=1.0, metavar='SECONDS', help="Wait between empty polls.")
+        parser.add_argument(
+            '--stale-after', type=int, metavar='SECONDS',
+            help="Retry jobs running longer than this (default: JOBS_STALE_AFTER).")
+        parser.add_argument('--once', action='store_true', help="Exit once no job is due or running.")
+
+    def handle(self, *args, **options):
+        worker = Worker(options['processes'], poll=options['poll'], stale_after=options['stale_after'])
+        try:
+            processed = worker.run(once=options['once'])
+        except KeyboardInterrupt:
+            return
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs."))
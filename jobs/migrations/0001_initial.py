@@ -0,0 +1,46 @@
+# Generated by Django 5.1.4 on 2026-10-18 18:09
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='المهمة')),
+                ('args', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='المعاملات')),
+                ('priority', models.SmallIntegerField(default=0, verbose_name='الأولوية')),
+                ('status', models.CharField(choices=[('queued', 'في الانتظار'), ('running', 'قيد التنفيذ'), ('succeeded', 'مكتملة'), ('failed', 'فشلت')], default='queued', max_length=10, verbose_name='الحالة')),
+                ('dedup_key', models.CharField(blank=True, max_length=64, null=True, verbose_name='مفتاح منع التكرار')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='المحاولات')),
+                ('max_attempts', models.PositiveSmallIntegerField(default=3, verbose_name='الحد الأقصى للمحاولات')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='التنفيذ بعد')),
+                ('result', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True, verbose_name='النتيجة')),
+                ('error', models.TextField(blank=True, default='', verbose_name='الخطأ')),
+                ('worker', models.CharField(blank=True, default='', max_length=100, verbose_name='العامل')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاريخ الإنشاء')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='بدأت في')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='انتهت في')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='أنشأها')),
+            ],
+            options={
+                'verbose_name': 'مهمة خلفية',
+                'verbose_name_plural': 'المهام الخلفية',
+                'indexes': [models.Index(fields=['status', '-priority', 'run_after', 'id'], name='job_due'), models.Index(fields=['created_by', 'id'], name='job_creator')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status__in', ['queued', 'running'])), fields=('dedup_key',), name='job_dedup_pending')],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from users.scopes import sees_everything
+
+class JobQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(created_by_id=user.id)
+
+  def pending(self):
+    return self.filter(status__in=Job.PENDING)
+
+  def due(self, now):
+    return self.filter(status=Job.QUEUED, run_after__lte=now).order_by('-priority', 'run_after', 'id')
+
+class Job(models.Model):
+  QUEUED, RUNNING, SUCCEEDED, FAILED = 'queued', 'running', 'succeeded', 'failed'
+  PENDING = (QUEUED, RUNNING)
+  STATUS_CHOICES = [
+    (QUEUED, 'في الانتظار'),
+    (RUNNING, 'قيد التنفيذ'),
+    (SUCCEEDED, 'مكتملة'),
+    (FAILED, 'فشلت'),
+  ]
+  name = models.CharField(max_length=100, verbose_name="المهمة")
+  args = models.JSONField(encoder=DjangoJSONEncoder, default=dict, blank=True, verbose_name="المعاملات")
+  priority = models.SmallIntegerField(default=0, verbose_name="الأولوية")
+  status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED, verbose_name="الحالة")
+  dedup_key = models.CharField(max_length=64, null=True, blank=True, verbose_name="مفتاح منع التكرار")
+  attempts = models.PositiveSmallIntegerField(default=0, verbose_name="المحاولات")
+  max_attempts = models.PositiveSmallIntegerField(default=3, verbose_name="الحد الأقصى للمحاولات")
+  run_after = models.DateTimeField(default=timezone.now, verbose_name="التنفيذ بعد")
+  result = models.JSONField(encoder=DjangoJSONEncoder, null=True, blank=True, verbose_name="النتيجة")
+  error = models.TextField(blank=True, default='', verbose_name="الخطأ")
+  worker = models.CharField(max_length=100, blank=True, default='', verbose_name="العامل")
+  created_by = models.ForeignKey(
+    settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name='+',
+    verbose_name="أنشأها")
+  created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء")
+  started_at = models.DateTimeField(null=True, blank=True, verbose_name="بدأت في")
+  finished_at = models.DateTimeField(null=True, blank=True, verbose_name="انتهت في")
+
+  objects = JobQuerySet.as_manager()
+
+  def __str__(self):
+    return f"{self.name} #{self.pk} ({self.status})"
+
+  class Meta:
+    verbose_name = "مهمة خلفية"
+    verbose_name_plural = "المهام الخلفية"
+    indexes = [
+      models.Index(fields=['status', '-priority', 'run_after', 'id'], name='job_due'),
+      models.Index(fields=['created_by', 'id'], name='job_creator'),
+    ]
+    constraints = [
+      models.UniqueConstraint(fields=['dedup_key'], condition=models.Q(status__in=['queued', 'running']), name='job_dedup_pending'),
+    ]
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Code that runs inside the worker's child processes.
+
+Nothing here imports models at module level: a spawned process unpickles
+these functions before ``init_worker`` has set Django up.
+"""
+import traceback
+
+
+def init_worker():
+    import django
+
+    django.setup()
+
+
+def run_task(name, args):
+    """``(True, result)`` or ``(False, traceback)``; exceptions never cross the process boundary."""
+    from django.db import close_old_connections
+
+    from .registry import registry
+
+    close_old_connections()
+    try:
+        return True, registry[name].func(**args)
+    except Exception:
+        return False, traceback.format_exc()
+    finally:
+        close_old_connections()
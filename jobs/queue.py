@@ -0,0 +1,105 @@
+"""A job queue kept in the ``Job`` table.
+
+Workers claim due jobs in priority order inside a transaction
+(``SELECT ... FOR UPDATE SKIP LOCKED`` on PostgreSQL; SQLite's immediate
+transactions serialise claims instead), run them, and record the result.
+Failures are retried with exponential backoff until ``max_attempts``; jobs
+left running by a worker that died are picked up again after
+``JOBS_STALE_AFTER`` seconds.
+"""
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .registry import registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STALE_AFTER = 600
+
+
+def dedup_key_for(name, args, user_id=None):
+    payload = json.dumps([name, args, user_id], sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def enqueue(name, args=None, *, priority=None, dedup_key=None, user=None, run_after=None):
+    """Queue task ``name``; returns ``(job, created)``.
+
+    While a job with the same dedup key is queued or running it is returned
+    instead of a new one.
+    """
+    task = registry[name]
+    args = args or {}
+    # Token-authenticated requests carry a TokenUser, so only the id is stored.
+    user_id = user.id if user is not None and user.is_authenticated else None
+    if dedup_key is None and task.dedupe:
+        dedup_key = dedup_key_for(name, args, user_id)
+    if dedup_key is not None:
+        existing = Job.objects.pending().filter(dedup_key=dedup_key).first()
+        if existing is not None:
+            return existing, False
+    job = Job(
+        name=name, args=args, priority=task.priority if priority is None else priority, dedup_key=dedup_key,
+        max_attempts=task.max_attempts, run_after=run_after or timezone.now(), created_by_id=user_id)
+    try:
+        with transaction.atomic():
+            job.save()
+    except IntegrityError:
+        # Another request queued the same job in between.
+        existing = Job.objects.pending().filter(dedup_key=dedup_key).first()
+        if existing is None:
+            raise
+        return existing, False
+    return job, True
+
+
+def claim(worker, limit):
+    """Mark up to ``limit`` due jobs as running for ``worker`` and return them, highest priority first."""
+    now = timezone.now()
+    with transaction.atomic():
+        due = Job.objects.due(now).select_for_update(skip_locked=True)
+        ids = list(due.values_list('pk', flat=True)[:limit])
+        if not ids:
+            return []
+        Job.objects.filter(pk__in=ids, status=Job.QUEUED).update(
+            status=Job.RUNNING, worker=worker, started_at=now, attempts=F('attempts') + 1)
+    claimed = Job.objects.filter(pk__in=ids, status=Job.RUNNING, worker=worker, started_at=now)
+    return list(claimed.order_by('-priority', 'run_after', 'id'))
+
+
+def complete(job, result):
+    Job.objects.filter(pk=job.pk).update(status=Job.SUCCEEDED, result=result, error='', finished_at=timezone.now())
+
+
+def fail(job, error):
+    """Schedule a retry, or mark the job failed once its attempts are used up."""
+    now = timezone.now()
+    if job.attempts < job.max_attempts:
+        task = registry.get(job.name)
+        delay = (task.retry_delay if task else 30) * 2 ** max(job.attempts - 1, 0)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.QUEUED, error=error, worker='', run_after=now + timedelta(seconds=delay))
+        logger.warning("Job %s (%s) failed, retrying in %ss", job.pk, job.name, delay)
+    else:
+        Job.objects.filter(pk=job.pk).update(status=Job.FAILED, error=error, finished_at=now)
+        logger.error("Job %s (%s) failed after %s attempts", job.pk, job.name, job.attempts)
+
+
+def requeue_stale(stale_after=None):
+    """Retry (or fail) jobs still running ``stale_after`` seconds after they started."""
+    if stale_after is None:
+        stale_after = getattr(settings, 'JOBS_STALE_AFTER', DEFAULT_STALE_AFTER)
+    cutoff = timezone.now() - timedelta(seconds=stale_after)
+    stale = list(Job.objects.filter(status=Job.RUNNING, started_at__lt=cutoff))
+    for job in stale:
+        fail(job, f"No result from worker {job.worker} within {stale_after}s.")
+    return len(stale)
@@ -0,0 +1,32 @@
+"""Job functions, registered by name from each app's ``tasks`` module.
+
+Job arguments travel through the database as JSON and the return value is
+stored the same way, so both must be JSON-serialisable.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    func: object
+    # Serializer class validating arguments sent through the API.
+    params: object = None
+    # Whether non-staff users may enqueue the task through the API.
+    public: bool = False
+    priority: int = 0
+    max_attempts: int = 3
+    # Seconds before the first retry; doubled for each further attempt.
+    retry_delay: int = 30
+    # Share one queued or running job between identical requests.
+    dedupe: bool = True
+
+
+registry = {}
+
+
+def task(name, **options):
+    def register(func):
+        registry[name] = Task(name, func, **options)
+        return func
+    return register
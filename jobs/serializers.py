@@ -0,0 +1,44 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework import serializers
+from users.scopes import sees_everything
+from .models import Job
+from .registry import registry
+
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            'id', 'name', 'args', 'priority', 'status', 'attempts', 'max_attempts', 'run_after', 'result', 'error',
+            'created_at', 'started_at', 'finished_at',
+        ]
+        read_only_fields = fields
+
+
+class EnqueueSerializer(serializers.Serializer):
+    name = serializers.ChoiceField(choices=[])
+    args = serializers.DictField(default=dict)
+    priority = serializers.IntegerField(min_value=-100, max_value=100, required=False)
+    dedup_key = serializers.CharField(max_length=64, required=False)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        staff = request is not None and sees_everything(request.user)
+        fields['name'].choices = sorted(name for name, task in registry.items() if staff or task.public)
+        if not staff:
+            # Only staff may jump the queue.
+            del fields['priority']
+        return fields
+
+    def validate(self, attrs):
+        params_class = registry[attrs['name']].params
+        if params_class is not None:
+            params = params_class(data=attrs['args'], context=self.context)
+            if not params.is_valid():
+                raise serializers.ValidationError({'args': params.errors})
+            # Stored as JSON, so dates and decimals go in as the strings the task will receive.
+            attrs['args'] = json.loads(json.dumps(params.validated_data, cls=DjangoJSONEncoder))
+        return attrs
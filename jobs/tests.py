@@ -0,0 +1,143 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from users.models import CustomUser
+from . import queue
+from .models import Job
+from .registry import registry, task
+from .worker import Worker
+
+calls = []
+
+
+@task('tests.echo', public=True)
+def echo(value):
+    calls.append(value)
+    return {'value': value}
+
+
+@task('tests.flaky', max_attempts=2, retry_delay=0)
+def flaky():
+    calls.append('flaky')
+    if calls.count('flaky') == 1:
+        raise RuntimeError("first attempt fails")
+    return 'ok'
+
+
+@task('tests.broken', max_attempts=2, retry_delay=60, dedupe=False)
+def broken():
+    raise RuntimeError("always fails")
+
+
+class QueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_dedup_returns_the_pending_job(self):
+        job, created = queue.enqueue('tests.echo', {'value': 1})
+        again, created_again = queue.enqueue('tests.echo', {'value': 1})
+        self.assertEqual((created, created_again, again.pk), (True, False, job.pk))
+        self.assertTrue(queue.enqueue('tests.echo', {'value': 2})[1])
+        Worker(0).run(once=True)
+        self.assertTrue(queue.enqueue('tests.echo', {'value': 1})[1])
+
+    def test_claims_by_priority_then_age(self):
+        low = queue.enqueue('tests.echo', {'value': 'low'})[0]
+        high = queue.enqueue('tests.echo', {'value': 'high'}, priority=5)[0]
+        later = queue.enqueue(
+            'tests.echo', {'value': 'later'}, priority=9, run_after=timezone.now() + timedelta(hours=1))[0]
+        self.assertEqual([job.pk for job in queue.claim('w', 10)], [high.pk, low.pk])
+        self.assertEqual(queue.claim('w', 10), [])
+        self.assertEqual(Job.objects.get(pk=later.pk).status, Job.QUEUED)
+
+    def test_retries_then_fails(self):
+        queue.enqueue('tests.flaky')
+        failing = queue.enqueue('tests.broken')[0]
+        with self.assertLogs('jobs.queue', 'WARNING'):
+            self.assertEqual(Worker(0).run(once=True), 3)
+        self.assertEqual(Job.objects.get(name='tests.flaky').status, Job.SUCCEEDED)
+        failing.refresh_from_db()
+        self.assertEqual((failing.status, failing.attempts), (Job.QUEUED, 1))
+        self.assertIn('always fails', failing.error)
+        Job.objects.filter(pk=failing.pk).update(run_after=timezone.now())
+        with self.assertLogs('jobs.queue', 'ERROR'):
+            Worker(0).run(once=True)
+        failing.refresh_from_db()
+        self.assertEqual((failing.status, failing.attempts), (Job.FAILED, 2))
+
+    def test_stale_running_jobs_are_requeued(self):
+        job = queue.enqueue('tests.echo', {'value': 3})[0]
+        queue.claim('lost-worker', 1)
+        Job.objects.filter(pk=job.pk).update(started_at=timezone.now() - timedelta(hours=1))
+        with self.assertLogs('jobs.queue', 'WARNING'):
+            self.assertEqual(queue.requeue_stale(600), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertIn('lost-worker', job.error)
+
+    def test_command_drains_the_queue(self):
+        queue.enqueue('tests.echo', {'value': 4})
+        out = StringIO()
+        call_command('run_jobs', processes=0, once=True, stdout=out)
+        self.assertIn('Processed 1 jobs', out.getvalue())
+        self.assertEqual(calls, [4])
+
+
+class JobApiTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = CustomUser.objects.create_user(username='owner', password='x')
+        self.staff = CustomUser.objects.create_user(username='staff', password='x', is_staff=True)
+
+    def test_enqueue_and_poll(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(reverse('job-list'), {'name': 'analytics.report', 'args': {
+            'report': 'rent-roll', 'owner': self.staff.pk}}, format='json')
+        self.assertEqual(response.status_code, 201)
+        job = response.json()
+        self.assertEqual((job['status'], job['args']['owner']), ('queued', self.owner.pk))
+        again = self.client.post(reverse('job-list'), {'name': 'analytics.report', 'args': {
+            'report': 'rent-roll'}}, format='json')
+        self.assertEqual((again.status_code, again.json()['id']), (200, job['id']))
+
+        Worker(0).run(once=True)
+        polled = self.client.get(reverse('job-detail', args=[job['id']])).json()
+        self.assertEqual((polled['status'], polled['result']), ('succeeded', []))
+
+        self.client.force_authenticate(self.staff)
+        self.assertEqual(len(self.client.get(reverse('job-list')).json()['results']), 1)
+        other = CustomUser.objects.create_user(username='other', password='x')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(reverse('job-detail', args=[job['id']])).status_code, 404)
+
+    def test_enqueue_with_access_token(self):
+        token = self.client.post(
+            reverse('token_obtain_pair'), {'username': 'owner', 'password': 'x'}, format='json').json()['access']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        response = self.client.post(reverse('job-list'), {'name': 'analytics.report', 'args': {
+            'report': 'occupancy'}}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Job.objects.get().created_by_id, self.owner.pk)
+
+    def test_private_tasks_and_bad_args_are_rejected(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(reverse('job-list'), {'name': 'contracts.expire_leases'}, format='json')
+        self.assertIn('name', response.json())
+        response = self.client.post(
+            reverse('job-list'), {'name': 'analytics.report', 'args': {'report': 'nope'}}, format='json')
+        self.assertIn('args', response.json())
+
+        self.client.force_authenticate(self.staff)
+        response = self.client.post(
+            reverse('job-list'), {'name': 'contracts.expire_leases', 'args': {'full': True}, 'priority': 10},
+            format='json')
+        self.assertEqual((response.status_code, response.json()['priority']), (201, 10))
+        self.assertIn('contracts.expire_leases', registry)
+
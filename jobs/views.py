@@ -0,0 +1,23 @@
+from rest_framework import mixins, status, viewsets
+from rest_framework.reverse import reverse
+from rest_framework.response import Response
+from real_estate_management.permissions import OwnerScopedMixin
+from .models import Job
+from .queue import enqueue
+from .serializers import EnqueueSerializer, JobSerializer
+
+
+class JobViewSet(OwnerScopedMixin, mixins.CreateModelMixin, mixins.RetrieveModelMixin, mixins.ListModelMixin,
+                 viewsets.GenericViewSet):
+    """Enqueue jobs and poll them. Users see the jobs they queued; staff see all."""
+
+    queryset = Job.objects.all()
+    serializer_class = JobSerializer
+
+    def create(self, request, *args, **kwargs):
+        body = EnqueueSerializer(data=request.data, context=self.get_serializer_context())
+        body.is_valid(raise_exception=True)
+        job, created = enqueue(user=request.user, **body.validated_data)
+        return Response(
+            JobSerializer(job).data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+            headers={'Location': reverse('job-detail', args=[job.pk], request=request)})
@@ -0,0 +1,81 @@
+import logging
+import multiprocessing
+import os
+import socket
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from . import queue
+from .process import init_worker, run_task
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """Claim due jobs and run them on a pool of ``processes`` child processes.
+
+    With ``processes=0`` jobs run one at a time in this process, which is
+    what the tests and ``--once`` debugging runs use.
+    """
+
+    def __init__(self, processes, poll=1.0, stale_after=None):
+        self.processes = processes
+        self.poll = poll
+        self.stale_after = stale_after
+        self.name = f'{socket.gethostname()}:{os.getpid()}'
+        self.executor = None
+        self.broken = False
+
+    def start_pool(self):
+        # Spawned rather than forked: children open their own database connections.
+        return ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=multiprocessing.get_context('spawn'), initializer=init_worker)
+
+    def run(self, once=False):
+        """Process jobs until interrupted; with ``once``, stop when nothing is due or running."""
+        if self.processes:
+            self.executor = self.start_pool()
+        running = {}
+        processed = 0
+        try:
+            while True:
+                queue.requeue_stale(self.stale_after)
+                jobs = queue.claim(self.name, max(self.processes, 1) - len(running))
+                for job in jobs:
+                    if self.executor is None:
+                        self.finish(job, *run_task(job.name, job.args))
+                        processed += 1
+                    else:
+                        running[self.executor.submit(run_task, job.name, job.args)] = job
+                if running:
+                    done, _ = wait(running, timeout=self.poll, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.finish(running.pop(future), *self.outcome(future))
+                        processed += 1
+                    if self.broken:
+                        self.executor.shutdown(wait=False, cancel_futures=True)
+                        self.executor, self.broken = self.start_pool(), False
+                elif not jobs:
+                    if once:
+                        return processed
+                    time.sleep(self.poll)
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(cancel_futures=True)
+
+    def outcome(self, future):
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            # A child died (killed, out of memory); its jobs are retried on a fresh pool.
+            self.broken = True
+            return False, traceback.format_exc()
+
+    def finish(self, job, ok, value):
+        if ok:
+            queue.complete(job, value)
+            logger.info("Job %s (%s) succeeded", job.pk, job.name)
+        else:
+            queue.fail(job, value)
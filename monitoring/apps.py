@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'monitoring'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from rest_framework.serializers import BaseSerializer
+
+        from .stats import install_query_recorder, timed_serializer_data
+
+        connection_created.connect(install_query_recorder, dispatch_uid='monitoring.record_query')
+        BaseSerializer.data = timed_serializer_data(BaseSerializer.data)
@@ -0,0 +1,108 @@
+"""Process-local metric registry rendered in the Prometheus text format.
+
+Each worker process keeps its own numbers; scrape every worker (or run a
+single worker per container) to get the full picture.
+"""
+import threading
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+def format_labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                     for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+class Counter:
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, labels=(), amount=1):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        with self.lock:
+            for labels, value in sorted(self.values.items()):
+                yield self.name, format_labels(self.labels, labels), value
+
+
+class Histogram(Counter):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, labels=()):
+        with self.lock:
+            state = self.values.get(labels)
+            if state is None:
+                state = self.values[labels] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        names = (*self.labels, 'le')
+        with self.lock:
+            for labels, (counts, total, observations) in sorted(self.values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    yield f'{self.name}_bucket', format_labels(names, (*labels, bound)), cumulative
+                yield f'{self.name}_bucket', format_labels(names, (*labels, '+Inf')), observations
+                yield f'{self.name}_sum', format_labels(self.labels, labels), total
+                yield f'{self.name}_count', format_labels(self.labels, labels), observations
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(f'{name}{labels} {value}' for name, labels, value in metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+ROUTE_LABELS = ('route', 'method')
+
+REQUEST_LATENCY = REGISTRY.register(Histogram(
+    'http_request_duration_seconds', "Request latency by route.", ROUTE_LABELS))
+REQUEST_QUERIES = REGISTRY.register(Histogram(
+    'http_request_db_queries', "Database queries per request by route.", ROUTE_LABELS, QUERY_COUNT_BUCKETS))
+DB_SECONDS = REGISTRY.register(Counter(
+    'http_request_db_seconds_total', "Time spent in database queries by route.", ROUTE_LABELS))
+SERIALIZER_SECONDS = REGISTRY.register(Counter(
+    'http_request_serializer_seconds_total', "Time spent rendering DRF serializers by route.", ROUTE_LABELS))
+DUPLICATE_QUERIES = REGISTRY.register(Counter(
+    'http_request_duplicate_queries_total',
+    "Repeated identical SQL statements (likely N+1 patterns) by route.", ROUTE_LABELS))
+RESPONSES = REGISTRY.register(Counter(
+    'http_responses_total', "Responses by route and status code.", (*ROUTE_LABELS, 'status')))
+BULK_BATCH_SECONDS = REGISTRY.register(Histogram(
+    'bulk_write_batch_seconds', "Time to validate and write one bulk API batch.", ('resource', 'operation')))
+BULK_ITEMS = REGISTRY.register(Counter(
+    'bulk_write_items_total', "Bulk API items by outcome.", ('resource', 'operation', 'status')))
@@ -0,0 +1,104 @@
+import cProfile
+import io
+import logging
+import pstats
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+
+from users.scopes import sees_everything
+from . import metrics
+from .stats import RequestStats, current
+
+logger = logging.getLogger(__name__)
+
+PROFILE_PARAM = '_profile'
+
+
+def route_of(request):
+    match = getattr(request, 'resolver_match', None)
+    return (match.view_name or match.route) if match else 'unmatched'
+
+
+def is_staff_request(request):
+    try:
+        result = JWTStatelessUserAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return False
+    user = result[0] if result else getattr(request, 'user', None)
+    return user is not None and sees_everything(user)
+
+
+class InstrumentationMiddleware:
+    """Record latency, query count/time, duplicate queries and serializer time per route.
+
+    Staff can append ``?_profile=1`` to any URL to get a cProfile report
+    instead of the normal response.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.duplicate_threshold = getattr(settings, 'N_PLUS_ONE_THRESHOLD', 5)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            current.reset(token)
+        self.record(request, response, stats, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            current.reset(token)
+        self.record(request, response, stats, time.perf_counter() - started)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if iscoroutinefunction(view_func):
+            return None
+        if request.GET.get(PROFILE_PARAM) != '1' or not is_staff_request(request):
+            return None
+        profiler = cProfile.Profile()
+        response = profiler.runcall(view_func, request, *view_args, **view_kwargs)
+        if hasattr(response, 'render'):
+            profiler.runcall(response.render)
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(60)
+        return HttpResponse(output.getvalue(), content_type='text/plain; charset=utf-8')
+
+    def record(self, request, response, stats, elapsed):
+        labels = (route_of(request), request.method)
+        metrics.REQUEST_LATENCY.observe(elapsed, labels)
+        metrics.REQUEST_QUERIES.observe(stats.queries, labels)
+        metrics.DB_SECONDS.inc(labels, stats.db_seconds)
+        metrics.SERIALIZER_SECONDS.inc(labels, stats.serializer_seconds)
+        metrics.RESPONSES.inc((*labels, response.status_code))
+        duplicates = stats.duplicates(self.duplicate_threshold)
+        if duplicates:
+            metrics.DUPLICATE_QUERIES.inc(labels, sum(duplicates.values()) - len(duplicates))
+            for sql, count in duplicates.items():
+                logger.warning("Possible N+1 on %s: %d× %s", labels[0], count, sql)
+        if settings.DEBUG:
+            response['Server-Timing'] = (
+                f'total;dur={elapsed * 1000:.1f}, db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+                f'serializer;dur={stats.serializer_seconds * 1000:.1f}')
@@ -0,0 +1,53 @@
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+current = ContextVar('request_stats', default=None)
+
+
+class RequestStats:
+    """Timings collected while one request is being handled."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.statements = Counter()
+
+    def duplicates(self, threshold):
+        return {sql: count for sql, count in self.statements.items() if count >= threshold}
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """``connection_created`` receiver: count queries on every connection, in every thread."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def record_query(execute, sql, params, many, context):
+    stats = current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.db_seconds += time.perf_counter() - started
+        stats.queries += 1
+        stats.statements[sql] += 1
+
+
+def timed_serializer_data(prop):
+    """Wrap ``BaseSerializer.data`` so time spent building representations is recorded."""
+
+    def data(serializer):
+        stats = current.get()
+        if stats is None:
+            return prop.fget(serializer)
+        started = time.perf_counter()
+        try:
+            return prop.fget(serializer)
+        finally:
+            stats.serializer_seconds += time.perf_counter() - started
+
+    return property(data)
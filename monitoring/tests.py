@@ -0,0 +1,77 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from properties.models import Property
+from users.models import CustomUser
+from . import metrics
+from .stats import RequestStats
+
+
+class RegistryTests(TestCase):
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = metrics.Histogram('test_seconds', 'Test histogram.', ('route',), buckets=(0.1, 1))
+        histogram.observe(0.05, ('a',))
+        histogram.observe(0.5, ('a',))
+        registry = metrics.Registry()
+        registry.register(histogram)
+        text = registry.render()
+        self.assertIn('# TYPE test_seconds histogram', text)
+        self.assertIn('test_seconds_bucket{route="a",le="0.1"} 1', text)
+        self.assertIn('test_seconds_bucket{route="a",le="1"} 2', text)
+        self.assertIn('test_seconds_bucket{route="a",le="+Inf"} 2', text)
+        self.assertIn('test_seconds_count{route="a"} 2', text)
+
+    def test_duplicates_respect_threshold(self):
+        stats = RequestStats()
+        stats.statements.update({'SELECT 1': 5, 'SELECT 2': 4})
+        self.assertEqual(stats.duplicates(5), {'SELECT 1': 5})
+
+
+class MiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = CustomUser.objects.create_user(username='staff', password='x', is_staff=True)
+        cls.owner = CustomUser.objects.create_user(username='owner', password='x')
+        Property.objects.create(name='عقار', address='مسقط', description='-', propert_type='apartment', owner=cls.owner)
+
+    def samples(self, metric, route):
+        return {labels: value for name, labels, value in metric.samples() if route in labels}
+
+    def test_requests_are_counted_per_route(self):
+        self.client.force_login(self.staff)
+        before = self.samples(metrics.RESPONSES, 'property-list')
+        self.client.get('/api/properties/')
+        after = self.samples(metrics.RESPONSES, 'property-list')
+        key = next(labels for labels in after if '200' in labels)
+        self.assertEqual(after[key], before.get(key, 0) + 1)
+        queries = self.samples(metrics.REQUEST_QUERIES, 'property-list')
+        self.assertTrue(any(value > 0 for value in queries.values()))
+
+    def test_metrics_endpoint_is_staff_only_by_default(self):
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        self.client.force_login(self.owner)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'http_request_duration_seconds', response.content)
+
+    @override_settings(METRICS_ALLOWED_IPS=['10.0.0.9'])
+    def test_allowed_addresses_scrape_without_logging_in(self):
+        self.assertEqual(self.client.get(reverse('metrics'), REMOTE_ADDR='10.0.0.9').status_code, 200)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+
+    @override_settings(DEBUG=True)
+    def test_server_timing_header(self):
+        self.client.force_login(self.staff)
+        response = self.client.get('/api/properties/')
+        self.assertIn('db;dur=', response['Server-Timing'])
+
+    def test_profile_is_staff_only(self):
+        self.client.force_login(self.staff)
+        response = self.client.get('/api/properties/?_profile=1')
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+        self.assertIn(b'cumulative', response.content)
+        self.client.force_login(self.owner)
+        response = self.client.get('/api/properties/?_profile=1')
+        self.assertEqual(response['Content-Type'], 'application/json')
@@ -0,0 +1,12 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+from users.scopes import sees_everything
+from .metrics import REGISTRY
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint, open to staff sessions and ``METRICS_ALLOWED_IPS``."""
+    if request.META.get('REMOTE_ADDR') not in settings.METRICS_ALLOWED_IPS and not sees_everything(request.user):
+        return HttpResponseForbidden()
+    return HttpResponse(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,3 +1,18 @@
 from django.contrib import admin
+from .models import Payment, RentInvoice
 
-# Register your models here.
+@admin.register(RentInvoice)
+class RentInvoiceAdmin(admin.ModelAdmin):
+    list_display = ['contract', 'period', 'amount', 'due_date', 'issued_at']
+    list_filter = ['period']
+    raw_id_fields = ['contract']
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('contract__tenant', 'contract__property')
+
+
+@admin.register(Payment)
+class PaymentAdmin(admin.ModelAdmin):
+    list_display = ['invoice', 'amount', 'paid_on', 'method']
+    list_filter = ['method', 'paid_on']
+    raw_id_fields = ['invoice']
\ No newline at end of file
@@ -0,0 +1,52 @@
+import calendar
+from datetime import date
+
+from django.db import transaction
+from contracts.models import LeasContract
+from .models import RentInvoice
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def parse_period(value):
+    """Return the first day of the month for a ``YYYY-MM`` string."""
+    year, month = (int(part) for part in value.split('-'))
+    return date(year, month, 1)
+
+
+def period_end(period):
+    return period.replace(day=calendar.monthrange(period.year, period.month)[1])
+
+
+def contracts_billable_in(period, owner_id=None):
+    contracts = LeasContract.objects.filter(
+        is_active=True, start_date__lte=period_end(period), end_date__gte=period)
+    if owner_id is not None:
+        contracts = contracts.filter(property__owner_id=owner_id)
+    return contracts
+
+
+def generate_monthly_invoices(period, batch_size=DEFAULT_BATCH_SIZE, owner_id=None):
+    """Issue one invoice per billable contract for ``period``.
+
+    Rows are written with ``bulk_create`` in batches; contracts that already
+    have an invoice for the period are skipped by the unique constraint, so
+    running the job twice for the same month is harmless. Returns the number
+    of invoices created. With ``owner_id`` only that owner's contracts are billed.
+    """
+    rows = contracts_billable_in(period, owner_id).order_by('pk').values_list('pk', 'monthly_rent')
+    existing = RentInvoice.objects.filter(period=period)
+    if owner_id is not None:
+        existing = existing.filter(contract__property__owner_id=owner_id)
+    with transaction.atomic():
+        before = existing.count()
+        batch = []
+        for contract_id, monthly_rent in rows.iterator(chunk_size=batch_size):
+            batch.append(RentInvoice(
+                contract_id=contract_id, period=period, amount=monthly_rent, due_date=period))
+            if len(batch) >= batch_size:
+                RentInvoice.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        if batch:
+            RentInvoice.objects.bulk_create(batch, ignore_conflicts=True)
+        return existing.count() - before
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from payments.billing import DEFAULT_BATCH_SIZE, generate_monthly_invoices, parse_period
+
+
+class Command(BaseCommand):
+    help = "Generate rent invoices for every active contract in a month."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--period', help="Billing month as YYYY-MM (defaults to the current month).")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            period = parse_period(options['period']) if options['period'] else timezone.localdate().replace(day=1)
+        except ValueError as exc:
+            raise CommandError(f"Invalid period {options['period']!r}, expected YYYY-MM.") from exc
+        created = generate_monthly_invoices(period, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Created {created} invoices for {period:%Y-%m}."))
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contracts', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RentInvoice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField(verbose_name='الفترة')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='المبلغ')),
+                ('due_date', models.DateField(verbose_name='تاريخ الاستحقاق')),
+                ('issued_at', models.DateTimeField(auto_now_add=True, verbose_name='تاريخ الإصدار')),
+                ('contract', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='invoices', to='contracts.leascontract', verbose_name='العقد')),
+            ],
+            options={
+                'verbose_name': 'فاتورة إيجار',
+                'verbose_name_plural': 'فواتير الإيجار',
+            },
+        ),
+        migrations.CreateModel(
+            name='Payment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='المبلغ')),
+                ('paid_on', models.DateField(verbose_name='تاريخ الدفع')),
+                ('method', models.CharField(choices=[('cash', 'نقدي'), ('transfer', 'تحويل بنكي'), ('cheque', 'شيك')], max_length=10, verbose_name='طريقة الدفع')),
+                ('reference', models.CharField(blank=True, max_length=100, verbose_name='المرجع')),
+                ('invoice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payments', to='payments.rentinvoice', verbose_name='الفاتورة')),
+            ],
+            options={
+                'verbose_name': 'دفعة',
+                'verbose_name_plural': 'الدفعات',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='rentinvoice',
+            constraint=models.UniqueConstraint(fields=('contract', 'period'), name='unique_invoice_per_contract_period'),
+        ),
+    ]
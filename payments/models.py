@@ -1,3 +1,59 @@
 from django.db import models
+from contracts.models import LeasContract
+from users.scopes import sees_everything
 
-# Create your models here.
+class RentInvoiceQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(contract__property__owner_id=user.id)
+
+class PaymentQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(invoice__contract__property__owner_id=user.id)
+
+class RentInvoice(models.Model):
+  contract = models.ForeignKey(LeasContract, on_delete=models.CASCADE, related_name='invoices', verbose_name="العقد")
+  period = models.DateField(verbose_name="الفترة")
+  amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="المبلغ")
+  due_date = models.DateField(verbose_name="تاريخ الاستحقاق")
+  issued_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإصدار")
+
+  objects = RentInvoiceQuerySet.as_manager()
+
+  def __str__(self):
+    return f"{self.contract_id} - {self.period:%Y-%m}"
+
+  class Meta:
+    verbose_name = "فاتورة إيجار"
+    verbose_name_plural = "فواتير الإيجار"
+    constraints = [
+      models.UniqueConstraint(fields=['contract', 'period'], name='unique_invoice_per_contract_period'),
+    ]
+
+class Payment(models.Model):
+  METHOD_CHOICES = [
+    ('cash', 'نقدي'),
+    ('transfer', 'تحويل بنكي'),
+    ('cheque', 'شيك'),
+  ]
+  invoice = models.ForeignKey(RentInvoice, on_delete=models.CASCADE, related_name='payments', verbose_name="الفاتورة")
+  amount = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="المبلغ")
+  paid_on = models.DateField(verbose_name="تاريخ الدفع")
+  method = models.CharField(max_length=10, choices=METHOD_CHOICES, verbose_name="طريقة الدفع")
+  reference = models.CharField(max_length=100, blank=True, verbose_name="المرجع")
+
+  objects = PaymentQuerySet.as_manager()
+
+  def __str__(self):
+    return f"{self.invoice} - {self.amount}"
+
+  class Meta:
+    verbose_name = "دفعة"
+    verbose_name_plural = "الدفعات"
\ No newline at end of file
@@ -0,0 +1,27 @@
+from rest_framework import serializers
+from real_estate_management.permissions import scope_related_field
+from .billing import parse_period
+from .models import Payment, RentInvoice
+
+class RentInvoiceSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RentInvoice
+        fields = '__all__'
+
+
+class PaymentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Payment
+        fields = '__all__'
+
+    def get_fields(self):
+        fields = super().get_fields()
+        scope_related_field(fields, 'invoice', self.context)
+        return fields
+
+
+class GenerateInvoicesSerializer(serializers.Serializer):
+    period = serializers.RegexField(r'^\d{4}-(0[1-9]|1[0-2])$')
+
+    def validate_period(self, value):
+        return parse_period(value)
\ No newline at end of file
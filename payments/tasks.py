@@ -0,0 +1,23 @@
+from datetime import date
+
+from jobs.registry import task
+from users.scopes import sees_everything
+from .billing import generate_monthly_invoices
+from .serializers import GenerateInvoicesSerializer
+
+
+class InvoiceJobSerializer(GenerateInvoicesSerializer):
+    """``period`` as ``YYYY-MM``; non-staff users only bill their own contracts."""
+
+    def validate(self, attrs):
+        request = self.context.get('request')
+        if request is not None and not sees_everything(request.user):
+            attrs['owner'] = request.user.id
+        return attrs
+
+
+@task('payments.generate_invoices', params=InvoiceJobSerializer, public=True)
+def generate_invoices(period, owner=None):
+    """Bill a month off the request path; reruns skip contracts already invoiced."""
+    period = date.fromisoformat(period)
+    return {'period': f"{period:%Y-%m}", 'created': generate_monthly_invoices(period, owner_id=owner)}
@@ -1,3 +1,88 @@
+from datetime import date
+from io import StringIO
+from decimal import Decimal
+
+from django.core.management import call_command
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from jobs.worker import Worker
+from properties.models import Property
+from tenants.models import Tenant
+from users.models import CustomUser
+from .billing import generate_monthly_invoices
+from .models import RentInvoice
+
+
+class InvoiceFixturesMixin:
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(username='owner', password='x')
+        self.tenants = [
+            Tenant.objects.create(name=f'مستأجر {i}', phone='0500000000', email=f't{i}@example.com', address='جدة')
+            for i in range(4)
+        ]
+
+    def lease(self, tenant, start, end, rent='1000.00', is_active=True):
+        prop = Property.objects.create(
+            name=f'مكتب {tenant.pk}', propert_type='office', description='-', address='جدة', owner=self.owner)
+        return LeasContract.objects.create(
+            tenant=tenant, property=prop, start_date=start, end_date=end,
+            monthly_rent=Decimal(rent), is_active=is_active)
+
+
+class GenerateMonthlyInvoicesTests(InvoiceFixturesMixin, TestCase):
+    def test_bills_only_active_contracts_overlapping_the_month(self):
+        current = self.lease(self.tenants[0], date(2024, 1, 1), date(2024, 12, 31), rent='3200.00')
+        self.lease(self.tenants[1], date(2024, 1, 1), date(2024, 12, 31), is_active=False)
+        self.lease(self.tenants[2], date(2024, 6, 1), date(2025, 5, 31))
+        ends_mid_month = self.lease(self.tenants[3], date(2023, 5, 15), date(2024, 5, 14))
+
+        created = generate_monthly_invoices(date(2024, 5, 1), batch_size=1)
+
+        self.assertEqual(created, 2)
+        invoices = RentInvoice.objects.filter(period=date(2024, 5, 1))
+        self.assertCountEqual(invoices.values_list('contract', flat=True), [current.pk, ends_mid_month.pk])
+        self.assertEqual(invoices.get(contract=current).amount, Decimal('3200.00'))
+
+    def test_rerun_is_idempotent(self):
+        self.lease(self.tenants[0], date(2024, 1, 1), date(2024, 12, 31))
+        self.assertEqual(generate_monthly_invoices(date(2024, 5, 1)), 1)
+        self.assertEqual(generate_monthly_invoices(date(2024, 5, 1)), 0)
+        self.assertEqual(RentInvoice.objects.count(), 1)
+
+    def test_management_command(self):
+        self.lease(self.tenants[0], date(2024, 1, 1), date(2024, 12, 31))
+        call_command('generate_invoices', '--period', '2024-02', stdout=StringIO())
+        self.assertTrue(RentInvoice.objects.filter(period=date(2024, 2, 1)).exists())
+
+
+class GenerateInvoicesApiTests(InvoiceFixturesMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(CustomUser.objects.create_user(username='staff', password='x', is_staff=True))
+
+    def test_generate_endpoint(self):
+        self.lease(self.tenants[0], date(2024, 1, 1), date(2024, 12, 31))
+        url = reverse('rentinvoice-generate')
+        response = self.client.post(url, {'period': '2024-03'}, format='json')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(RentInvoice.objects.count(), 0)
+        Worker(0).run(once=True)
+        job = self.client.get(response['Location']).json()
+        self.assertEqual((job['status'], job['result']), ('succeeded', {'period': '2024-03', 'created': 1}))
+        self.assertEqual(self.client.post(url, {'period': '2024-13'}, format='json').status_code, 400)
 
-# Create your tests here.
+    def test_owners_bill_only_their_own_contracts(self):
+        mine = self.lease(self.tenants[0], date(2024, 1, 1), date(2024, 12, 31))
+        other = CustomUser.objects.create_user(username='other', password='x')
+        prop = Property.objects.create(name='آخر', propert_type='shop', description='-', address='-', owner=other)
+        LeasContract.objects.create(
+            tenant=self.tenants[1], property=prop, start_date=date(2024, 1, 1), end_date=date(2024, 12, 31),
+            monthly_rent=Decimal('500.00'))
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(reverse('rentinvoice-generate'), {'period': '2024-03'}, format='json')
+        self.assertEqual(response.json()['args']['owner'], self.owner.pk)
+        Worker(0).run(once=True)
+        self.assertEqual(list(RentInvoice.objects.values_list('contract', flat=True)), [mine.pk])
@@ -0,0 +1,8 @@
+from rest_framework.routers import DefaultRouter
+from .views import PaymentViewSet, RentInvoiceViewSet
+
+router = DefaultRouter()
+router.register(r'invoices', RentInvoiceViewSet)
+router.register(r'payments', PaymentViewSet)
+
+urlpatterns = router.urls
\ No newline at end of file
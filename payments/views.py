@@ -1,3 +1,32 @@
-from django.shortcuts import render
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from jobs.queue import enqueue
+from jobs.serializers import JobSerializer
+from real_estate_management.permissions import OwnerScopedMixin
+from real_estate_management.streaming import StreamingListMixin
+from .models import Payment, RentInvoice
+from .serializers import PaymentSerializer, RentInvoiceSerializer
+from .tasks import InvoiceJobSerializer
 
-# Create your views here.
+class RentInvoiceViewSet(OwnerScopedMixin, StreamingListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = RentInvoice.objects.all()
+    serializer_class = RentInvoiceSerializer
+
+    @action(detail=False, methods=['post'], serializer_class=InvoiceJobSerializer)
+    def generate(self, request):
+        """Queue the month's invoices; the job's result holds the number created."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # Owners bill only their own contracts; staff bill everyone's.
+        args = {**serializer.validated_data, 'period': serializer.validated_data['period'].isoformat()}
+        job, _ = enqueue('payments.generate_invoices', args, user=request.user)
+        return Response(
+            JobSerializer(job).data, status=status.HTTP_202_ACCEPTED,
+            headers={'Location': reverse('job-detail', args=[job.pk], request=request)})
+
+
+class PaymentViewSet(OwnerScopedMixin, StreamingListMixin, viewsets.ModelViewSet):
+    queryset = Payment.objects.all()
+    serializer_class = PaymentSerializer
\ No newline at end of file
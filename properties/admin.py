@@ -1,8 +1,10 @@
 from django.contrib import admin
+from search.admin import IndexedSearchAdminMixin
 from .models import Property
 
 @admin.register(Property)
-class PropertyAdmin(admin.ModelAdmin):
+class PropertyAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
+    search_kind = 'property'
     list_display = ['name', 'propert_type', 'owner']
     list_filter = ['propert_type']
     search_fields = ['name', 'address']
\ No newline at end of file
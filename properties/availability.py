@@ -0,0 +1,34 @@
+"""Vacancy queries over active leases.
+
+Every lookup is an anti-join (``NOT EXISTS``) against the partial
+``contract_active_property_dates`` index on ``(property, start_date, end_date)``,
+so it never loads contracts for properties that are simply free.
+"""
+from datetime import timedelta
+
+from django.db.models import Exists, OuterRef
+
+from contracts.models import LeasContract
+
+MAX_RANGES = 50
+
+
+def vacant_between(queryset, start_date, end_date, property_type=None):
+    """Properties from ``queryset`` with no active lease touching ``[start_date, end_date]``."""
+    if property_type:
+        queryset = queryset.filter(propert_type=property_type)
+    leased = LeasContract.objects.overlapping(OuterRef('pk'), start_date, end_date)
+    return queryset.filter(~Exists(leased))
+
+
+def next_free_date(property_id, on_or_after):
+    """First day on or after ``on_or_after`` that no active lease of the property covers."""
+    leases = (
+        LeasContract.objects.filter(property_id=property_id, is_active=True, end_date__gte=on_or_after)
+        .order_by('start_date').values_list('start_date', 'end_date'))
+    day = on_or_after
+    for start_date, end_date in leases:
+        if start_date > day:
+            break
+        day = max(day, end_date + timedelta(days=1))
+    return day
@@ -0,0 +1,178 @@
+"""Property coordinates: geocoding from a local gazetteer and a geohash index.
+
+Addresses are matched against the place names in ``GAZETTEER_PATH`` (a CSV of
+``name,kind,latitude,longitude``); districts win over the cities that contain
+them. No network lookups are made.
+
+Every located property stores the geohash of its coordinates. Spatial queries
+cover their bounding box with at most ``MAX_CELLS`` geohash cells and turn
+each cell into a range on the indexed ``geohash`` column, then apply the exact
+box or great-circle distance only to the rows in those cells.
+"""
+import csv
+import math
+from functools import cache
+from pathlib import Path
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+from search.normalization import tokenize
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_PRECISION = 9
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+MAX_CELLS = 32
+NEAREST_START_KM = 2
+MAX_RADIUS_KM = 500
+MAX_NEAREST = 100
+MAX_SPATIAL_RESULTS = 500
+DEFAULT_GAZETTEER = Path(__file__).resolve().parent / 'data' / 'gazetteer.csv'
+SPECIFICITY = {'district': 2, 'city': 1}
+
+
+def normalize(text):
+    # The search index's folding, so spelling variants of a place name still match.
+    return ' '.join(tokenize(text))
+
+
+class Gazetteer:
+    def __init__(self, places):
+        # Most specific, then longest, names first: the first match wins.
+        self.places = sorted(
+            ((f' {normalize(name)} ', SPECIFICITY.get(kind, 0), lat, lon) for name, kind, lat, lon in places),
+            key=lambda place: (-place[1], -len(place[0])))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, newline='', encoding='utf-8') as handle:
+            return cls([(row['name'], row['kind'], float(row['latitude']), float(row['longitude']))
+                        for row in csv.DictReader(handle)])
+
+    def lookup(self, address):
+        padded = f' {normalize(address)} '
+        for name, _, lat, lon in self.places:
+            if name in padded:
+                return lat, lon
+        return None
+
+
+@cache
+def gazetteer():
+    return Gazetteer.load(getattr(settings, 'GAZETTEER_PATH', DEFAULT_GAZETTEER))
+
+
+def geocode(address):
+    """``(latitude, longitude)`` of the most specific place named in ``address``, or ``None``."""
+    return gazetteer().lookup(address or '')
+
+
+def locate(prop):
+    """Fill in missing coordinates from the address and refresh the geohash; true if anything changed."""
+    before = (prop.latitude, prop.longitude, prop.geohash)
+    if prop.latitude is None or prop.longitude is None:
+        prop.latitude, prop.longitude = geocode(prop.address) or (None, None)
+    located = prop.latitude is not None and prop.longitude is not None
+    prop.geohash = encode(prop.latitude, prop.longitude) if located else ''
+    return (prop.latitude, prop.longitude, prop.geohash) != before
+
+
+def encode(lat, lon, precision=GEOHASH_PRECISION):
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, count, even = [], 0, 0, True
+    while len(chars) < precision:
+        bounds, value = (lon_range, lon) if even else (lat_range, lat)
+        mid = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            bounds[0] = mid
+        else:
+            bounds[1] = mid
+        even = not even
+        count += 1
+        if count == 5:
+            chars.append(BASE32[bits])
+            bits = count = 0
+    return ''.join(chars)
+
+
+def cell_size(precision):
+    """``(latitude, longitude)`` degrees spanned by one cell of ``precision`` characters."""
+    bits = 5 * precision
+    return 180 / 2 ** (bits // 2), 360 / 2 ** (bits - bits // 2)
+
+
+def covering_cells(south, west, north, east, max_cells=MAX_CELLS):
+    """The finest set of at most ``max_cells`` geohash cells that covers the box."""
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        dlat, dlon = cell_size(precision)
+        first_row, first_col = math.floor((south + 90) / dlat), math.floor((west + 180) / dlon)
+        rows = math.floor((north + 90) / dlat) - first_row + 1
+        cols = math.floor((east + 180) / dlon) - first_col + 1
+        if rows * cols <= max_cells:
+            break
+    return {
+        encode(min((first_row + row + 0.5) * dlat - 90, 90), min((first_col + col + 0.5) * dlon - 180, 180), precision)
+        for row in range(rows) for col in range(cols)
+    }
+
+
+def box_filter(south, west, north, east):
+    cells = Q()
+    for prefix in sorted(covering_cells(south, west, north, east)):
+        cells |= Q(geohash__gte=prefix, geohash__lt=prefix + '~')
+    return cells & Q(latitude__range=(south, north), longitude__range=(west, east))
+
+
+def radius_box(lat, lon, km):
+    """``(south, west, north, east)`` of the smallest box containing the circle."""
+    angle = km / EARTH_RADIUS_KM
+    south, north = lat - math.degrees(angle), lat + math.degrees(angle)
+    if south <= -90 or north >= 90 or math.sin(angle) >= math.cos(math.radians(lat)):
+        return max(south, -90), -180, min(north, 90), 180
+    spread = math.degrees(math.asin(math.sin(angle) / math.cos(math.radians(lat))))
+    return south, max(lon - spread, -180), north, min(lon + spread, 180)
+
+
+def distance_expression(lat, lon):
+    """Great-circle distance in km from ``(lat, lon)`` to each row's coordinates (haversine)."""
+    half_dlat = Radians(F('latitude') - lat) / 2
+    half_dlon = Radians(F('longitude') - lon) / 2
+    a = Power(Sin(half_dlat), 2) + math.cos(math.radians(lat)) * Cos(Radians(F('latitude'))) * Power(Sin(half_dlon), 2)
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(a))
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    half_dlat, half_dlon = math.radians(lat2 - lat1) / 2, math.radians(lon2 - lon1) / 2
+    a = math.sin(half_dlat) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(half_dlon) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def within_box(queryset, south, west, north, east):
+    return queryset.filter(box_filter(south, west, north, east))
+
+
+def within_radius(queryset, lat, lon, km):
+    """Properties within ``km`` of ``(lat, lon)``, nearest first, annotated with ``distance_km``."""
+    return (
+        queryset.filter(box_filter(*radius_box(lat, lon, km)))
+        .annotate(distance_km=distance_expression(lat, lon))
+        .filter(distance_km__lte=km)
+        .order_by('distance_km', 'pk')
+    )
+
+
+def nearest(queryset, lat, lon, k):
+    """The ``k`` properties nearest to ``(lat, lon)``, searching outwards from ``NEAREST_START_KM``.
+
+    Once ``k`` rows lie within the search radius, no row outside it can be
+    nearer, so each widening step is one indexed query.
+    """
+    km = NEAREST_START_KM
+    while True:
+        found = list(within_radius(queryset, lat, lon, km)[:k])
+        if len(found) == k or km >= math.pi * EARTH_RADIUS_KM:
+            return found
+        km *= 4
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from properties.geo import locate
+from properties.models import Property
+from real_estate_management.signals import bulk_saved
+
+
+class Command(BaseCommand):
+    help = "Fill in property coordinates from the local gazetteer and rebuild their geohashes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true', help="Geocode every property again, replacing coordinates set by hand.")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        properties = Property.objects.order_by('pk')
+        if not options['all']:
+            properties = properties.filter(geohash='')
+        located = missing = 0
+        batch = []
+        for prop in properties.iterator(chunk_size=options['batch_size']):
+            if options['all']:
+                prop.latitude = prop.longitude = None
+            if locate(prop):
+                batch.append(prop)
+            if prop.geohash:
+                located += 1
+            else:
+                missing += 1
+            if len(batch) >= options['batch_size']:
+                self.save(batch)
+                batch = []
+        self.save(batch)
+        self.stdout.write(self.style.SUCCESS(f"Located {located} properties; {missing} addresses not found."))
+
+    def save(self, batch):
+        if batch:
+            with transaction.atomic():
+                Property.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+                bulk_saved.send(sender=Property, instances=batch)
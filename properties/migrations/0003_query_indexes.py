@@ -0,0 +1,27 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['owner', 'propert_type'], name='property_owner_type'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['propert_type'], name='property_type'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['name'], name='property_name'),
+        ),
+    ]
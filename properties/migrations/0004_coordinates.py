@@ -0,0 +1,50 @@
+# Generated by Django 5.1.4 on 2026-10-18 18:04
+
+import django.core.validators
+from django.conf import settings
+from django.db import migrations, models
+
+
+def geocode_existing(apps, schema_editor):
+    from properties.geo import locate
+
+    Property = apps.get_model('properties', 'Property')
+    batch = []
+    for prop in Property.objects.iterator(chunk_size=1000):
+        if locate(prop):
+            batch.append(prop)
+        if len(batch) == 1000:
+            Property.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+            batch = []
+    Property.objects.bulk_update(batch, ['latitude', 'longitude', 'geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0003_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='geohash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=12, verbose_name='الترميز الجغرافي'),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)], verbose_name='خط العرض'),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)], verbose_name='خط الطول'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['geohash'], name='property_geohash'),
+        ),
+        migrations.RunPython(geocode_existing, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,15 @@
 from django.contrib.auth import get_user_model
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from users.scopes import sees_everything
+
+class PropertyQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(owner_id=user.id)
 
 class Property(models.Model):
   TYPE_CHOICES = [
@@ -12,10 +22,21 @@ class Property(models.Model):
   description = models.TextField(verbose_name="الوصف")
   address = models.TextField(verbose_name="العنوان")
   owner = models.ForeignKey(get_user_model(), on_delete=models.CASCADE, verbose_name="المالك")
+  latitude = models.FloatField(null=True, blank=True, validators=[MinValueValidator(-90), MaxValueValidator(90)], verbose_name="خط العرض")
+  longitude = models.FloatField(null=True, blank=True, validators=[MinValueValidator(-180), MaxValueValidator(180)], verbose_name="خط الطول")
+  geohash = models.CharField(max_length=12, blank=True, default='', editable=False, verbose_name="الترميز الجغرافي")
+
+  objects = PropertyQuerySet.as_manager()
 
   def __str__(self):
     return self.name
 
   class Meta:
     verbose_name = "عقار"
-    verbose_name_plural = "العقارات"
\ No newline at end of file
+    verbose_name_plural = "العقارات"
+    indexes = [
+      models.Index(fields=['owner', 'propert_type'], name='property_owner_type'),
+      models.Index(fields=['propert_type'], name='property_type'),
+      models.Index(fields=['name'], name='property_name'),
+      models.Index(fields=['geohash'], name='property_geohash'),
+    ]
\ No newline at end of file
@@ -1,7 +1,85 @@
 from rest_framework import serializers
+from users.scopes import sees_everything
+from .availability import MAX_RANGES
+from .geo import MAX_NEAREST, MAX_RADIUS_KM, MAX_SPATIAL_RESULTS
 from .models import Property
 
 class PropertySerialiser(serializers.ModelSerializer):
     class Meta:
         model = Property
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        owner = fields['owner']
+        if request is not None and not owner.read_only and not sees_everything(request.user):
+            owner.queryset = owner.queryset.filter(pk=request.user.id)
+        return fields
+
+    def validate(self, attrs):
+        if self.instance is not None and 'latitude' not in attrs and 'longitude' not in attrs:
+            if attrs.get('address', self.instance.address) != self.instance.address:
+                # A new address without coordinates is geocoded again on save.
+                attrs['latitude'] = attrs['longitude'] = None
+        latitude = attrs.get('latitude', getattr(self.instance, 'latitude', None))
+        longitude = attrs.get('longitude', getattr(self.instance, 'longitude', None))
+        if (latitude is None) != (longitude is None):
+            raise serializers.ValidationError("يجب تحديد خط العرض وخط الطول معاً")
+        return attrs
+
+class AvailabilityQuerySerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    type = serializers.ChoiceField(choices=Property.TYPE_CHOICES, required=False)
+
+    def validate(self, attrs):
+        if attrs['end'] < attrs['start']:
+            raise serializers.ValidationError({'end': "تاريخ النهاية يسبق تاريخ البدء"})
+        return attrs
+
+
+class VacancyRangesSerializer(serializers.Serializer):
+    ranges = AvailabilityQuerySerializer(many=True, allow_empty=False, max_length=MAX_RANGES)
+
+
+class SpatialFilterSerializer(serializers.Serializer):
+    """Optional ``type`` and vacancy (``start``/``end``) filters shared by the spatial endpoints."""
+
+    type = serializers.ChoiceField(choices=Property.TYPE_CHOICES, required=False)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        if ('start' in attrs) != ('end' in attrs):
+            raise serializers.ValidationError("يجب تحديد تاريخ البدء وتاريخ النهاية معاً")
+        if 'start' in attrs and attrs['end'] < attrs['start']:
+            raise serializers.ValidationError({'end': "تاريخ النهاية يسبق تاريخ البدء"})
+        return attrs
+
+
+class PointSerializer(SpatialFilterSerializer):
+    lat = serializers.FloatField(min_value=-90, max_value=90)
+    lon = serializers.FloatField(min_value=-180, max_value=180)
+
+
+class NearQuerySerializer(PointSerializer):
+    radius_km = serializers.FloatField(min_value=0, max_value=MAX_RADIUS_KM, default=5)
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_SPATIAL_RESULTS, default=100)
+
+
+class NearestQuerySerializer(PointSerializer):
+    k = serializers.IntegerField(min_value=1, max_value=MAX_NEAREST, default=10)
+
+
+class BoxQuerySerializer(SpatialFilterSerializer):
+    south = serializers.FloatField(min_value=-90, max_value=90)
+    west = serializers.FloatField(min_value=-180, max_value=180)
+    north = serializers.FloatField(min_value=-90, max_value=90)
+    east = serializers.FloatField(min_value=-180, max_value=180)
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if attrs['north'] < attrs['south'] or attrs['east'] < attrs['west']:
+            raise serializers.ValidationError("حدود المنطقة غير صحيحة")
+        return attrs
\ No newline at end of file
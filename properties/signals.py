@@ -0,0 +1,27 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from real_estate_management.http_cache import touch
+from real_estate_management.signals import bulk_saved
+from .geo import locate
+from .models import Property
+
+
+@receiver(pre_save, sender=Property)
+def locate_property(sender, instance, **kwargs):
+    locate(instance)
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def property_changed(sender, instance, **kwargs):
+    touch('property', instance.pk)
+
+
+@receiver(bulk_saved, sender=Property)
+def properties_bulk_saved(sender, instances, **kwargs):
+    # Bulk writes skip pre_save, so fill in their coordinates afterwards.
+    located = [obj for obj in instances if locate(obj)]
+    if located:
+        Property.objects.bulk_update(located, ['latitude', 'longitude', 'geohash'])
+    touch('property', *(obj.pk for obj in instances))
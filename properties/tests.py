@@ -1,3 +1,301 @@
-from django.test import TestCase
+import json
+import random
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from real_estate_management.caches import cache_config
+from real_estate_management.permissions import AccessCache
+from tenants.models import Tenant
+from users.models import CustomUser
+from . import geo
+from .models import Property
+
+# Query counts below are about the tables; keep the cache out of them.
+LOCAL_CACHES = cache_config(Path('.'), {'CACHE_URL': 'locmem://'})
+
+
+class PropertyAsyncReadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = CustomUser.objects.create_user(username='owner', password='x')
+        cls.properties = Property.objects.bulk_create(
+            Property(name=f'عقار {i}', propert_type='shop', description='-', address='-', owner=owner)
+            for i in range(5))
+        cls.staff = CustomUser.objects.create_user(username='staff', password='x', is_staff=True)
+
+    def setUp(self):
+        self.async_client.force_login(self.staff)
+
+    async def test_detail_matches_sync_viewset(self):
+        pk = self.properties[0].pk
+        response = await self.async_client.get(reverse('property-async-detail', args=[pk]))
+        sync_response = await self.async_client.get(reverse('property-detail', args=[pk]))
+        self.assertEqual(response.json(), sync_response.json())
+
+    async def test_missing_object_is_404(self):
+        response = await self.async_client.get(reverse('property-async-detail', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_keyset_pages_walk_the_whole_table(self):
+        url, seen = reverse('property-async-list') + '?page_size=2', []
+        while url:
+            body = (await self.async_client.get(url)).json()
+            seen.extend(row['id'] for row in body['results'])
+            url = body['next']
+        self.assertEqual(seen, sorted((obj.pk for obj in self.properties), reverse=True))
+
+    async def test_stream(self):
+        response = await self.async_client.get(reverse('property-async-list'), {'stream': '1'})
+        lines = [line async for line in response.streaming_content]
+        self.assertEqual(len(b''.join(lines).decode().splitlines()), 5)
+        self.assertEqual(json.loads(lines[0])['name'], 'عقار 4')
+
+    async def test_rejects_bad_parameters(self):
+        response = await self.async_client.get(reverse('property-async-list'), {'before': 'x'})
+        self.assertEqual(response.status_code, 400)
+
+    async def test_page_size_is_clamped(self):
+        for size, expected in [('0', 1), ('-3', 1), ('5000', 5)]:
+            response = await self.async_client.get(reverse('property-async-list'), {'page_size': size})
+            self.assertEqual((response.status_code, len(response.json()['results'])), (200, expected))
+
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class PropertyOwnerScopeTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.small_owner = CustomUser.objects.create_user(username='small', password='x')
+        cls.large_owner = CustomUser.objects.create_user(username='large', password='x')
+        Property.objects.bulk_create(
+            Property(name=f'صغير {i}', propert_type='shop', description='-', address='-', owner=cls.small_owner)
+            for i in range(3))
+        Property.objects.bulk_create(
+            Property(name=f'كبير {i}', propert_type='office', description='-', address='-', owner=cls.large_owner)
+            for i in range(2000))
+
+    def list_as(self, user):
+        self.client.force_authenticate(user)
+        url, names = reverse('property-list') + '?page_size=1000', []
+        with CaptureQueriesContext(connection) as queries:
+            while url:
+                body = self.client.get(url).json()
+                names.extend(row['name'] for row in body['results'])
+                url = body['next']
+        return names, len(queries)
+
+    def test_owners_only_list_their_properties_at_constant_query_cost(self):
+        small_names, small_queries = self.list_as(self.small_owner)
+        large_names, large_queries = self.list_as(self.large_owner)
+        self.assertEqual(len(small_names), 3)
+        self.assertEqual(len(large_names), 2000)
+        self.assertTrue(all(name.startswith('كبير') for name in large_names))
+        self.assertEqual(small_queries, 1)
+        self.assertEqual(large_queries, 2)  # one query per page of 1000
+
+    def test_other_owners_properties_are_hidden(self):
+        self.client.force_authenticate(self.small_owner)
+        foreign = Property.objects.filter(owner=self.large_owner).first()
+        self.assertEqual(self.client.get(reverse('property-detail', args=[foreign.pk])).status_code, 404)
+        response = self.client.post(reverse('property-list'), {
+            'name': 'x', 'propert_type': 'shop', 'description': '-', 'address': '-', 'owner': self.large_owner.pk})
+        self.assertEqual(response.status_code, 400)
+
+    def test_anonymous_requests_are_rejected(self):
+        self.assertEqual(self.client.get(reverse('property-list')).status_code, 401)
+
+    def test_access_decisions_are_memoized(self):
+        access = AccessCache(self.small_owner)
+        pks = list(Property.objects.values_list('pk', flat=True)[:50])
+        with self.assertNumQueries(1):
+            visible = access.visible_ids(Property, pks)
+            access.visible_ids(Property, pks)
+            access.allows(Property(pk=pks[0]))
+        self.assertEqual(visible, set(Property.objects.filter(owner=self.small_owner).values_list('pk', flat=True)))
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class PropertyConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = CustomUser.objects.create_user(username='staff', password='x', is_staff=True)
+        cls.owner = CustomUser.objects.create_user(username='owner', password='x')
+        cls.prop = Property.objects.create(
+            name='برج', propert_type='office', description='-', address='-', owner=cls.owner)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.staff)
+
+    def test_unchanged_list_is_304_without_queries(self):
+        url = reverse('property-list')
+        first = self.client.get(url)
+        self.assertEqual(first['Cache-Control'], 'private, no-cache')
+        self.assertIn('Last-Modified', first)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+            cached = self.client.get(url)
+        self.assertEqual(cached.json(), first.json())
+        self.assertEqual(cached['ETag'], first['ETag'])
+
+    def test_saving_an_object_changes_list_and_detail_etags(self):
+        list_etag = self.client.get(reverse('property-list'))['ETag']
+        detail_url = reverse('property-detail', args=[self.prop.pk])
+        detail_etag = self.client.get(detail_url)['ETag']
+        self.prop.name = 'برج جديد'
+        self.prop.save()
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'برج جديد')
+        self.assertNotEqual(self.client.get(reverse('property-list'))['ETag'], list_etag)
+
+    def test_etags_are_per_audience(self):
+        staff_etag = self.client.get(reverse('property-list'))['ETag']
+        self.client.force_authenticate(self.owner)
+        response = self.client.get(reverse('property-list'), HTTP_IF_NONE_MATCH=staff_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], staff_etag)
+
+
+class AvailabilityTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(username='owner', password='x')
+        other = CustomUser.objects.create_user(username='other', password='x')
+        tenant = Tenant.objects.create(name='مستأجر', phone='9', email='t@example.com', address='-')
+
+        def make(name, kind, owner, *leases):
+            prop = Property.objects.create(name=name, propert_type=kind, description='-', address='-', owner=owner)
+            for start, end, active in leases:
+                LeasContract.objects.create(
+                    tenant=tenant, property=prop, start_date=start, end_date=end,
+                    monthly_rent=Decimal('100.00'), is_active=active)
+            return prop
+
+        cls.leased = make('مؤجرة', 'apartment', cls.owner,
+                          (date(2025, 1, 1), date(2025, 6, 30), True), (date(2025, 7, 1), date(2025, 12, 31), True))
+        cls.gap = make('فجوة', 'apartment', cls.owner,
+                       (date(2025, 1, 1), date(2025, 3, 31), True), (date(2025, 5, 1), date(2025, 12, 31), True))
+        cls.ended = make('منتهية', 'apartment', cls.owner, (date(2025, 1, 1), date(2025, 12, 31), False))
+        cls.shop = make('محل', 'shop', cls.owner)
+        cls.foreign = make('أخرى', 'apartment', other)
+
+    def setUp(self):
+        self.client.force_authenticate(self.owner)
+
+    def test_vacant_properties_by_type_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('property-vacant'), {'start': '2025-04-01', 'end': '2025-04-30', 'type': 'apartment'})
+        names = {row['name'] for row in response.json()['results']}
+        self.assertEqual(names, {'فجوة', 'منتهية'})
+
+    def test_next_free_date_skips_back_to_back_leases(self):
+        def next_free(prop, day):
+            url = reverse('property-next-free', args=[prop.pk])
+            return self.client.get(url, {'from': day}).json()['next_free_date']
+
+        self.assertEqual(next_free(self.leased, '2025-02-01'), '2026-01-01')
+        self.assertEqual(next_free(self.gap, '2025-02-01'), '2025-04-01')
+        self.assertEqual(next_free(self.shop, '2025-02-01'), '2025-02-01')
+
+    def test_bulk_ranges(self):
+        response = self.client.post(reverse('property-vacancies'), {'ranges': [
+            {'start': '2025-04-01', 'end': '2025-04-30'},
+            {'start': '2026-01-01', 'end': '2026-01-31', 'type': 'apartment'},
+        ]}, format='json')
+        first, second = response.json()['results']
+        self.assertEqual(set(first['property_ids']), {self.gap.pk, self.ended.pk, self.shop.pk})
+        self.assertEqual(set(second['property_ids']), {self.leased.pk, self.gap.pk, self.ended.pk})
+        self.assertEqual(second['type'], 'apartment')
+
+    def test_rejects_reversed_range(self):
+        response = self.client.get(reverse('property-vacant'), {'start': '2025-05-01', 'end': '2025-04-01'})
+        self.assertEqual(response.status_code, 400)
+
+
+class GeoTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = CustomUser.objects.create_user(username='owner', password='x')
+        self.client.force_authenticate(CustomUser.objects.create_user(username='staff', password='x', is_staff=True))
+
+    def add(self, name, address, kind='apartment', **coordinates):
+        return Property.objects.create(
+            name=name, propert_type=kind, description='-', address=address, owner=self.owner, **coordinates)
+
+    def test_addresses_are_geocoded_offline(self):
+        district = self.add('أ', 'مسقط، الخوير، شارع 18')
+        city = self.add('ب', 'Muscat')
+        manual = self.add('ج', 'مسقط', latitude=23.0, longitude=58.0)
+        unknown = self.add('د', 'عنوان غير معروف')
+        self.assertEqual((district.latitude, district.longitude), (23.5893, 58.43))
+        self.assertEqual((city.latitude, city.longitude), (23.588, 58.3829))
+        self.assertEqual(manual.geohash, geo.encode(23.0, 58.0))
+        self.assertEqual((unknown.latitude, unknown.geohash), (None, ''))
+
+        response = self.client.patch(
+            reverse('property-detail', args=[district.pk]), {'address': 'صلالة، الحافة'}, format='json')
+        self.assertEqual((response.json()['latitude'], response.json()['longitude']), (17.008, 54.108))
+
+    def test_geohash_matches_reference_values(self):
+        self.assertEqual(geo.encode(57.64911, 10.40744, 11), 'u4pruydqqvj')
+        self.assertEqual(geo.encode(-25.38262, -49.26561, 8), '6gkzwgjz')
+
+    def test_radius_box_and_nearest_match_a_full_scan(self):
+        rng = random.Random(3)
+        for i in range(150):
+            self.add(f'عقار {i}', '-', latitude=rng.uniform(23.3, 23.9), longitude=rng.uniform(58.0, 58.7))
+        points = {prop.pk: (prop.latitude, prop.longitude) for prop in Property.objects.all()}
+
+        def distance(pk):
+            return geo.haversine_km(23.6, 58.4, *points[pk])
+
+        near = geo.within_radius(Property.objects.all(), 23.6, 58.4, 12)
+        self.assertEqual([prop.pk for prop in near], sorted((pk for pk in points if distance(pk) <= 12), key=distance))
+        box = geo.within_box(Property.objects.all(), 23.5, 58.2, 23.7, 58.5).values_list('pk', flat=True)
+        self.assertCountEqual(box, [pk for pk, (lat, lon) in points.items() if 23.5 <= lat <= 23.7 and 58.2 <= lon <= 58.5])
+        nearest = geo.nearest(Property.objects.all(), 23.6, 58.4, 7)
+        self.assertEqual([prop.pk for prop in nearest], sorted(points, key=distance)[:7])
+
+    def test_endpoints_combine_type_and_vacancy_filters(self):
+        shop = self.add('محل', 'مسقط، روي', kind='shop')
+        leased = self.add('مؤجر', 'مسقط، روي')
+        free = self.add('شاغر', 'مسقط، القرم')
+        self.add('بعيد', 'صلالة')
+        tenant = Tenant.objects.create(name='سالم', phone='1', email='s@example.com', address='-')
+        LeasContract.objects.create(
+            tenant=tenant, property=leased, start_date=date(2025, 1, 1), end_date=date(2025, 12, 31),
+            monthly_rent=Decimal('500.00'))
+        point = {'lat': 23.6, 'lon': 58.5, 'start': '2025-03-01', 'end': '2025-03-31'}
+
+        rows = self.client.get(reverse('property-near'), {**point, 'radius_km': 20}).json()['results']
+        self.assertEqual([row['id'] for row in rows], [free.pk, shop.pk])
+        self.assertLess(rows[0]['distance_km'], rows[1]['distance_km'])
+        rows = self.client.get(reverse('property-nearest'), {**point, 'k': 1, 'type': 'apartment'}).json()['results']
+        self.assertEqual([row['id'] for row in rows], [free.pk])
+        box = {'south': 23.5, 'west': 58.3, 'north': 23.7, 'east': 58.6}
+        rows = self.client.get(reverse('property-within'), box).json()['results']
+        self.assertCountEqual([row['id'] for row in rows], [shop.pk, leased.pk, free.pk])
+        response = self.client.get(reverse('property-within'), {**box, 'north': 23.0})
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_created_properties_are_located_by_command(self):
+        Property.objects.bulk_create(
+            Property(name=f'عقار {i}', propert_type='shop', description='-', address='نزوى', owner=self.owner)
+            for i in range(3))
+        out = StringIO()
+        call_command('geocode_properties', stdout=out)
+        self.assertIn('Located 3', out.getvalue())
+        self.assertEqual(set(Property.objects.values_list('latitude', flat=True)), {22.9333})
\ No newline at end of file
@@ -1,7 +1,11 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import PropertyViewSet
+from .views import PropertyAsyncReadView, PropertyViewSet
 
 router = DefaultRouter()
 router.register(r'properties', PropertyViewSet)
 
-urlpattens = router.urls
\ No newline at end of file
+urlpatterns = router.urls + [
+    path('async/properties/', PropertyAsyncReadView.as_view(), name='property-async-list'),
+    path('async/properties/<int:pk>/', PropertyAsyncReadView.as_view(), name='property-async-detail'),
+]
\ No newline at end of file
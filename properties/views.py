@@ -1,8 +1,93 @@
 from django.shortcuts import render
+from django.utils import timezone
+from real_estate_management.async_views import AsyncReadView
+from real_estate_management.http_cache import ConditionalGetMixin
+from real_estate_management.lean import LeanListMixin
+from real_estate_management.permissions import OwnerScopedMixin
+from real_estate_management.streaming import StreamingListMixin
+from . import geo
+from .availability import next_free_date, vacant_between
 from .models import Property
-from .serialisers import PropertySerialiser
-from rest_framework import viewsets
+from .serialisers import (
+    AvailabilityQuerySerializer, BoxQuerySerializer, NearestQuerySerializer, NearQuerySerializer, PropertySerialiser,
+    VacancyRangesSerializer,
+)
+from rest_framework import serializers, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
-class PropertyViewSet(viewsets.ModelViewSet):
+class PropertyViewSet(ConditionalGetMixin, OwnerScopedMixin, StreamingListMixin, LeanListMixin, viewsets.ModelViewSet):
+    queryset = Property.objects.all()
+    serializer_class = PropertySerialiser
+    stamp_name = 'property'
+
+    @action(detail=False)
+    def vacant(self, request):
+        """Properties (optionally of one ``type``) with no active lease between ``start`` and ``end``."""
+        params = AvailabilityQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+        queryset = vacant_between(self.get_queryset(), query['start'], query['end'], query.get('type'))
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    @action(detail=False, methods=['post'])
+    def vacancies(self, request):
+        """Vacant property ids for up to ``MAX_RANGES`` date ranges in one request."""
+        body = VacancyRangesSerializer(data=request.data)
+        body.is_valid(raise_exception=True)
+        visible = self.get_queryset()
+        results = []
+        for query in body.validated_data['ranges']:
+            vacant = vacant_between(visible, query['start'], query['end'], query.get('type'))
+            results.append({**AvailabilityQuerySerializer(query).data,
+                            'property_ids': list(vacant.order_by('pk').values_list('pk', flat=True))})
+        return Response({'results': results})
+
+    @action(detail=True, url_path='next-free')
+    def next_free(self, request, pk=None):
+        prop = self.get_object()
+        on_or_after = serializers.DateField().run_validation(request.query_params.get('from') or timezone.localdate())
+        return Response({'property': prop.pk, 'next_free_date': next_free_date(prop.pk, on_or_after)})
+
+
+    def spatial_params(self, serializer_class):
+        params = serializer_class(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+        queryset = self.get_queryset()
+        if 'start' in query:
+            queryset = vacant_between(queryset, query['start'], query['end'], query.get('type'))
+        elif 'type' in query:
+            queryset = queryset.filter(propert_type=query['type'])
+        return queryset, query
+
+    def with_distances(self, properties):
+        rows = self.get_serializer(properties, many=True).data
+        return [{**row, 'distance_km': round(prop.distance_km, 3)} for row, prop in zip(rows, properties)]
+
+    @action(detail=False)
+    def near(self, request):
+        """Properties within ``radius_km`` of ``lat``/``lon``, nearest first."""
+        queryset, query = self.spatial_params(NearQuerySerializer)
+        found = list(geo.within_radius(queryset, query['lat'], query['lon'], query['radius_km'])[:query['limit']])
+        return Response({'results': self.with_distances(found)})
+
+    @action(detail=False)
+    def nearest(self, request):
+        """The ``k`` properties nearest to ``lat``/``lon``."""
+        queryset, query = self.spatial_params(NearestQuerySerializer)
+        return Response({'results': self.with_distances(geo.nearest(queryset, query['lat'], query['lon'], query['k']))})
+
+    @action(detail=False)
+    def within(self, request):
+        """Properties inside the ``south``/``west``/``north``/``east`` box, paginated like the list."""
+        queryset, query = self.spatial_params(BoxQuerySerializer)
+        page = self.paginate_queryset(
+            geo.within_box(queryset, query['south'], query['west'], query['north'], query['east']))
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+
+class PropertyAsyncReadView(AsyncReadView):
     queryset = Property.objects.all()
     serializer_class = PropertySerialiser
\ No newline at end of file
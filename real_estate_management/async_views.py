@@ -0,0 +1,80 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+
+
+def render(data, status=200):
+    return JsonResponse(data, status=status, encoder=JSONEncoder, json_dumps_params={'ensure_ascii': False})
+
+
+class AsyncReadView(View):
+    """Read-only list/detail endpoint served with the async ORM.
+
+    Output matches the serializer used by the sync viewset. Lists are paged
+    newest-first with a ``?before=<id>`` keyset cursor; ``?stream=1``
+    returns NDJSON like the sync viewsets. Requests authenticate with the
+    same JWT or session credentials and see the same owner-scoped rows.
+    """
+
+    http_method_names = ['get', 'head', 'options']
+    queryset = None
+    serializer_class = None
+    page_size = 100
+    max_page_size = 1000
+    stream_chunk_size = 2000
+
+    async def get(self, request, pk=None):
+        try:
+            user = await self.authenticate(request)
+        except AuthenticationFailed as exc:
+            return render({'detail': str(exc.detail)}, status=401)
+        if not user.is_authenticated:
+            return render({'detail': "Authentication credentials were not provided."}, status=401)
+        queryset = self.queryset.visible_to(user)
+        if pk is not None:
+            return await self.retrieve(queryset, pk)
+        return await self.list(request, queryset)
+
+    async def authenticate(self, request):
+        # Token users are built from claims alone, so this never blocks on the database.
+        result = JWTStatelessUserAuthentication().authenticate(request)
+        if result is not None:
+            return result[0]
+        return await request.auser()
+
+    async def retrieve(self, queryset, pk):
+        try:
+            obj = await queryset.aget(pk=pk)
+        except ObjectDoesNotExist:
+            return render({'detail': "Not found."}, status=404)
+        return render(self.serializer_class().to_representation(obj))
+
+    async def list(self, request, queryset):
+        try:
+            size = min(max(int(request.GET.get('page_size', self.page_size)), 1), self.max_page_size)
+            before = int(request.GET['before']) if 'before' in request.GET else None
+        except ValueError:
+            return render({'detail': "page_size and before must be integers."}, status=400)
+        queryset = queryset.order_by('-pk')
+        if before is not None:
+            queryset = queryset.filter(pk__lt=before)
+        if request.GET.get('stream') == '1':
+            return StreamingHttpResponse(self.stream_rows(queryset), content_type='application/x-ndjson')
+        serializer = self.serializer_class()
+        rows = [serializer.to_representation(obj) async for obj in queryset[:size + 1]]
+        next_url = None
+        if len(rows) > size:
+            rows = rows[:size]
+            params = request.GET.copy()
+            params['before'] = rows[-1]['id']
+            next_url = request.build_absolute_uri(f'{request.path}?{params.urlencode()}')
+        return render({'next': next_url, 'results': rows})
+
+    async def stream_rows(self, queryset):
+        serializer = self.serializer_class()
+        encoder = JSONEncoder(ensure_ascii=False)
+        async for obj in queryset.aiterator(chunk_size=self.stream_chunk_size):
+            yield encoder.encode(serializer.to_representation(obj)) + '\n'
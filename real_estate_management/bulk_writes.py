@@ -0,0 +1,203 @@
+"""``/bulk/`` create, update and delete actions for model viewsets.
+
+A batch is validated item by item through ``BulkListSerializer``. Invalid
+items are reported and skipped. The valid ones are written with
+``bulk_create``/``bulk_update`` in one transaction. Related objects are fetched
+once per field for the whole batch, and the objects being updated or deleted
+with one scoped ``in_bulk``.
+"""
+import time
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from monitoring import metrics
+from .signals import bulk_saved
+
+DEFAULT_MAX_ITEMS = 500
+
+
+class Prefetched:
+    """Stands in for a related field's queryset, answering ``get(pk=…)`` from one ``in_bulk``."""
+
+    def __init__(self, model, objects):
+        self.model = model
+        self.objects = objects
+
+    def get(self, pk):
+        try:
+            return self.objects[int(pk)]
+        except KeyError:
+            raise ObjectDoesNotExist from None
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """Validate every item, collecting per-item errors instead of rejecting the whole list.
+
+    ``instance`` may be a list aligned with the data (``None`` for items whose
+    object was not found). Validated items are returned as ``{index: attrs}``.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            message = self.error_messages['not_a_list'].format(input_type=type(data).__name__)
+            raise ValidationError({'non_field_errors': [message]}, code='not_a_list')
+        if not data:
+            raise ValidationError({'non_field_errors': [self.error_messages['empty']]}, code='empty')
+        if self.max_length is not None and len(data) > self.max_length:
+            message = self.error_messages['max_length'].format(max_length=self.max_length)
+            raise ValidationError({'non_field_errors': [message]}, code='max_length')
+        self.item_errors = {}
+        valid = {}
+        for index, item in enumerate(data):
+            instance = self.instance[index] if self.instance is not None else None
+            if self.instance is not None and instance is None:
+                self.item_errors[index] = {'id': ["Not found."]}
+                continue
+            self.child.instance, self.child.initial_data = instance, item
+            try:
+                valid[index] = self.child.run_validation(item)
+            except ValidationError as exc:
+                self.item_errors[index] = exc.detail
+        self.child.instance = None
+        return valid
+
+    def validate(self, attrs):
+        return attrs
+
+
+class BulkWriteMixin:
+    """Adds ``POST``/``PATCH``/``DELETE`` on ``<collection>/bulk/``.
+
+    Viewsets can set ``bulk_serializer_class`` to relax per-item checks that
+    ``check_bulk_items`` performs for the whole batch instead.
+    """
+
+    bulk_serializer_class = None
+
+    def get_bulk_max_items(self):
+        return getattr(settings, 'BULK_WRITE_MAX_ITEMS', DEFAULT_MAX_ITEMS)
+
+    def get_bulk_serializer(self, items, instances=None):
+        serializer_class = self.bulk_serializer_class or self.get_serializer_class()
+        context = self.get_serializer_context()
+        child = serializer_class(context=context, partial=instances is not None)
+        self.prefetch_related_fields(child, items)
+        return BulkListSerializer(
+            child=child, instance=instances, data=items, partial=instances is not None, context=context,
+            max_length=self.get_bulk_max_items())
+
+    def prefetch_related_fields(self, child, items):
+        for name, field in child.fields.items():
+            if field.read_only or not isinstance(field, serializers.PrimaryKeyRelatedField):
+                continue
+            ids = {item.get(name) for item in items if isinstance(item, dict)}
+            queryset = field.get_queryset()
+            field.queryset = Prefetched(queryset.model, queryset.in_bulk(valid_ids(ids)))
+
+    def bulk_create_defaults(self):
+        """Attributes set on every object a bulk ``POST`` creates."""
+        return {}
+
+    def check_bulk_items(self, items):
+        """``{index: errors}`` for ``(index, attrs, instance)`` items that conflict as a batch."""
+        return {}
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        started = time.perf_counter()
+        items = request.data
+        if not isinstance(items, list) or not items or len(items) > self.get_bulk_max_items():
+            raise ValidationError({'non_field_errors': [
+                f"Expected a list of 1 to {self.get_bulk_max_items()} items."]})
+        if request.method == 'DELETE':
+            results = self.bulk_delete(items)
+        else:
+            results = self.bulk_save(items, update=request.method == 'PATCH')
+        elapsed = time.perf_counter() - started
+        operation = request.method.lower()
+        resource = self.basename
+        metrics.BULK_BATCH_SECONDS.observe(elapsed, (resource, operation))
+        for result in results:
+            metrics.BULK_ITEMS.inc((resource, operation, result['status']))
+        summary = {}
+        for result in results:
+            summary[result['status']] = summary.get(result['status'], 0) + 1
+        return Response({'summary': summary, 'elapsed_ms': round(elapsed * 1000, 1), 'results': results})
+
+    def bulk_save(self, items, update):
+        instances = None
+        if update:
+            ids = [coerce_id(item.get('id')) if isinstance(item, dict) else None for item in items]
+            found = self.get_queryset().in_bulk(valid_ids(ids))
+            instances = [found.get(pk) for pk in ids]
+        serializer = self.get_bulk_serializer(items, instances)
+        serializer.is_valid(raise_exception=False)
+        if serializer.errors and not isinstance(serializer.errors, list):
+            raise ValidationError(serializer.errors)
+        errors = dict(serializer.item_errors)
+        valid = serializer.validated_data
+        pending = [(index, attrs, instances[index] if update else None) for index, attrs in valid.items()]
+        errors.update(self.check_bulk_items(pending) if pending else {})
+        pending = [item for item in pending if item[0] not in errors]
+
+        model = self.get_queryset().model
+        defaults = {} if update else self.bulk_create_defaults()
+        written, fields = [], set()
+        for _, attrs, obj in pending:
+            if obj is None:
+                obj = model(**attrs, **defaults)
+            else:
+                for name, value in attrs.items():
+                    setattr(obj, name, value)
+                fields.update(attrs)
+            written.append(obj)
+        try:
+            with transaction.atomic():
+                if update:
+                    if fields:
+                        model.objects.bulk_update(written, fields=sorted(fields))
+                else:
+                    model.objects.bulk_create(written)
+                # Receivers keep derived data (audit, search, snapshots) in the same transaction.
+                if written:
+                    bulk_saved.send(sender=model, instances=written)
+        except IntegrityError as exc:
+            errors.update({index: {'non_field_errors': [str(exc)]} for index, _, _ in pending})
+            written = []
+
+        status = 'updated' if update else 'created'
+        ids = {index: obj.pk for (index, _, _), obj in zip(pending, written)}
+        return [
+            {'index': index, 'status': 'invalid', 'errors': errors[index]} if index in errors
+            else {'index': index, 'status': status, 'id': ids[index]}
+            for index in range(len(items))
+        ]
+
+    def bulk_delete(self, ids):
+        queryset = self.get_queryset()
+        found = queryset.in_bulk(valid_ids(ids))
+        if found:
+            with transaction.atomic():
+                queryset.filter(pk__in=list(found)).delete()
+        return [
+            {'index': index, 'status': 'deleted', 'id': found[coerce_id(pk)].pk} if coerce_id(pk) in found
+            else {'index': index, 'status': 'invalid', 'errors': {'id': ["Not found."]}}
+            for index, pk in enumerate(ids)
+        ]
+
+
+def coerce_id(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def valid_ids(values):
+    return {pk for pk in map(coerce_id, values) if pk is not None}
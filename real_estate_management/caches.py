@@ -0,0 +1,49 @@
+"""Build ``CACHES`` from the environment.
+
+The cache holds the HTTP version stamps and the report cache, which every
+process must see: a stamp moved by one worker has to invalidate the copies
+served by the others. The default is therefore a directory on disk, which
+needs no setup and is shared by every process on the host, not per-process
+memory.
+
+``CACHE_URL``
+    ``file:///path/to/dir`` (the default is ``.django_cache`` in the project
+    root), ``db://table`` (create the table with ``python manage.py
+    createcachetable``), ``redis://host:6379/0`` (needs ``redis``; use this or
+    memcached once several hosts serve the site), ``memcached://host:11211``
+    (needs ``pymemcache``; separate several servers with commas) or
+    ``locmem://``, which is only correct when a single process serves the site.
+``CACHE_KEY_PREFIX``
+    Prepended to every key, for several sites sharing one server.
+"""
+import os
+from urllib.parse import unquote, urlsplit
+
+
+def parse_url(value):
+    url = urlsplit(value)
+    if url.scheme == 'file':
+        return {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': unquote(url.path)}
+    if url.scheme == 'db':
+        return {'BACKEND': 'django.core.cache.backends.db.DatabaseCache', 'LOCATION': url.netloc or 'django_cache'}
+    if url.scheme in ('redis', 'rediss'):
+        return {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': value}
+    if url.scheme == 'memcached':
+        return {'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache', 'LOCATION': url.netloc.split(',')}
+    if url.scheme == 'locmem':
+        return {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': url.netloc}
+    raise ValueError(f"Unsupported cache URL scheme {url.scheme!r}")
+
+
+def cache_config(base_dir, env=None):
+    env = os.environ if env is None else env
+    if env.get('CACHE_URL'):
+        default = parse_url(env['CACHE_URL'])
+    else:
+        default = {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(base_dir / '.django_cache'),
+        }
+    if env.get('CACHE_KEY_PREFIX'):
+        default['KEY_PREFIX'] = env['CACHE_KEY_PREFIX']
+    return {'default': default}
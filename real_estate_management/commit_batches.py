@@ -0,0 +1,59 @@
+"""Collect work raised inside a transaction and flush it once from ``on_commit``.
+
+``batch_for`` hands out one batch per transaction on a connection (or per
+savepoint, with ``per_savepoint``) and registers its ``flush`` with
+``transaction.on_commit`` once, when the batch is created. Later callers get
+the same batch back after an O(1) check that the registration is still live.
+
+The check relies on how Django keeps ``connection.run_on_commit``: callbacks
+are only ever appended, a commit starts a new list, and a savepoint rollback
+drops the callbacks registered inside that savepoint, which all come after
+any callback that survives it. A live registration therefore still sits at
+the index it was appended at, and a dropped one does not.
+"""
+from weakref import WeakKeyDictionary
+
+from django.db import transaction
+
+
+class Registration:
+    def __init__(self, batch):
+        self.batch = batch
+        self.done = False
+        self.index = None
+
+    def __call__(self):
+        self.done = True
+        self.batch.flush()
+
+    def register(self, connection, robust):
+        transaction.on_commit(self, using=connection.alias, robust=robust)
+        self.index = len(connection.run_on_commit) - 1
+
+    def live(self, connection):
+        callbacks = connection.run_on_commit
+        # Entries are (savepoint ids, callback, robust); rollbacks rebuild the tuples but keep the callback.
+        return not self.done and self.index < len(callbacks) and callbacks[self.index][1] is self
+
+
+_registrations = WeakKeyDictionary()
+
+
+def batch_for(connection, factory, *, per_savepoint=False, robust=False):
+    """The batch built by ``factory`` for the open transaction on ``connection``.
+
+    With ``per_savepoint`` each savepoint gets its own batch, so rolling one
+    back discards exactly what was added inside it. Otherwise a batch that
+    outlives a rolled-back savepoint keeps what was added there.
+    """
+    key = (factory, tuple(connection.savepoint_ids) if per_savepoint else ())
+    registrations = _registrations.setdefault(connection, {})
+    registration = registrations.get(key)
+    if registration is not None and registration.live(connection):
+        return registration.batch
+    # Forget batches that have been flushed or dropped by a rollback.
+    for stale in [other for other, found in registrations.items() if not found.live(connection)]:
+        del registrations[stale]
+    registration = registrations[key] = Registration(factory())
+    registration.register(connection, robust)
+    return registration.batch
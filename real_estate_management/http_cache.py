@@ -0,0 +1,108 @@
+"""Version stamps, conditional GETs and a response cache for read-mostly viewsets.
+
+A stamp is the time a collection (``'property'``) or one of its objects
+(``'property:42'``) last changed. Signal receivers in each app call
+``touch``; views compare the stamps they depend on against the client's
+``If-None-Match`` / ``If-Modified-Since`` and answer ``304`` or a cached body
+without querying the tables or running the serializer.
+
+Stamps live in the default cache, which every process has to share (see
+``caches.py``); with a per-process cache one worker would keep answering
+``304`` after another had changed the rows.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+from users.scopes import SCOPE_ALL, scope_for
+
+
+def stamp_key(name):
+    return f'http:stamp:{name}'
+
+
+def touch(name, *pks):
+    """Mark collection ``name`` (and the given objects in it) as changed.
+
+    The stamps move again once the transaction commits, so a response rendered
+    from not-yet-committed rows in between is never cached under the final stamp.
+    """
+    keys = [stamp_key(key) for key in [name, *(f'{name}:{pk}' for pk in pks)]]
+
+    def write():
+        now = time.time()
+        cache.set_many(dict.fromkeys(keys, now), timeout=None)
+
+    write()
+    transaction.on_commit(write)
+
+
+def stamps(names):
+    """Current stamps for ``names``; unknown ones (evicted, never touched) start now."""
+    keys = {stamp_key(name): name for name in names}
+    found = cache.get_many(keys)
+    missing = {key: time.time() for key in keys if key not in found}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        found.update(missing)
+    return [found[key] for key in keys]
+
+
+class ConditionalGetMixin:
+    """Answer list and detail GETs from version stamps.
+
+    ``stamp_name`` is the collection this viewset serves and ``stamp_depends_on``
+    any other collections that change what a user may see (e.g. tenants are
+    visible to owners through leases).
+    """
+
+    stamp_name = None
+    stamp_depends_on = ()
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('stream') == '1':
+            return super().list(request, *args, **kwargs)
+        return self.conditional(request, [self.stamp_name, *self.stamp_depends_on], super().list, args, kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        names = [f'{self.stamp_name}:{pk}', *self.stamp_depends_on]
+        return self.conditional(request, names, super().retrieve, args, kwargs)
+
+    def conditional(self, request, names, render, args, kwargs):
+        versions = stamps(names)
+        etag = quote_etag(self.etag_for(request, names, versions))
+        last_modified = int(max(versions))
+        response = get_conditional_response(request._request, etag=etag, last_modified=last_modified)
+        if response is None:
+            key = f'http:response:{etag}'
+            data = cache.get(key)
+            if data is None:
+                response = render(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                cache.set(key, response.data, timeout=getattr(settings, 'HTTP_CACHE_TIMEOUT', 300))
+            else:
+                response = Response(data)
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        response['Cache-Control'] = 'private, no-cache'
+        patch_vary_headers(response, ('Authorization', 'Cookie', 'Accept'))
+        return response
+
+    def etag_for(self, request, names, versions):
+        # Staff all see the same rows, so they share one cached copy.
+        user = request.user
+        audience = SCOPE_ALL if scope_for(user) == SCOPE_ALL else f'user:{user.pk}'
+        parts = [
+            audience, request.path, '&'.join(sorted(request.GET.urlencode().split('&'))),
+            request.META.get('HTTP_ACCEPT', ''),
+            *(f'{name}={version!r}' for name, version in zip(names, versions)),
+        ]
+        return hashlib.sha1('|'.join(parts).encode()).hexdigest()
@@ -0,0 +1,95 @@
+"""Fast list rendering from ``.values()`` rows.
+
+``ModelSerializer`` builds a model instance per row and walks every field's
+``get_attribute``/``to_representation`` chain. For flat serializers the same
+output can be produced from the row dicts directly: fields whose
+representation of a database value is the value itself are copied, and only
+the rest (decimals, dates) go through their field's ``to_representation``.
+Serializers with nested, method or dotted-source fields are not compiled and
+keep the normal path.
+"""
+from functools import cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.response import Response
+
+# Fields whose representation of a non-null database value is that value.
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField, serializers.CharField, serializers.ChoiceField, serializers.IntegerField,
+)
+
+
+class LeanEncoder:
+    def __init__(self, columns, plan):
+        self.columns = columns
+        self.plan = plan
+
+    def encode(self, row):
+        out = {}
+        for key, column, convert in self.plan:
+            value = row[column]
+            out[key] = value if convert is None or value is None else convert(value)
+        return out
+
+    def encode_many(self, rows):
+        return [self.encode(row) for row in rows]
+
+
+def plan_field(model, field):
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        if field.pk_field is not None:
+            return None
+        return model._meta.get_field(field.source).attname, None
+    if isinstance(field, (serializers.BaseSerializer, serializers.RelatedField, serializers.ManyRelatedField,
+                          serializers.SerializerMethodField)):
+        return None
+    if field.source == '*' or '.' in field.source:
+        return None
+    try:
+        column = model._meta.get_field(field.source).attname
+    except FieldDoesNotExist:
+        return None
+    convert = None if isinstance(field, PASSTHROUGH_FIELDS) else field.to_representation
+    return column, convert
+
+
+@cache
+def encoder_for(serializer_class):
+    """A ``LeanEncoder`` equivalent to ``serializer_class``, or ``None`` if it cannot be compiled."""
+    serializer = serializer_class(context={})
+    model = serializer.Meta.model
+    plan = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        planned = plan_field(model, field)
+        if planned is None:
+            return None
+        plan.append((name, *planned))
+    return LeanEncoder(tuple(dict.fromkeys(column for _, column, _ in plan)), tuple(plan))
+
+
+class LeanListMixin:
+    """Render list pages from ``.values()`` rows when the serializer allows it.
+
+    Output is identical to the serializer's; ``use_lean_list`` lets a viewset
+    opt out per request (e.g. when nested expansion is requested).
+    """
+
+    def use_lean_list(self):
+        return True
+
+    def list(self, request, *args, **kwargs):
+        encoder = encoder_for(self.get_serializer_class()) if self.use_lean_list() else None
+        if encoder is None:
+            return super().list(request, *args, **kwargs)
+        ordering = getattr(self.paginator, 'ordering', None) or ()
+        if isinstance(ordering, str):
+            ordering = (ordering,)
+        columns = dict.fromkeys([*encoder.columns, *(name.lstrip('-') for name in ordering)])
+        rows = self.filter_queryset(self.get_queryset()).values(*columns)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(encoder.encode_many(page))
+        return Response(encoder.encode_many(rows))
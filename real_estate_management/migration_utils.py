@@ -0,0 +1,14 @@
+"""Helpers shared by hand-written migrations.
+
+Migrations import these at load time, so changing what an existing helper
+does changes migrations that may already have been applied; add a new one
+instead.
+"""
+
+
+def run_for_vendor(statements):
+    """A ``RunPython`` function executing ``statements[vendor]`` for the connection's vendor, if any."""
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+    return run
@@ -0,0 +1,91 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, _reverse_ordering
+
+
+class IdCursorPagination(CursorPagination):
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    ordering = '-id'
+
+
+class KeysetCursorPagination(IdCursorPagination):
+    """Cursor pagination over a composite ordering such as ``('-start_date', '-id')``.
+
+    DRF's cursor only records the first ordering field and steps over ties
+    with an offset, which gives out at ``offset_cutoff`` rows. This cursor
+    records every ordering field and resumes with a keyset comparison, so
+    ties cost nothing. The last ordering field must be unique, which also
+    keeps the offset at zero.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            reverse, current_position = False, None
+        else:
+            reverse, current_position = self.cursor.reverse, self.cursor.position
+
+        ordering = _reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self.following(queryset.model, ordering, current_position))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following_position = len(results) > len(self.page)
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering) if has_following_position else None)
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.next_position = current_position is not None, current_position
+            self.has_previous, self.previous_position = has_following_position, following_position
+        else:
+            self.has_next, self.next_position = has_following_position, following_position
+            self.has_previous, self.previous_position = current_position is not None, current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def following(self, model, ordering, position):
+        """Rows after ``position`` in ``ordering``: ``a > x OR (a = x AND b > y) ...``."""
+        try:
+            values = json.loads(position)
+            if not isinstance(values, list) or len(values) != len(ordering):
+                raise ValueError(position)
+            values = [
+                model._meta.get_field(order.lstrip('-')).to_python(value) for order, value in zip(ordering, values)]
+        except (ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        condition, ties = Q(pk__in=[]), {}
+        for order, value in zip(ordering, values):
+            name = order.lstrip('-')
+            condition |= Q(**ties, **{f"{name}__{'lt' if order.startswith('-') else 'gt'}": value})
+            ties[name] = value
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        names = [order.lstrip('-') for order in ordering]
+        values = [instance[name] if isinstance(instance, dict) else getattr(instance, name) for name in names]
+        return json.dumps([str(value) for value in values], separators=(',', ':'))
+
+
+class StartDateCursorPagination(KeysetCursorPagination):
+    ordering = ('-start_date', '-id')
+
+
+class PropertyIdCursorPagination(IdCursorPagination):
+    ordering = '-property_id'
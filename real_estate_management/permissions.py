@@ -0,0 +1,75 @@
+from rest_framework import permissions
+
+from users.scopes import sees_everything
+
+
+class AccessCache:
+    """Per-request memo of which objects the user may act on.
+
+    Each ``(model, pk)`` decision costs at most one query per request, and a
+    batch of unseen objects is decided with a single ``pk IN (...)`` query.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self.decisions = {}
+
+    def remember(self, obj, allowed=True):
+        self.decisions[(obj._meta.label, obj.pk)] = allowed
+
+    def visible_ids(self, model, pks):
+        if sees_everything(self.user):
+            return set(pks)
+        label = model._meta.label
+        unknown = {pk for pk in pks if (label, pk) not in self.decisions}
+        if unknown:
+            visible = set(
+                model.objects.visible_to(self.user).filter(pk__in=unknown).values_list('pk', flat=True))
+            for pk in unknown:
+                self.decisions[(label, pk)] = pk in visible
+        return {pk for pk in pks if self.decisions[(label, pk)]}
+
+    def allows(self, obj):
+        return bool(self.visible_ids(type(obj), [obj.pk]))
+
+
+def access_for(request):
+    cache = getattr(request, '_owner_access', None)
+    if cache is None:
+        cache = request._owner_access = AccessCache(request.user)
+    return cache
+
+
+class IsOwnerOrStaff(permissions.IsAuthenticated):
+    def has_object_permission(self, request, view, obj):
+        return access_for(request).allows(obj)
+
+
+class OwnerScopedMixin:
+    """Limit a viewset to the objects the requesting user owns.
+
+    Scoping happens in the queryset (one filtered join), so objects fetched
+    through it are already authorized and are recorded as such.
+    """
+
+    permission_classes = [IsOwnerOrStaff]
+
+    def get_queryset(self):
+        return super().get_queryset().visible_to(self.request.user)
+
+    def check_object_permissions(self, request, obj):
+        access_for(request).remember(obj)
+        super().check_object_permissions(request, obj)
+
+
+def scope_related_field(fields, name, context, scope='visible_to'):
+    """Only accept related objects that the requesting user can see.
+
+    ``scope`` names the queryset method that decides, for relations that
+    accept more than the user can see.
+    """
+    request = context.get('request')
+    field = fields.get(name)
+    if request is None or field is None or field.read_only or sees_everything(request.user):
+        return
+    field.queryset = getattr(field.queryset, scope)(request.user)
@@ -0,0 +1,66 @@
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+# Set for the duration of a safe API request; reads outside such requests
+# (writes, admin, management commands) always go to the primary.
+replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_aliases():
+    return [alias for alias in settings.DATABASES if alias.startswith('replica')]
+
+
+class ReplicaRouter:
+    """Send reads made while serving safe API requests to a random replica."""
+
+    def db_for_read(self, model, **hints):
+        # A lagging replica would hand out stale cache stamps.
+        if not replica_reads.get() or model._meta.app_label == 'django_cache':
+            return None
+        replicas = replica_aliases()
+        return random.choice(replicas) if replicas else None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
+
+
+class ReplicaRoutingMiddleware:
+    """Enable replica reads for GET/HEAD/OPTIONS requests under ``REPLICA_READ_PREFIXES``."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefixes = tuple(getattr(settings, 'REPLICA_READ_PREFIXES', ('/api/',)))
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def use_replica(self, request):
+        return request.method in SAFE_METHODS and request.path.startswith(self.prefixes)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = replica_reads.set(self.use_replica(request))
+        try:
+            return self.get_response(request)
+        finally:
+            replica_reads.reset(token)
+
+    async def __acall__(self, request):
+        token = replica_reads.set(self.use_replica(request))
+        try:
+            return await self.get_response(request)
+        finally:
+            replica_reads.reset(token)
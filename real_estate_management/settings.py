@@ -10,8 +10,13 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
+from datetime import timedelta
 from pathlib import Path
 
+from real_estate_management.caches import cache_config
+from real_estate_management.database import database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -27,6 +32,14 @@ DEBUG = True
 
 ALLOWED_HOSTS = ['*']
 
+# Addresses allowed to scrape /metrics without logging in (comma separated in
+# METRICS_ALLOWED_IPS). Empty by default: behind a proxy on the same host every
+# request arrives from 127.0.0.1, so only staff sessions get in.
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.environ.get('METRICS_ALLOWED_IPS', '').split(',') if ip.strip()]
+
+# Identical SQL repeated this many times in one request is reported as a likely N+1.
+N_PLUS_ONE_THRESHOLD = 5
+
 AUTH_USER_MODEL = 'users.CustomUser'
 # Application definition
 
@@ -43,9 +56,19 @@ INSTALLED_APPS = [
     'properties',
     'contracts',
     'payments',
+    'search',
+    'analytics',
+    'bulk_io',
+    'monitoring',
+    'audit',
+    'jobs',
+    'attachments',
+    'snapshots',
 ]
 
 MIDDLEWARE = [
+    'monitoring.middleware.InstrumentationMiddleware',
+    'real_estate_management.routers.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -53,6 +76,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'audit.middleware.AuditContextMiddleware',
 ]
 
 ROOT_URLCONF = 'real_estate_management.urls'
@@ -79,12 +103,43 @@ WSGI_APPLICATION = 'real_estate_management.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
-}
+# Configured from DATABASE_URL and friends, see real_estate_management/database.py.
+DATABASES = database_config(BASE_DIR)
+
+DATABASE_ROUTERS = ['real_estate_management.routers.ReplicaRouter']
+
+# Shared by every process (HTTP version stamps, reports); configured from
+# CACHE_URL, see real_estate_management/caches.py.
+CACHES = cache_config(BASE_DIR)
+
+# Seconds a rendered property/tenant response stays in the cache; its key
+# already changes whenever the underlying rows do.
+HTTP_CACHE_TIMEOUT = 300
+
+# Place names and coordinates used to geocode property addresses offline.
+GAZETTEER_PATH = BASE_DIR / 'properties' / 'data' / 'gazetteer.csv'
+
+# Seconds after which a job still marked running is assumed lost and retried.
+JOBS_STALE_AFTER = 600
+
+# Attachment files (content-addressed blobs, thumbnails, uploads in progress).
+ATTACHMENTS_ROOT = BASE_DIR / 'media' / 'attachments'
+ATTACHMENTS_MAX_SIZE = 100 * 1024 * 1024
+# Seconds before an unfinished resumable upload is pruned.
+ATTACHMENTS_UPLOAD_TTL = 24 * 3600
+# Set to e.g. 'X-Accel-Redirect' to let the front-end server send attachment
+# files from ATTACHMENTS_SENDFILE_PREFIX + the path under ATTACHMENTS_ROOT.
+ATTACHMENTS_SENDFILE_HEADER = None
+ATTACHMENTS_SENDFILE_PREFIX = '/protected/attachments/'
+
+# Multipart files are always spooled to a temporary file, never kept in memory.
+FILE_UPLOAD_HANDLERS = ['django.core.files.uploadhandler.TemporaryFileUploadHandler']
+
+# Largest batch accepted by the /bulk/ endpoints.
+BULK_WRITE_MAX_ITEMS = 500
+
+# Safe requests under these paths may read from a replica.
+REPLICA_READ_PREFIXES = ('/api/',)
 
 
 # Password validation
@@ -130,6 +185,18 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.TokenAuthentication',
+        'rest_framework_simplejwt.authentication.JWTStatelessUserAuthentication',
+        'rest_framework.authentication.SessionAuthentication',
+    ),
+    'DEFAULT_PERMISSION_CLASSES': (
+        'real_estate_management.permissions.IsOwnerOrStaff',
     ),
+    'DEFAULT_PAGINATION_CLASS': 'real_estate_management.pagination.IdCursorPagination',
+    'PAGE_SIZE': 100,
+}
+
+SIMPLE_JWT = {
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=5),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
+    'TOKEN_OBTAIN_SERIALIZER': 'users.serializers.ClaimsTokenObtainPairSerializer',
 }
\ No newline at end of file
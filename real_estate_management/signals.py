@@ -0,0 +1,5 @@
+from django.dispatch import Signal
+
+# Sent after bulk_create/bulk_update writes, which bypass post_save.
+# Receivers get ``sender`` (the model) and ``instances`` (saved objects).
+bulk_saved = Signal()
@@ -0,0 +1,25 @@
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class StreamingListMixin:
+    """Serve ``?stream=1`` list requests as NDJSON without paginating."""
+
+    stream_chunk_size = 2000
+
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('stream') != '1':
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        if not queryset.ordered:
+            queryset = queryset.order_by('pk')
+        response = StreamingHttpResponse(
+            self.stream_rows(queryset), content_type='application/x-ndjson')
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def stream_rows(self, queryset):
+        serializer = self.get_serializer()
+        encoder = JSONEncoder(ensure_ascii=False)
+        for obj in queryset.iterator(chunk_size=self.stream_chunk_size):
+            yield encoder.encode(serializer.to_representation(obj)) + '\n'
@@ -0,0 +1,137 @@
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache, caches
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from contracts.serializers import ExpandedPropertySerialiser, LeasContractSerialiser
+from properties.models import Property
+from properties.serialisers import PropertySerialiser
+from tenants.models import Tenant
+from tenants.serialisers import TenantSerializer
+from users.models import CustomUser
+from .caches import cache_config
+from .database import database_config
+from .http_cache import stamp_key, stamps, touch
+from .lean import encoder_for
+from .routers import ReplicaRouter, ReplicaRoutingMiddleware
+
+
+class DatabaseConfigTests(SimpleTestCase):
+    def test_sqlite_default_is_tuned_for_concurrency(self):
+        config = database_config(Path('/srv/app'), env={})['default']
+        self.assertEqual(config['NAME'], Path('/srv/app/db.sqlite3'))
+        self.assertEqual(config['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertIn('PRAGMA journal_mode=WAL', config['OPTIONS']['init_command'])
+        self.assertIn('PRAGMA synchronous=NORMAL', config['OPTIONS']['init_command'])
+
+    def test_postgres_with_replicas_and_persistent_connections(self):
+        databases = database_config(Path('/srv/app'), env={
+            'DATABASE_URL': 'postgres://app:s%40cret@db:5433/estate',
+            'DATABASE_REPLICA_URLS': 'postgres://app@replica-a/estate, postgres://app@replica-b/estate',
+            'DATABASE_CONN_MAX_AGE': '300',
+        })
+        self.assertEqual(sorted(databases), ['default', 'replica1', 'replica2'])
+        default = databases['default']
+        self.assertEqual((default['NAME'], default['PASSWORD'], default['PORT']), ('estate', 's@cret', '5433'))
+        self.assertEqual(default['CONN_MAX_AGE'], 300)
+        self.assertEqual(databases['replica2']['HOST'], 'replica-b')
+        self.assertEqual(databases['replica1']['TEST'], {'MIRROR': 'default'})
+
+    def test_pool_disables_conn_max_age(self):
+        config = database_config(Path('.'), env={'DATABASE_URL': 'postgres://db/estate', 'DATABASE_POOL': '2:20'})
+        self.assertEqual(config['default']['OPTIONS']['pool'], {'min_size': 2, 'max_size': 20})
+        self.assertEqual(config['default']['CONN_MAX_AGE'], 0)
+
+
+class CacheConfigTests(SimpleTestCase):
+    def test_default_is_shared_between_processes(self):
+        config = cache_config(Path('/srv/app'), env={})['default']
+        self.assertEqual(config, {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': '/srv/app/.django_cache'})
+        database = cache_config(Path('/srv/app'), env={'CACHE_URL': 'db://stamps'})['default']
+        self.assertEqual(database['LOCATION'], 'stamps')
+
+    def test_urls(self):
+        redis = cache_config(Path('.'), env={'CACHE_URL': 'redis://cache:6379/1', 'CACHE_KEY_PREFIX': 'estate'})['default']
+        self.assertEqual((redis['LOCATION'], redis['KEY_PREFIX']), ('redis://cache:6379/1', 'estate'))
+        memcached = cache_config(Path('.'), env={'CACHE_URL': 'memcached://a:11211,b:11211'})['default']
+        self.assertEqual(memcached['LOCATION'], ['a:11211', 'b:11211'])
+        with self.assertRaises(ValueError):
+            cache_config(Path('.'), env={'CACHE_URL': 'ftp://cache'})
+
+
+class SharedStampTests(TestCase):
+    def test_other_processes_see_moved_stamps(self):
+        # A second backend instance stands in for another worker process.
+        other = caches.create_connection('default')
+        with self.captureOnCommitCallbacks(execute=True):
+            touch('property', 1)
+        seen = [other.get(stamp_key(name)) for name in ['property', 'property:1']]
+        self.assertEqual(seen, stamps(['property', 'property:1']))
+
+
+@mock.patch('real_estate_management.routers.replica_aliases', return_value=['replica1'])
+class ReplicaRouterTests(SimpleTestCase):
+    def route(self, method, path):
+        seen = []
+        middleware = ReplicaRoutingMiddleware(
+            lambda request: seen.append(ReplicaRouter().db_for_read(Property)) or HttpResponse())
+        middleware(RequestFactory().generic(method, path))
+        return seen[0]
+
+    def test_safe_api_requests_read_from_replica(self, _):
+        self.assertEqual(self.route('GET', '/api/properties/'), 'replica1')
+
+    def test_writes_admin_and_background_reads_use_primary(self, _):
+        self.assertIsNone(self.route('POST', '/api/properties/'))
+        self.assertIsNone(self.route('GET', '/admin/'))
+        self.assertIsNone(ReplicaRouter().db_for_read(Property))
+        self.assertEqual(ReplicaRouter().db_for_write(Property), 'default')
+
+
+class LeanEncoderParityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUser.objects.create_user(username='owner', password='x')
+        tenant = Tenant.objects.create(name='سالم "الحارثي"', phone='9', email='s@example.com', address='مسقط\nالخوير')
+        for i, rent in enumerate([Decimal('1500'), Decimal('1234.5'), Decimal('0.01')]):
+            prop = Property.objects.create(
+                name=f'عقار {i}', propert_type='shop', description='', address='-', owner=cls.owner)
+            LeasContract.objects.create(
+                tenant=tenant, property=prop, start_date=date(2024, 2, 29), end_date=date(2025, 2, 28),
+                monthly_rent=rent, is_active=bool(i % 2))
+
+    def test_encoders_render_byte_identical_output(self):
+        renderer = JSONRenderer()
+        for serializer_class in (PropertySerialiser, TenantSerializer, LeasContractSerialiser):
+            model = serializer_class.Meta.model
+            encoder = encoder_for(serializer_class)
+            queryset = model.objects.order_by('pk')
+            self.assertEqual(
+                renderer.render(encoder.encode_many(queryset.values(*encoder.columns))),
+                renderer.render(serializer_class(queryset, many=True).data))
+
+    def test_nested_serializers_are_not_compiled(self):
+        self.assertIsNone(encoder_for(ExpandedPropertySerialiser))
+
+
+class LeanListEndpointTests(APITestCase):
+    def test_list_pages_match_the_serializer(self):
+        cache.clear()
+        staff = CustomUser.objects.create_user(username='staff', password='x', is_staff=True)
+        Property.objects.bulk_create(
+            Property(name=f'عقار {i}', propert_type='office', description='-', address='-', owner=staff)
+            for i in range(5))
+        self.client.force_authenticate(staff)
+        response = self.client.get(reverse('property-list'), {'page_size': 2})
+        expected = PropertySerialiser(Property.objects.order_by('-id')[:2], many=True).data
+        self.assertEqual(response.json()['results'], [dict(row) for row in expected])
+        self.assertIsNotNone(response.json()['next'])
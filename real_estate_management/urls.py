@@ -17,8 +17,22 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from monitoring.views import metrics_view
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('api/', include('properties.urls')),
+    path('api/', include('tenants.urls')),
+    path('api/', include('contracts.urls')),
+    path('api/', include('payments.urls')),
+    path('api/', include('search.urls')),
+    path('api/', include('analytics.urls')),
+    path('api/', include('bulk_io.urls')),
+    path('api/', include('audit.urls')),
+    path('api/', include('jobs.urls')),
+    path('api/', include('attachments.urls')),
+    path('api/', include('snapshots.urls')),
+    path('api/users/', include('users.urls')),
 ]
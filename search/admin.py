@@ -0,0 +1,19 @@
+from .backends import get_backend
+
+
+class IndexedSearchAdminMixin:
+    """Answer the changelist search box from the full-text index.
+
+    ``search_fields`` must still be set for Django to render the search box.
+    Only the best ``search_limit`` matches are listed, which keeps the
+    ``pk IN (...)`` filter within the database's parameter limit.
+    """
+
+    search_kind = None
+    search_limit = 5000
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        ids = get_backend().object_ids(search_term, self.search_kind, limit=self.search_limit)
+        return queryset.filter(pk__in=ids), False
\ No newline at end of file
@@ -0,0 +1,142 @@
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+from users.scopes import sees_everything
+from .indexing import INDEXED
+from .models import SearchDocument
+from .normalization import tokenize
+
+
+class SearchHit:
+    __slots__ = ('kind', 'object_id', 'title', 'rank')
+
+    def __init__(self, kind, object_id, title, rank):
+        self.kind = kind
+        self.object_id = object_id
+        self.title = title
+        self.rank = rank
+
+
+class BaseSearchBackend:
+    """Ranked lookups against the ``SearchDocument`` table.
+
+    Subclasses implement ``ranked_rows`` and return ``(kind, object_id,
+    title, rank)`` tuples, best match first. ``scopes`` is ``None`` or maps
+    each kind to a queryset of the objects that may be returned; it is part
+    of the query, so ``limit`` counts only visible hits.
+    """
+
+    def search(self, query, kinds=None, limit=20, user=None):
+        """Hits for ``query``; with ``user``, only objects that user may see."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        scopes = None
+        if user is not None and not sees_everything(user):
+            scopes = {
+                kind: model.objects.visible_to(user)
+                for kind, (model, _, _) in INDEXED.items() if not kinds or kind in kinds
+            }
+        return [SearchHit(*row) for row in self.ranked_rows(terms, kinds, limit, scopes)]
+
+    def object_ids(self, query, kind, limit=None):
+        return [hit.object_id for hit in self.search(query, kinds=[kind], limit=limit)]
+
+    def ranked_rows(self, terms, kinds, limit, scopes=None):
+        raise NotImplementedError
+
+
+def kinds_clause(kinds, column='d.kind'):
+    if not kinds:
+        return '', []
+    return f" AND {column} IN ({', '.join(['%s'] * len(kinds))})", list(kinds)
+
+
+def scope_clause(scopes, kind_column='d.kind', id_column='d.object_id'):
+    if scopes is None:
+        return '', []
+    parts, params = [], []
+    for kind, queryset in scopes.items():
+        sql, subquery_params = queryset.order_by().values('pk').query.sql_with_params()
+        parts.append(f'({kind_column} = %s AND {id_column} IN ({sql}))')
+        params += [kind, *subquery_params]
+    return f" AND ({' OR '.join(parts) or '1 = 0'})", params
+
+
+def limit_clause(limit):
+    return ('', []) if limit is None else (' LIMIT %s', [limit])
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    # Title matches count ten times as much as body matches.
+    sql = (
+        "SELECT d.kind, d.object_id, d.title, bm25(search_searchdocument_fts, 10.0, 1.0) AS rank"
+        " FROM search_searchdocument_fts JOIN search_searchdocument d ON d.id = search_searchdocument_fts.rowid"
+        " WHERE search_searchdocument_fts MATCH %s{kinds}{scopes} ORDER BY rank{limit}"
+    )
+
+    def ranked_rows(self, terms, kinds, limit, scopes=None):
+        match = ' '.join(f'"{term}"*' for term in terms)
+        kinds_sql, kinds_params = kinds_clause(kinds)
+        scopes_sql, scopes_params = scope_clause(scopes)
+        limit_sql, limit_params = limit_clause(limit)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                self.sql.format(kinds=kinds_sql, scopes=scopes_sql, limit=limit_sql),
+                [match, *kinds_params, *scopes_params, *limit_params])
+            return [(kind, object_id, title, -rank) for kind, object_id, title, rank in cursor.fetchall()]
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    vector = "(setweight(to_tsvector('simple', d.title_text), 'A') || to_tsvector('simple', d.body_text))"
+    sql = (
+        "SELECT d.kind, d.object_id, d.title, ts_rank({vector}, q) AS rank"
+        " FROM search_searchdocument d, to_tsquery('simple', %s) q"
+        " WHERE {vector} @@ q{kinds}{scopes} ORDER BY rank DESC{limit}"
+    )
+
+    def ranked_rows(self, terms, kinds, limit, scopes=None):
+        query = ' & '.join(f"{term}:*" for term in terms)
+        kinds_sql, kinds_params = kinds_clause(kinds)
+        scopes_sql, scopes_params = scope_clause(scopes)
+        limit_sql, limit_params = limit_clause(limit)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                self.sql.format(vector=self.vector, kinds=kinds_sql, scopes=scopes_sql, limit=limit_sql),
+                [query, *kinds_params, *scopes_params, *limit_params])
+            return cursor.fetchall()
+
+
+class ContainsSearchBackend(BaseSearchBackend):
+    """Unindexed fallback for databases without a full-text engine."""
+
+    def ranked_rows(self, terms, kinds, limit, scopes=None):
+        queryset = SearchDocument.objects.all()
+        for term in terms:
+            queryset = queryset.filter(Q(title_text__contains=term) | Q(body_text__contains=term))
+        if kinds:
+            queryset = queryset.filter(kind__in=kinds)
+        if scopes is not None:
+            visible = Q(pk__in=[])
+            for kind, scope in scopes.items():
+                visible |= Q(kind=kind, object_id__in=scope.order_by().values('pk'))
+            queryset = queryset.filter(visible)
+        rows = queryset.values_list('kind', 'object_id', 'title')
+        if limit is not None:
+            rows = rows[:limit]
+        return [(*row, 1.0) for row in rows]
+
+
+VENDOR_BACKENDS = {
+    'sqlite': SQLiteFTSBackend,
+    'postgresql': PostgresSearchBackend,
+}
+
+
+def get_backend():
+    path = getattr(settings, 'SEARCH_BACKEND', None)
+    if path:
+        return import_string(path)()
+    return VENDOR_BACKENDS.get(connection.vendor, ContainsSearchBackend)()
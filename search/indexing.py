@@ -0,0 +1,83 @@
+from django.db import transaction
+
+from contracts.models import LeasContract
+from properties.models import Property
+from tenants.models import Tenant
+from .models import SearchDocument
+from .normalization import normalize
+
+
+def property_document(obj):
+    return obj.name, obj.name, obj.address
+
+
+def tenant_document(obj):
+    return obj.name, obj.name, obj.email
+
+
+def contract_document(obj):
+    title = f"{obj.tenant.name} - {obj.property.name}"
+    return title, title, obj.property.address
+
+
+# kind -> (model, queryset used for bulk rebuilds, document builder)
+INDEXED = {
+    'property': (Property, Property.objects.all, property_document),
+    'tenant': (Tenant, Tenant.objects.all, tenant_document),
+    'contract': (LeasContract, LeasContract.objects.with_related, contract_document),
+}
+KIND_BY_MODEL = {model: kind for kind, (model, _, _) in INDEXED.items()}
+
+
+def build_document(kind, obj):
+    title, title_text, body_text = INDEXED[kind][2](obj)
+    return SearchDocument(
+        kind=kind, object_id=obj.pk, title=title[:255],
+        title_text=normalize(title_text), body_text=normalize(body_text))
+
+
+def index_instance(obj):
+    kind = KIND_BY_MODEL[type(obj)]
+    document = build_document(kind, obj)
+    SearchDocument.objects.update_or_create(
+        kind=kind, object_id=obj.pk,
+        defaults={'title': document.title, 'title_text': document.title_text, 'body_text': document.body_text})
+
+
+def remove_instance(obj):
+    SearchDocument.objects.filter(kind=KIND_BY_MODEL[type(obj)], object_id=obj.pk).delete()
+
+
+def upsert_documents(documents):
+    SearchDocument.objects.bulk_create(
+        documents, update_conflicts=True, unique_fields=['kind', 'object_id'],
+        update_fields=['title', 'title_text', 'body_text'])
+
+
+def index_instances(model, instances):
+    kind = KIND_BY_MODEL[model]
+    if model is LeasContract:
+        instances = LeasContract.objects.with_related().filter(pk__in=[obj.pk for obj in instances])
+    upsert_documents([build_document(kind, obj) for obj in instances])
+
+
+def reindex_contracts(queryset):
+    """Refresh contract documents after a tenant or property was renamed."""
+    upsert_documents([build_document('contract', obj) for obj in queryset.with_related()])
+
+
+def rebuild(batch_size=2000):
+    with transaction.atomic():
+        SearchDocument.objects.all().delete()
+        total = 0
+        for kind, (_, queryset, _) in INDEXED.items():
+            batch = []
+            for obj in queryset().iterator(chunk_size=batch_size):
+                batch.append(build_document(kind, obj))
+                if len(batch) >= batch_size:
+                    SearchDocument.objects.bulk_create(batch)
+                    total += len(batch)
+                    batch = []
+            SearchDocument.objects.bulk_create(batch)
+            total += len(batch)
+        return total
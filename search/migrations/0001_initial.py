@@ -0,0 +1,30 @@
+# Generated by Django 5.1.4 on 2026-10-18 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('property', 'عقار'), ('tenant', 'مستأجر'), ('contract', 'عقد إيجار')], max_length=10, verbose_name='النوع')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='المعرف')),
+                ('title', models.CharField(max_length=255, verbose_name='العنوان')),
+                ('title_text', models.TextField(verbose_name='نص العنوان')),
+                ('body_text', models.TextField(verbose_name='نص المحتوى')),
+            ],
+            options={
+                'verbose_name': 'مستند بحث',
+                'verbose_name_plural': 'مستندات البحث',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_document')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+from real_estate_management.migration_utils import run_for_vendor
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE search_searchdocument_fts USING fts5("
+    " title_text, body_text, content='search_searchdocument', content_rowid='id',"
+    " tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER search_document_fts_insert AFTER INSERT ON search_searchdocument BEGIN"
+    " INSERT INTO search_searchdocument_fts(rowid, title_text, body_text)"
+    " VALUES (new.id, new.title_text, new.body_text); END",
+    "CREATE TRIGGER search_document_fts_delete AFTER DELETE ON search_searchdocument BEGIN"
+    " INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, title_text, body_text)"
+    " VALUES ('delete', old.id, old.title_text, old.body_text); END",
+    "CREATE TRIGGER search_document_fts_update AFTER UPDATE ON search_searchdocument BEGIN"
+    " INSERT INTO search_searchdocument_fts(search_searchdocument_fts, rowid, title_text, body_text)"
+    " VALUES ('delete', old.id, old.title_text, old.body_text);"
+    " INSERT INTO search_searchdocument_fts(rowid, title_text, body_text)"
+    " VALUES (new.id, new.title_text, new.body_text); END",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS search_document_fts_update",
+    "DROP TRIGGER IF EXISTS search_document_fts_delete",
+    "DROP TRIGGER IF EXISTS search_document_fts_insert",
+    "DROP TABLE IF EXISTS search_searchdocument_fts",
+]
+POSTGRES_FORWARD = [
+    "CREATE INDEX search_document_tsv ON search_searchdocument USING gin ("
+    "(setweight(to_tsvector('simple', title_text), 'A') || to_tsvector('simple', body_text)))",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS search_document_tsv",
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_FORWARD, 'postgresql': POSTGRES_FORWARD}),
+            run_for_vendor({'sqlite': SQLITE_BACKWARD, 'postgresql': POSTGRES_BACKWARD}),
+        ),
+    ]
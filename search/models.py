@@ -0,0 +1,23 @@
+from django.db import models
+
+class SearchDocument(models.Model):
+  KIND_CHOICES = [
+    ('property', 'عقار'),
+    ('tenant', 'مستأجر'),
+    ('contract', 'عقد إيجار'),
+  ]
+  kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="النوع")
+  object_id = models.PositiveBigIntegerField(verbose_name="المعرف")
+  title = models.CharField(max_length=255, verbose_name="العنوان")
+  title_text = models.TextField(verbose_name="نص العنوان")
+  body_text = models.TextField(verbose_name="نص المحتوى")
+
+  def __str__(self):
+    return self.title
+
+  class Meta:
+    verbose_name = "مستند بحث"
+    verbose_name_plural = "مستندات البحث"
+    constraints = [
+      models.UniqueConstraint(fields=['kind', 'object_id'], name='unique_search_document'),
+    ]
\ No newline at end of file
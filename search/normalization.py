@@ -0,0 +1,24 @@
+import re
+import unicodedata
+
+# Harakat, tanween, shadda, sukun, superscript alef and Quranic marks.
+ARABIC_DIACRITICS = re.compile('[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed]')
+TATWEEL = '\u0640'
+FOLDS = str.maketrans({
+    'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا',
+    'ى': 'ي', 'ئ': 'ي', 'ؤ': 'و',
+    'ة': 'ه',
+    TATWEEL: None,
+})
+TOKEN = re.compile(r'\w+')
+
+
+def normalize(text):
+    """Fold Arabic orthographic variants and strip diacritics for indexing."""
+    text = unicodedata.normalize('NFKC', text or '')
+    text = ARABIC_DIACRITICS.sub('', text)
+    return text.translate(FOLDS).casefold()
+
+
+def tokenize(text):
+    return TOKEN.findall(normalize(text))
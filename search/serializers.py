@@ -0,0 +1,14 @@
+from rest_framework import serializers
+from .models import SearchDocument
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    kind = serializers.MultipleChoiceField(choices=SearchDocument.KIND_CHOICES, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+class SearchHitSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    id = serializers.IntegerField(source='object_id')
+    title = serializers.CharField()
+    rank = serializers.FloatField()
\ No newline at end of file
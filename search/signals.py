@@ -0,0 +1,33 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.signals import bulk_saved
+from tenants.models import Tenant
+from .indexing import index_instance, index_instances, reindex_contracts, remove_instance
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_save, sender=Tenant)
+@receiver(post_save, sender=LeasContract)
+def index_saved(sender, instance, created, **kwargs):
+    index_instance(instance)
+    if not created and sender in (Property, Tenant):
+        reindex_contracts(LeasContract.objects.filter(**{sender._meta.model_name: instance}))
+
+
+@receiver(post_delete, sender=Property)
+@receiver(post_delete, sender=Tenant)
+@receiver(post_delete, sender=LeasContract)
+def remove_deleted(sender, instance, **kwargs):
+    remove_instance(instance)
+
+
+@receiver(bulk_saved, sender=Property)
+@receiver(bulk_saved, sender=Tenant)
+@receiver(bulk_saved, sender=LeasContract)
+def index_bulk_saved(sender, instances, **kwargs):
+    index_instances(sender, instances)
+    if sender in (Property, Tenant):
+        reindex_contracts(LeasContract.objects.filter(**{f'{sender._meta.model_name}__in': instances}))
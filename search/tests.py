@@ -0,0 +1,104 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from properties.models import Property
+from tenants.models import Tenant
+from users.models import CustomUser
+from .indexing import rebuild
+from .models import SearchDocument
+from .normalization import normalize
+
+
+class NormalizationTests(TestCase):
+    def test_folds_arabic_variants(self):
+        self.assertEqual(normalize('أحمد'), normalize('احمد'))
+        self.assertEqual(normalize('إيمان'), normalize('ايمان'))
+        self.assertEqual(normalize('مستشفى'), normalize('مستشفي'))
+        self.assertEqual(normalize('مدرسة'), normalize('مدرسه'))
+
+    def test_strips_diacritics_and_tatweel(self):
+        self.assertEqual(normalize('مُحَمَّد'), 'محمد')
+        self.assertEqual(normalize('شـــقة'), 'شقه')
+
+    def test_casefolds_latin(self):
+        self.assertEqual(normalize('Ahmad@Example.COM'), 'ahmad@example.com')
+
+
+class SearchFixturesMixin:
+    def setUp(self):
+        owner = CustomUser.objects.create_user(username='owner', password='x')
+        self.tower = Property.objects.create(
+            name='برج الأمل', propert_type='office', description='-', address='طريق الملك فهد', owner=owner)
+        self.villa = Property.objects.create(
+            name='فيلا الياسمين', propert_type='apartment', description='-', address='حي الأمل', owner=owner)
+        self.tenant = Tenant.objects.create(
+            name='أحمد علي', phone='0500000000', email='ahmad@example.com', address='الرياض')
+        self.contract = LeasContract.objects.create(
+            tenant=self.tenant, property=self.tower, start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31), monthly_rent=Decimal('5000.00'))
+
+
+class SearchApiTests(SearchFixturesMixin, APITestCase):
+    url = reverse('search')
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(CustomUser.objects.create_user(username='staff', password='x', is_staff=True))
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [(hit['kind'], hit['id']) for hit in response.json()['results']]
+
+    def test_matches_across_kinds_with_folded_spelling(self):
+        hits = self.search(q='احمد')
+        self.assertIn(('tenant', self.tenant.pk), hits)
+        self.assertIn(('contract', self.contract.pk), hits)
+
+    def test_title_matches_rank_above_body_matches(self):
+        self.assertEqual(self.search(q='الامل', kind='property'), [
+            ('property', self.tower.pk), ('property', self.villa.pk)])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.tenant.name = 'خالد'
+        self.tenant.save()
+        self.assertEqual(self.search(q='احمد'), [])
+        self.assertIn(('contract', self.contract.pk), self.search(q='خالد'))
+        self.tower.delete()
+        self.assertEqual(self.search(q='برج'), [])
+
+    def test_rebuild_restores_index(self):
+        SearchDocument.objects.all().delete()
+        self.assertEqual(rebuild(), 4)
+        self.assertIn(('tenant', self.tenant.pk), self.search(q='ahmad'))
+
+    def test_owners_only_find_their_own_records(self):
+        stranger = CustomUser.objects.create_user(username='stranger', password='x')
+        self.client.force_authenticate(stranger)
+        self.assertEqual(self.search(q='احمد'), [])
+        self.client.force_authenticate(self.tower.owner)
+        self.assertIn(('tenant', self.tenant.pk), self.search(q='احمد'))
+
+    def test_limit_counts_only_visible_hits(self):
+        stranger = CustomUser.objects.create_user(username='stranger', password='x')
+        for _ in range(3):
+            Property.objects.create(name='برج', propert_type='office', description='-', address='-', owner=stranger)
+        self.client.force_authenticate(self.tower.owner)
+        for backend in ['search.backends.SQLiteFTSBackend', 'search.backends.ContainsSearchBackend']:
+            with self.settings(SEARCH_BACKEND=backend):
+                self.assertEqual(self.search(q='برج', limit=1), [('property', self.tower.pk)])
+
+    def test_query_is_required(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+
+
+class AdminSearchTests(SearchFixturesMixin, TestCase):
+    def test_changelist_search_uses_index(self):
+        self.client.force_login(CustomUser.objects.create_superuser(username='admin', password='x'))
+        response = self.client.get(reverse('admin:properties_property_changelist'), {'q': 'الامل'})
+        self.assertCountEqual(response.context['cl'].result_list, [self.tower, self.villa])
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import SearchView
+
+urlpatterns = [
+    path('search/', SearchView.as_view(), name='search'),
+]
\ No newline at end of file
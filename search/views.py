@@ -0,0 +1,17 @@
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from .backends import get_backend
+from .serializers import SearchHitSerializer, SearchQuerySerializer
+
+class SearchView(APIView):
+    def get(self, request):
+        params = SearchQuerySerializer(data={
+            'q': request.query_params.get('q', ''),
+            'kind': request.query_params.getlist('kind'),
+            'limit': request.query_params.get('limit', 20),
+        })
+        params.is_valid(raise_exception=True)
+        hits = get_backend().search(
+            params.validated_data['q'], kinds=params.validated_data.get('kind'),
+            limit=params.validated_data['limit'], user=request.user)
+        return Response({'results': SearchHitSerializer(hits, many=True).data})
\ No newline at end of file
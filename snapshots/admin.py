@@ -0,0 +1,14 @@
+from django.contrib import admin
+from .models import PropertySnapshot
+
+@admin.register(PropertySnapshot)
+class PropertySnapshotAdmin(admin.ModelAdmin):
+    list_display = ['name', 'propert_type', 'owner', 'tenant_name', 'monthly_rent', 'lease_end', 'refreshed_at']
+    list_filter = ['propert_type']
+    search_fields = ['name', 'tenant_name']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
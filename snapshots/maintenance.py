@@ -0,0 +1,152 @@
+"""Keep ``PropertySnapshot`` rows in step with properties, leases and tenants.
+
+Signal receivers ``mark`` what changed. Inside a transaction the marks are
+collected and the affected snapshots are recomputed once, from
+``transaction.on_commit``; outside one they are recomputed straight away.
+A rollback discards the marks with the rows they describe.
+
+Refreshing locks the property rows first, so when two writers race the
+refresh that runs last starts after both commits and sees both changes.
+"""
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.db import router, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.commit_batches import batch_for
+from .models import PropertySnapshot
+
+BATCH_SIZE = 500
+COMPARED_FIELDS = [
+    'owner_id', 'name', 'propert_type', 'address', 'contract_id', 'tenant_id', 'tenant_name', 'monthly_rent',
+    'lease_start', 'lease_end', 'valid_until',
+]
+
+
+def batches(ids, size=BATCH_SIZE):
+    ids = sorted(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+def compute(property_ids, today, lock=False):
+    """Fresh, unsaved snapshots of the given properties that still exist, keyed by property id."""
+    properties = Property.objects.filter(pk__in=property_ids).order_by('pk')
+    if lock:
+        properties = properties.select_for_update()
+    snapshots = {
+        pk: PropertySnapshot(property_id=pk, owner_id=owner_id, name=name, propert_type=kind, address=address)
+        for pk, owner_id, name, kind, address in properties.values_list(
+            'pk', 'owner_id', 'name', 'propert_type', 'address')
+    }
+    leases = LeasContract.objects.filter(property_id__in=list(snapshots), is_active=True, end_date__gte=today)
+    rows = leases.order_by('start_date', 'pk').values_list(
+        'pk', 'property_id', 'tenant_id', 'tenant__name', 'monthly_rent', 'start_date', 'end_date')
+    for pk, property_id, tenant_id, tenant_name, rent, start, end in rows:
+        snapshot = snapshots[property_id]
+        if snapshot.valid_until is not None:
+            # Decided by an earlier lease: the current one, or the first one still to start.
+            continue
+        if start <= today:
+            snapshot.contract_id, snapshot.tenant_id, snapshot.tenant_name = pk, tenant_id, tenant_name
+            snapshot.monthly_rent, snapshot.lease_start, snapshot.lease_end = rent, start, end
+            snapshot.valid_until = end + timedelta(days=1)
+        else:
+            snapshot.valid_until = start
+    return snapshots
+
+
+def save(snapshots):
+    PropertySnapshot.objects.bulk_create(
+        snapshots, update_conflicts=True, unique_fields=['property'],
+        update_fields=[name.removesuffix('_id') for name in COMPARED_FIELDS] + ['refreshed_at'])
+
+
+def refresh(property_ids, today=None):
+    """Recompute the snapshots of ``property_ids``; rows of deleted properties are dropped."""
+    today = today or timezone.localdate()
+    total = 0
+    for ids in batches(set(property_ids)):
+        with transaction.atomic():
+            snapshots = compute(ids, today, lock=True)
+            save(snapshots.values())
+            PropertySnapshot.objects.filter(property_id__in=set(ids) - snapshots.keys()).delete()
+        total += len(snapshots)
+    return total
+
+
+def refresh_due(today=None):
+    """Refresh the snapshots whose lease has ended or started since they were computed."""
+    today = today or timezone.localdate()
+    return refresh(PropertySnapshot.objects.filter(valid_until__lte=today).values_list('property_id', flat=True), today)
+
+
+def rebuild(batch_size=BATCH_SIZE, today=None):
+    today = today or timezone.localdate()
+    total = 0
+    with transaction.atomic():
+        PropertySnapshot.objects.all().delete()
+        for ids in batches(Property.objects.values_list('pk', flat=True), batch_size):
+            snapshots = compute(ids, today)
+            PropertySnapshot.objects.bulk_create(snapshots.values())
+            total += len(snapshots)
+    return total
+
+
+def differences(stored, expected):
+    return [name for name in COMPARED_FIELDS if getattr(stored, name) != getattr(expected, name)]
+
+
+def check(batch_size=BATCH_SIZE, today=None, fix=False):
+    """Compare every snapshot with the source tables.
+
+    Returns the ids of properties whose snapshot is ``(missing, wrong)``; with
+    ``fix`` those snapshots are refreshed as well.
+    """
+    today = today or timezone.localdate()
+    missing, wrong = [], []
+    for ids in batches(Property.objects.values_list('pk', flat=True), batch_size):
+        expected = compute(ids, today)
+        stored = PropertySnapshot.objects.in_bulk(ids)
+        for pk, snapshot in expected.items():
+            if pk not in stored:
+                missing.append(pk)
+            elif differences(stored[pk], snapshot):
+                wrong.append(pk)
+    if fix:
+        refresh(missing + wrong, today)
+    return missing, wrong
+
+
+@dataclass
+class PendingRefresh:
+    property_ids: set = field(default_factory=set)
+    contract_ids: set = field(default_factory=set)
+    tenant_ids: set = field(default_factory=set)
+
+    def flush(self):
+        ids = set(self.property_ids)
+        if self.contract_ids or self.tenant_ids:
+            # Snapshots still showing a lease that moved, or a tenant that changed.
+            showing = Q(contract_id__in=self.contract_ids) | Q(tenant_id__in=self.tenant_ids)
+            ids.update(PropertySnapshot.objects.filter(showing).values_list('property_id', flat=True))
+        refresh(ids)
+
+
+def mark(properties=(), contracts=(), tenants=()):
+    connection = transaction.get_connection(router.db_for_write(PropertySnapshot))
+    if connection.in_atomic_block:
+        # One batch per transaction: one that outlives a rolled-back savepoint just refreshes a little more.
+        # Robust: a failed refresh must not fail a write that has already committed; check() finds the drift.
+        batch = batch_for(connection, PendingRefresh, robust=True)
+    else:
+        batch = PendingRefresh()
+    batch.property_ids.update(properties)
+    batch.contract_ids.update(contracts)
+    batch.tenant_ids.update(tenants)
+    if not connection.in_atomic_block:
+        batch.flush()
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from snapshots.maintenance import check
+
+
+class Command(BaseCommand):
+    help = "Compare property snapshots with the source tables and report (or fix) any that drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--fix', action='store_true', help="Refresh the snapshots found missing or wrong.")
+
+    def handle(self, *args, **options):
+        missing, wrong = check(batch_size=options['batch_size'], fix=options['fix'])
+        if not missing and not wrong:
+            self.stdout.write(self.style.SUCCESS("All snapshots match."))
+            return
+        summary = f"{len(missing)} missing and {len(wrong)} out-of-date snapshots"
+        if wrong:
+            summary += f" (properties {', '.join(map(str, wrong[:20]))}{', ...' if len(wrong) > 20 else ''})"
+        if options['fix']:
+            self.stdout.write(self.style.SUCCESS(f"Fixed {summary}."))
+        else:
+            raise CommandError(f"Found {summary}; run with --fix to repair them.")
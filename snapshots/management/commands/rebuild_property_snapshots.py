@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from contracts.scheduler import PeriodicJob
+from snapshots.maintenance import rebuild, refresh_due
+
+
+class Command(BaseCommand):
+    help = "Rebuild the property snapshot table from properties, leases and tenants."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--due', action='store_true',
+            help="Only refresh snapshots whose lease has started or ended since they were computed.")
+        parser.add_argument(
+            '--every', type=int, metavar='SECONDS',
+            help="With --due, keep running in the foreground and refresh on this interval instead of exiting.")
+
+    def handle(self, *args, **options):
+        if options['due'] and options['every']:
+            job = PeriodicJob(self.refresh_due, options['every'], name='refresh_property_snapshots')
+            job.start()
+            try:
+                job.join()
+            except KeyboardInterrupt:
+                job.stop()
+            return
+        if options['due']:
+            self.refresh_due()
+            return
+        total = rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Built {total} snapshots."))
+
+    def refresh_due(self):
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {refresh_due()} snapshots."))
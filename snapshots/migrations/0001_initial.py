@@ -0,0 +1,50 @@
+# Generated by Django 5.1.4 on 2026-10-18 18:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def build_existing(apps, schema_editor):
+    # Derived data only, so the current code builds it; rebuild_property_snapshots does the same later.
+    from snapshots.maintenance import rebuild
+
+    rebuild()
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contracts', '0006_rent_escalation'),
+        ('properties', '0004_coordinates'),
+        ('tenants', '0002_query_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertySnapshot',
+            fields=[
+                ('property', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='properties.property', verbose_name='العقار')),
+                ('name', models.CharField(max_length=100, verbose_name='اسم العقار')),
+                ('propert_type', models.CharField(choices=[('apartment', 'شقة'), ('office', 'مكتب'), ('shop', 'محل')], max_length=10, verbose_name='نوع العقار')),
+                ('address', models.TextField(verbose_name='العنوان')),
+                ('tenant_name', models.CharField(blank=True, default='', max_length=200, verbose_name='اسم المستأجر')),
+                ('monthly_rent', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='الإيجار الشهري')),
+                ('lease_start', models.DateField(blank=True, null=True, verbose_name='بداية العقد')),
+                ('lease_end', models.DateField(blank=True, null=True, verbose_name='نهاية العقد')),
+                ('valid_until', models.DateField(blank=True, null=True, verbose_name='صالح حتى')),
+                ('refreshed_at', models.DateTimeField(auto_now=True, verbose_name='آخر تحديث')),
+                ('contract', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='contracts.leascontract', verbose_name='العقد الحالي')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='المالك')),
+                ('tenant', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='tenants.tenant', verbose_name='المستأجر الحالي')),
+            ],
+            options={
+                'verbose_name': 'ملخص عقار',
+                'verbose_name_plural': 'ملخصات العقارات',
+                'indexes': [models.Index(fields=['owner', 'property'], name='snapshot_owner'), models.Index(fields=['owner', 'lease_end'], name='snapshot_owner_lease_end'), models.Index(fields=['valid_until'], name='snapshot_valid_until')],
+            },
+        ),
+        migrations.RunPython(build_existing, migrations.RunPython.noop),
+    ]
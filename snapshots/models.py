@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.db import models
+from contracts.models import LeasContract
+from properties.models import Property
+from tenants.models import Tenant
+from users.scopes import sees_everything
+
+class PropertySnapshotQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(owner_id=user.id)
+
+class PropertySnapshot(models.Model):
+  """A property with its current lease, tenant and rent, kept in step with the source tables.
+
+  ``valid_until`` is the first day the current lease may no longer be the
+  right one (the day after it ends, or the day the next one starts).
+  """
+  property = models.OneToOneField(Property, primary_key=True, on_delete=models.CASCADE, related_name='snapshot', verbose_name="العقار")
+  owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+', verbose_name="المالك")
+  name = models.CharField(max_length=100, verbose_name="اسم العقار")
+  propert_type = models.CharField(max_length=10, choices=Property.TYPE_CHOICES, verbose_name="نوع العقار")
+  address = models.TextField(verbose_name="العنوان")
+  contract = models.ForeignKey(LeasContract, null=True, blank=True, on_delete=models.SET_NULL, related_name='+', verbose_name="العقد الحالي")
+  tenant = models.ForeignKey(Tenant, null=True, blank=True, on_delete=models.SET_NULL, related_name='+', verbose_name="المستأجر الحالي")
+  tenant_name = models.CharField(max_length=200, blank=True, default='', verbose_name="اسم المستأجر")
+  monthly_rent = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, verbose_name="الإيجار الشهري")
+  lease_start = models.DateField(null=True, blank=True, verbose_name="بداية العقد")
+  lease_end = models.DateField(null=True, blank=True, verbose_name="نهاية العقد")
+  valid_until = models.DateField(null=True, blank=True, verbose_name="صالح حتى")
+  refreshed_at = models.DateTimeField(auto_now=True, verbose_name="آخر تحديث")
+
+  objects = PropertySnapshotQuerySet.as_manager()
+
+  def __str__(self):
+    return self.name
+
+  class Meta:
+    verbose_name = "ملخص عقار"
+    verbose_name_plural = "ملخصات العقارات"
+    indexes = [
+      models.Index(fields=['owner', 'property'], name='snapshot_owner'),
+      models.Index(fields=['owner', 'lease_end'], name='snapshot_owner_lease_end'),
+      models.Index(fields=['valid_until'], name='snapshot_valid_until'),
+    ]
@@ -0,0 +1,30 @@
+from django.utils import timezone
+from rest_framework import serializers
+from properties.models import Property
+from .models import PropertySnapshot
+
+
+class PropertySnapshotSerializer(serializers.ModelSerializer):
+    occupied = serializers.SerializerMethodField()
+    stale = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PropertySnapshot
+        fields = [
+            'property', 'owner', 'name', 'propert_type', 'address', 'occupied', 'contract', 'tenant', 'tenant_name',
+            'monthly_rent', 'lease_start', 'lease_end', 'refreshed_at', 'stale',
+        ]
+        read_only_fields = fields
+
+    def get_occupied(self, obj):
+        return obj.contract_id is not None
+
+    def get_stale(self, obj):
+        """Whether a lease has started or ended since the row was refreshed."""
+        return obj.valid_until is not None and obj.valid_until <= timezone.localdate()
+
+
+class SnapshotFilterSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(choices=Property.TYPE_CHOICES, required=False)
+    occupied = serializers.BooleanField(required=False, allow_null=True, default=None)
+    ends_before = serializers.DateField(required=False)
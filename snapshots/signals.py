@@ -0,0 +1,41 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.signals import bulk_saved
+from tenants.models import Tenant
+from .maintenance import mark
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+def property_changed(sender, instance, **kwargs):
+    mark(properties=[instance.pk])
+
+
+@receiver(post_save, sender=LeasContract)
+@receiver(post_delete, sender=LeasContract)
+def contract_changed(sender, instance, **kwargs):
+    mark(properties=[instance.property_id], contracts=[instance.pk])
+
+
+@receiver(post_save, sender=Tenant)
+def tenant_changed(sender, instance, **kwargs):
+    # A deleted tenant takes its leases with it, and those mark their properties.
+    mark(tenants=[instance.pk])
+
+
+@receiver(bulk_saved, sender=Property)
+def properties_bulk_saved(sender, instances, **kwargs):
+    mark(properties=[obj.pk for obj in instances])
+
+
+@receiver(bulk_saved, sender=LeasContract)
+def contracts_bulk_saved(sender, instances, **kwargs):
+    mark(properties=[obj.property_id for obj in instances], contracts=[obj.pk for obj in instances])
+
+
+@receiver(bulk_saved, sender=Tenant)
+def tenants_bulk_saved(sender, instances, **kwargs):
+    mark(tenants=[obj.pk for obj in instances])
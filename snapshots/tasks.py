@@ -0,0 +1,8 @@
+from jobs.registry import task
+from .maintenance import refresh_due
+
+
+@task('snapshots.refresh_due', max_attempts=1)
+def refresh_due_snapshots():
+    """Move snapshots on to the leases that started or ended since they were computed; run daily."""
+    return {'refreshed': refresh_due()}
@@ -0,0 +1,155 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.signals import bulk_saved
+from tenants.models import Tenant
+from users.models import CustomUser
+from . import maintenance
+from .maintenance import PendingRefresh, refresh_due
+from .models import PropertySnapshot
+
+
+class SnapshotFixturesMixin:
+    def setUp(self):
+        self.today = timezone.localdate()
+        self.owner = CustomUser.objects.create_user(username='owner', password='x')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tenant = Tenant.objects.create(
+                name='مستأجر', phone='0500000000', email='t@example.com', address='مسقط')
+            self.prop = Property.objects.create(
+                name='عقار', propert_type='apartment', description='-', address='مسقط', owner=self.owner)
+
+    def lease(self, start, end, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return LeasContract.objects.create(
+                tenant=self.tenant, property=self.prop, start_date=start, end_date=end,
+                monthly_rent=Decimal('2500.00'), **fields)
+
+
+class MaintenanceTests(SnapshotFixturesMixin, TestCase):
+    def test_follows_leases_and_tenants(self):
+        snapshot = PropertySnapshot.objects.get()
+        self.assertEqual((snapshot.name, snapshot.contract_id, snapshot.valid_until), ('عقار', None, None))
+
+        contract = self.lease(self.today - timedelta(days=30), self.today + timedelta(days=30))
+        snapshot.refresh_from_db()
+        self.assertEqual(
+            (snapshot.contract_id, snapshot.tenant_name, snapshot.monthly_rent, snapshot.lease_end),
+            (contract.pk, 'مستأجر', Decimal('2500.00'), contract.end_date))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.tenant.name = 'اسم جديد'
+            self.tenant.save()
+            other = Property.objects.create(
+                name='آخر', propert_type='shop', description='-', address='مسقط', owner=self.owner)
+            contract.property = other
+            contract.save()
+        self.assertEqual(PropertySnapshot.objects.get(pk=self.prop.pk).contract_id, None)
+        self.assertEqual(PropertySnapshot.objects.get(pk=other.pk).tenant_name, 'اسم جديد')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        self.assertEqual(list(PropertySnapshot.objects.values_list('pk', flat=True)), [self.prop.pk])
+
+    def test_future_lease_is_picked_up_when_due(self):
+        start = self.today + timedelta(days=10)
+        contract = self.lease(start, start + timedelta(days=100))
+        snapshot = PropertySnapshot.objects.get()
+        self.assertEqual((snapshot.contract_id, snapshot.valid_until), (None, start))
+        self.assertEqual(refresh_due(self.today), 0)
+        self.assertEqual(refresh_due(start), 1)
+        snapshot.refresh_from_db()
+        self.assertEqual((snapshot.contract_id, snapshot.valid_until), (contract.pk, contract.end_date + timedelta(days=1)))
+
+    def test_bulk_writes_refresh_once_per_transaction(self):
+        with mock.patch.object(maintenance, 'refresh', wraps=maintenance.refresh) as refresh, \
+                self.captureOnCommitCallbacks(execute=True):
+            props = Property.objects.bulk_create([
+                Property(name=f'عقار {i}', propert_type='office', description='-', address='-', owner=self.owner)
+                for i in range(3)])
+            bulk_saved.send(sender=Property, instances=props)
+            contracts = LeasContract.objects.bulk_create([
+                LeasContract(tenant=self.tenant, property=prop, start_date=self.today, end_date=self.today,
+                             monthly_rent=Decimal('100.00')) for prop in props])
+            bulk_saved.send(sender=LeasContract, instances=contracts)
+        refresh.assert_called_once()
+        self.assertEqual(PropertySnapshot.objects.filter(contract__isnull=False).count(), 3)
+
+    def test_rollback_discards_marks(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                Property.objects.create(
+                    name='مؤقت', propert_type='shop', description='-', address='-', owner=self.owner)
+                raise RuntimeError
+        self.assertEqual((callbacks, PropertySnapshot.objects.count()), ([], 1))
+
+    def test_one_registration_survives_inner_rollbacks(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for i in range(10):
+                Property.objects.create(
+                    name=f'عقار {i}', propert_type='shop', description='-', address='-', owner=self.owner)
+                with self.assertRaises(RuntimeError), transaction.atomic():
+                    Property.objects.create(
+                        name='مؤقت', propert_type='shop', description='-', address='-', owner=self.owner)
+                    raise RuntimeError
+        batches = [callback for callback in callbacks if isinstance(getattr(callback, 'batch', None), PendingRefresh)]
+        self.assertEqual((len(batches), PropertySnapshot.objects.count()), (1, 11))
+
+    def test_check_and_rebuild(self):
+        self.lease(self.today, self.today + timedelta(days=5))
+        PropertySnapshot.objects.update(tenant_name='خطأ')
+        with self.assertRaisesMessage(CommandError, '0 missing and 1 out-of-date'):
+            call_command('check_property_snapshots', stdout=StringIO())
+        out = StringIO()
+        call_command('check_property_snapshots', fix=True, stdout=out)
+        self.assertIn('Fixed 0 missing and 1 out-of-date', out.getvalue())
+        PropertySnapshot.objects.all().delete()
+        call_command('rebuild_property_snapshots', stdout=out)
+        self.assertIn('Built 1 snapshots', out.getvalue())
+        call_command('check_property_snapshots', stdout=out)
+        self.assertIn('All snapshots match', out.getvalue())
+
+
+class SnapshotApiTests(SnapshotFixturesMixin, APITestCase):
+    def test_list_reads_one_table(self):
+        contract = self.lease(date(2020, 1, 1), self.today + timedelta(days=20))
+        self.client.force_authenticate(self.owner)
+        with self.assertNumQueries(1):
+            rows = self.client.get(reverse('propertysnapshot-list'), {'occupied': 'true'}).json()['results']
+        self.assertEqual(
+            [(row['property'], row['contract'], row['tenant_name'], row['occupied']) for row in rows],
+            [(self.prop.pk, contract.pk, 'مستأجر', True)])
+        self.assertEqual(self.client.get(reverse('propertysnapshot-list'), {'occupied': 'false'}).json()['results'], [])
+        ending = self.client.get(reverse('propertysnapshot-list'), {'ends_before': str(date(2020, 6, 1))})
+        self.assertEqual(ending.json()['results'], [])
+
+        self.client.force_authenticate(CustomUser.objects.create_user(username='other', password='x'))
+        self.assertEqual(self.client.get(reverse('propertysnapshot-list')).json()['results'], [])
+
+    def test_due_rows_are_served_as_stale_until_refreshed(self):
+        end = self.today + timedelta(days=3)
+        contract = self.lease(self.today, end)
+        self.client.force_authenticate(self.owner)
+        url = reverse('propertysnapshot-list')
+        later = end + timedelta(days=1)
+        with mock.patch('django.utils.timezone.localdate', return_value=later):
+            with self.assertNumQueries(1):
+                rows = self.client.get(url, {'occupied': 'true'}).json()['results']
+            self.assertEqual([(row['contract'], row['stale']) for row in rows], [(contract.pk, True)])
+            self.assertEqual(PropertySnapshot.objects.get().contract_id, contract.pk)
+
+            self.assertEqual(refresh_due(), 1)
+            row = self.client.get(reverse('propertysnapshot-detail', args=[self.prop.pk])).json()
+            self.assertEqual((row['occupied'], row['tenant_name'], row['stale']), (False, '', False))
+            self.assertEqual(self.client.get(url, {'ends_before': str(later)}).json()['results'], [])
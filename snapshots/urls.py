@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+from .views import PropertySnapshotViewSet
+
+router = DefaultRouter()
+router.register(r'property-snapshots', PropertySnapshotViewSet)
+
+urlpatterns = router.urls
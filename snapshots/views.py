@@ -0,0 +1,32 @@
+from rest_framework import mixins, viewsets
+from real_estate_management.pagination import PropertyIdCursorPagination
+from real_estate_management.permissions import OwnerScopedMixin
+from .models import PropertySnapshot
+from .serializers import PropertySnapshotSerializer, SnapshotFilterSerializer
+
+
+class PropertySnapshotViewSet(OwnerScopedMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
+                              viewsets.GenericViewSet):
+    """Properties with their current tenant, rent and lease end, read from one table.
+
+    Filter with ``?type=``, ``?occupied=`` and ``?ends_before=``. Reads never
+    write: rows whose lease has started or ended since they were computed are
+    served as stored, with ``stale`` set, until the ``snapshots.refresh_due``
+    job (or ``rebuild_property_snapshots --due``) moves them on.
+    """
+
+    queryset = PropertySnapshot.objects.all()
+    serializer_class = PropertySnapshotSerializer
+    pagination_class = PropertyIdCursorPagination
+
+    def filter_queryset(self, queryset):
+        params = SnapshotFilterSerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        query = params.validated_data
+        if 'type' in query:
+            queryset = queryset.filter(propert_type=query['type'])
+        if query['occupied'] is not None:
+            queryset = queryset.filter(contract__isnull=not query['occupied'])
+        if 'ends_before' in query:
+            queryset = queryset.filter(lease_end__lt=query['ends_before'])
+        return queryset
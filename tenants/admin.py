@@ -1,7 +1,9 @@
 from django.contrib import admin
+from search.admin import IndexedSearchAdminMixin
 from .models import Tenant
 
 @admin.register(Tenant)
-class TenantAdmin(admin.ModelAdmin):
+class TenantAdmin(IndexedSearchAdminMixin, admin.ModelAdmin):
+    search_kind = 'tenant'
     list_display = ('name', 'phone', 'email')
     search_fields = ('name', 'email')
\ No newline at end of file
@@ -1,14 +1,53 @@
+from django.conf import settings
 from django.db import models
+from users.scopes import sees_everything
+
+class TenantQuerySet(models.QuerySet):
+  def visible_to(self, user):
+    """Owners see the tenants holding a lease on one of their properties."""
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(leascontract__property__owner_id=user.id).distinct()
+
+  def assignable_by(self, user):
+    """Tenants an owner may put on a lease: the ones they see and the ones they created."""
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    return self.filter(models.Q(leascontract__property__owner_id=user.id) | models.Q(created_by_id=user.id)).distinct()
+
+  def editable_by(self, user):
+    """Owners may only change tenants whose leases are all on their own properties.
+
+    Deleting a tenant deletes their leases, so a tenant shared with another
+    owner is left to staff.
+    """
+    if sees_everything(user):
+      return self
+    if not user.is_authenticated:
+      return self.none()
+    leases = self.model._meta.get_field('leascontract').related_model.objects.filter(tenant=models.OuterRef('pk'))
+    return self.filter(models.Exists(leases.filter(property__owner_id=user.id))).exclude(
+      models.Exists(leases.exclude(property__owner_id=user.id)))
 
 class Tenant(models.Model):
   name = models.CharField(max_length=200, verbose_name="الاسم")
   phone = models.CharField(max_length=15, verbose_name="رقم الهاتف")
   email = models.EmailField(unique=True, verbose_name="البريد الإلكتروني")
   address = models.TextField(verbose_name="العنوان")
+  created_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL, related_name='+', verbose_name="أنشأه")
+
+  objects = TenantQuerySet.as_manager()
 
   def __str__(self):
     return self.name
 
   class Meta:
     verbose_name = "مستأجر"
-    verbose_name_plural = "المستأجرون"
\ No newline at end of file
+    verbose_name_plural = "المستأجرون"
+    indexes = [
+      models.Index(fields=['name'], name='tenant_name'),
+    ]
\ No newline at end of file
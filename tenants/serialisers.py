@@ -4,4 +4,11 @@ from .models import Tenant
 class TenantSerializer(serializers.ModelSerializer):
     class Meta:
         model = Tenant
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+        read_only_fields = ['created_by']
+
+
+class TenantBulkSerializer(TenantSerializer):
+    class Meta(TenantSerializer.Meta):
+        # Email uniqueness is checked once for the whole batch by the viewset.
+        extra_kwargs = {'email': {'validators': []}}
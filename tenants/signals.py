@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from real_estate_management.http_cache import touch
+from real_estate_management.signals import bulk_saved
+from .models import Tenant
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def tenant_changed(sender, instance, **kwargs):
+    touch('tenant', instance.pk)
+
+
+@receiver(bulk_saved, sender=Tenant)
+def tenants_bulk_saved(sender, instances, **kwargs):
+    touch('tenant', *(obj.pk for obj in instances))
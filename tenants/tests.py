@@ -1,3 +1,120 @@
-from django.test import TestCase
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
 
-# Create your tests here.
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from contracts.models import LeasContract
+from properties.models import Property
+from real_estate_management.caches import cache_config
+from real_estate_management.signals import bulk_saved
+from users.models import CustomUser
+from .models import Tenant
+
+# Query counts below are about the tables; keep the cache out of them.
+LOCAL_CACHES = cache_config(Path('.'), {'CACHE_URL': 'locmem://'})
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class TenantOwnerScopeTests(APITestCase):
+    def setUp(self):
+        self.owner = CustomUser.objects.create_user(username='owner', password='x')
+        other = CustomUser.objects.create_user(username='other', password='x')
+        self.mine = Tenant.objects.create(name='لي', phone='1', email='mine@example.com', address='-')
+        self.theirs = Tenant.objects.create(name='لهم', phone='1', email='theirs@example.com', address='-')
+        for year, prop_owner, tenant in [(2023, self.owner, self.mine), (2024, self.owner, self.mine),
+                                         (2024, other, self.theirs)]:
+            prop = Property.objects.create(
+                name=f'{prop_owner.username} {year}', propert_type='shop', description='-', address='-',
+                owner=prop_owner)
+            LeasContract.objects.create(
+                tenant=tenant, property=prop, start_date=date(year, 1, 1), end_date=date(year, 12, 31),
+                monthly_rent=Decimal('100.00'))
+
+    def test_owner_sees_tenants_through_their_contracts_once(self):
+        self.client.force_authenticate(self.owner)
+        with self.assertNumQueries(1):
+            rows = self.client.get(reverse('tenant-list')).json()['results']
+        self.assertEqual([row['email'] for row in rows], ['mine@example.com'])
+        response = self.client.get(reverse('tenant-detail', args=[self.theirs.pk]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_owners_cannot_change_tenants_shared_with_other_owners(self):
+        prop = Property.objects.filter(owner=self.owner).first()
+        LeasContract.objects.create(
+            tenant=self.theirs, property=prop, start_date=date(2025, 1, 1), end_date=date(2025, 12, 31),
+            monthly_rent=Decimal('100.00'))
+        self.client.force_authenticate(self.owner)
+        self.assertEqual(self.client.get(reverse('tenant-detail', args=[self.theirs.pk])).status_code, 200)
+        url = reverse('tenant-detail', args=[self.theirs.pk])
+        self.assertEqual(self.client.patch(url, {'name': 'x'}, format='json').status_code, 404)
+        self.assertEqual(self.client.delete(url).status_code, 404)
+        response = self.client.delete(reverse('tenant-bulk'), [self.theirs.pk, self.mine.pk], format='json')
+        self.assertEqual(
+            [row['status'] for row in response.json()['results']], ['invalid', 'deleted'])
+        self.assertTrue(Tenant.objects.filter(pk=self.theirs.pk).exists())
+        self.assertEqual(LeasContract.objects.filter(tenant=self.theirs).count(), 2)
+
+    def test_new_lease_invalidates_owner_tenant_list(self):
+        self.client.force_authenticate(self.owner)
+        etag = self.client.get(reverse('tenant-list'))['ETag']
+        self.assertEqual(self.client.get(reverse('tenant-list'), HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        prop = Property.objects.filter(owner=self.owner).first()
+        LeasContract.objects.create(
+            tenant=self.theirs, property=prop, start_date=date(2025, 1, 1), end_date=date(2025, 12, 31),
+            monthly_rent=Decimal('100.00'))
+        response = self.client.get(reverse('tenant-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['results']), 2)
+
+
+@override_settings(CACHES=LOCAL_CACHES)
+class TenantBulkTests(APITestCase):
+    url = reverse('tenant-bulk')
+
+    def setUp(self):
+        self.staff = staff = CustomUser.objects.create_user(username='staff', password='x', is_staff=True)
+        self.client.force_authenticate(staff)
+        self.existing = Tenant.objects.create(name='قائم', phone='1', email='taken@example.com', address='-')
+
+    def item(self, email, **extra):
+        return {'name': 'جديد', 'phone': '1', 'email': email, 'address': '-', **extra}
+
+    def test_create_checks_emails_across_the_batch(self):
+        items = [self.item('a@example.com'), self.item('a@example.com'), self.item('taken@example.com'),
+                 self.item('not-an-email')]
+        results = self.client.post(self.url, items, format='json').json()['results']
+        self.assertEqual([result['status'] for result in results], ['created', 'invalid', 'invalid', 'invalid'])
+        self.assertEqual(Tenant.objects.get(email='a@example.com').created_by, self.staff)
+
+    def test_receiver_failure_rolls_back_the_batch(self):
+        def fail(**kwargs):
+            raise RuntimeError
+
+        bulk_saved.connect(fail, sender=Tenant)
+        self.addCleanup(bulk_saved.disconnect, fail, sender=Tenant)
+        with self.assertRaises(RuntimeError):
+            self.client.post(self.url, [self.item('a@example.com')], format='json')
+        self.assertFalse(Tenant.objects.filter(email='a@example.com').exists())
+
+    def test_update_may_keep_own_email(self):
+        other = Tenant.objects.create(name='آخر', phone='1', email='other@example.com', address='-')
+        items = [{'id': self.existing.pk, 'email': 'taken@example.com', 'phone': '2'},
+                 {'id': other.pk, 'email': 'taken@example.com'}]
+        results = self.client.patch(self.url, items, format='json').json()['results']
+        self.assertEqual([result['status'] for result in results], ['updated', 'invalid'])
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.phone, '2')
+
+    def test_query_count_does_not_grow_with_batch(self):
+        counts = []
+        for size in (2, 8):
+            items = [self.item(f'{size}-{i}@example.com') for i in range(size)]
+            with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as ctx:
+                self.client.post(self.url, items, format='json')
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
@@ -1,7 +1,11 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
-from .views import TenantViewSet
+from .views import TenantAsyncReadView, TenantViewSet
 
 router = DefaultRouter()
 router.register(r'tenants', TenantViewSet)
 
-urlpattens = router.urls
\ No newline at end of file
+urlpatterns = router.urls + [
+    path('async/tenants/', TenantAsyncReadView.as_view(), name='tenant-async-list'),
+    path('async/tenants/<int:pk>/', TenantAsyncReadView.as_view(), name='tenant-async-detail'),
+]
\ No newline at end of file
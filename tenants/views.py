@@ -1,8 +1,48 @@
 from django.shortcuts import render
+from real_estate_management.async_views import AsyncReadView
+from real_estate_management.bulk_writes import BulkWriteMixin
+from real_estate_management.http_cache import ConditionalGetMixin
+from real_estate_management.lean import LeanListMixin
+from real_estate_management.permissions import OwnerScopedMixin
+from real_estate_management.streaming import StreamingListMixin
 from .models import Tenant
-from .serialisers import TenantSerialiser
-from rest_framework import viewsets
+from .serialisers import TenantBulkSerializer, TenantSerializer
+from rest_framework import permissions, viewsets
 
-class TenantViewSet(viewsets.ModelViewSet):
+class TenantViewSet(BulkWriteMixin, ConditionalGetMixin, OwnerScopedMixin, StreamingListMixin, LeanListMixin, viewsets.ModelViewSet):
     queryset = Tenant.objects.all()
-    serializer_class = TenantSerialiser
\ No newline at end of file
+    serializer_class = TenantSerializer
+    stamp_name = 'tenant'
+    # Owners see tenants through leases on their properties.
+    stamp_depends_on = ('contract', 'property')
+    bulk_serializer_class = TenantBulkSerializer
+
+    def get_queryset(self):
+        if self.request.method in permissions.SAFE_METHODS:
+            return super().get_queryset()
+        # Writes (including bulk PATCH/DELETE) only reach tenants the user may change.
+        return Tenant.objects.editable_by(self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(created_by_id=self.request.user.id)
+
+    def bulk_create_defaults(self):
+        return {'created_by_id': self.request.user.id}
+
+    def check_bulk_items(self, items):
+        emails = {attrs['email'] for _, attrs, _ in items if 'email' in attrs}
+        taken = dict(Tenant.objects.filter(email__in=emails).values_list('email', 'pk'))
+        errors, seen = {}, set()
+        for index, attrs, obj in items:
+            email = attrs.get('email')
+            if email is None:
+                continue
+            if email in seen or taken.get(email, getattr(obj, 'pk', None)) != getattr(obj, 'pk', None):
+                errors[index] = {'email': ["مستأجر بهذا البريد الإلكتروني موجود بالفعل"]}
+            seen.add(email)
+        return errors
+
+
+class TenantAsyncReadView(AsyncReadView):
+    queryset = Tenant.objects.all()
+    serializer_class = TenantSerializer
\ No newline at end of file
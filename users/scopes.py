@@ -0,0 +1,11 @@
+SCOPE_ALL = 'all'
+SCOPE_OWNER = 'owner'
+
+
+def scope_for(user):
+    """Staff see the whole portfolio; everyone else only what they own."""
+    return SCOPE_ALL if user.is_staff or user.is_superuser else SCOPE_OWNER
+
+
+def sees_everything(user):
+    return user.is_authenticated and scope_for(user) == SCOPE_ALL
@@ -1,8 +1,31 @@
+from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from .models import CustomUser
+from .scopes import scope_for
 
 class CustomUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomUser
         fields = ['id', 'username', 'email', 'phone', 'password']
-        extra_kwargs = {'password': {'write_only': True}}
\ No newline at end of file
+        extra_kwargs = {'password': {'write_only': True}}
+
+    def validate_password(self, value):
+        validate_password(value)
+        return value
+
+    def create(self, validated_data):
+        # create_user hashes the password; saving the raw value would store it in clear text.
+        return CustomUser.objects.create_user(**validated_data)
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Embed the claims the API authorizes with, so requests need no user lookup."""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username'] = user.username
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        token['scope'] = scope_for(user)
+        return token
\ No newline at end of file
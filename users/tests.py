@@ -1,3 +1,44 @@
-from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from .models import CustomUser
+
+
+class JWTClaimsTests(APITestCase):
+    def setUp(self):
+        self.staff = CustomUser.objects.create_user(username='staff', password='pass-1234', is_staff=True)
+        self.owner = CustomUser.objects.create_user(username='owner', password='pass-1234')
+
+    def access_token(self, username):
+        response = self.client.post(
+            reverse('token_obtain_pair'), {'username': username, 'password': 'pass-1234'}, format='json')
+        return response.json()['access']
+
+    def test_access_token_carries_authorization_claims(self):
+        token = AccessToken(self.access_token('staff'))
+        self.assertEqual(
+            (token['user_id'], token['username'], token['is_staff'], token['scope']),
+            (self.staff.pk, 'staff', True, 'all'))
+        self.assertEqual(AccessToken(self.access_token('owner'))['scope'], 'owner')
+
+    def test_requests_authorize_without_user_lookup(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token('staff')}")
+        with self.assertNumQueries(0):
+            # The export body streams lazily, so auth and permissions are the only possible queries.
+            response = self.client.get(reverse('bulk_export', args=['tenants']))
+        self.assertEqual(response.status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token('owner')}")
+        self.assertEqual(self.client.get(reverse('bulk_export', args=['tenants'])).status_code, 403)
+
+
+class RegistrationTests(APITestCase):
+    def test_password_is_hashed(self):
+        response = self.client.post(reverse('user_register'), {
+            'username': 'new', 'email': 'new@example.com', 'password': 'a-long-passphrase-42'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        user = CustomUser.objects.get(username='new')
+        self.assertNotEqual(user.password, 'a-long-passphrase-42')
+        self.assertTrue(user.check_password('a-long-passphrase-42'))
+        response = self.client.post(reverse('user_register'), {'username': 'weak', 'password': '123'}, format='json')
+        self.assertIn('password', response.json())
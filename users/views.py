@@ -1,7 +1,8 @@
-from rest_framework import generics
+from rest_framework import generics, permissions
 from .models import CustomUser
 from .serializers import CustomUserSerializer
 
 class UserCreateView(generics.CreateAPIView):
     queryset = CustomUser.objects.all()
-    serializer_class = CustomUserSerializer
\ No newline at end of file
+    serializer_class = CustomUserSerializer
+    permission_classes = [permissions.AllowAny]
\ No newline at end of file